@@ -0,0 +1,102 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from LightPreset import PresetError, read_preset
+
+AUDIT_FORMAT = "unreal-light-manager-audit"
+AUDIT_VERSION = 1
+LOCAL_LIGHT_TYPES = {"PointLight", "SpotLight", "RectLight"}  # LIGHTS WITH INTENSITY UNITS AND A RADIUS
+
+
+def missing_channel_0(record: dict) -> bool:
+    """ Flags a light that does not light channel 0. """
+    channels = record.get("channels")
+    return channels is not None and not channels[0]
+
+
+def non_lumen_units(record: dict) -> bool:
+    """ Flags a local light whose intensity units are not lumens. """
+    units = record.get("intensity_units")
+    return record.get("type") in LOCAL_LIGHT_TYPES and units is not None and units.upper() != "LUMENS"
+
+
+def zero_radius_point_light(record: dict) -> bool:
+    """ Flags a point light whose attenuation radius is zero. """
+    return record.get("type") == "PointLight" and record.get("attenuation_radius", 1.0) <= 0.0
+
+
+# RULE NAME -> (DESCRIPTION, CHECK): A CHECK TAKES A LIGHT RECORD (SEE LightPreset) AND RETURNS True ON A FINDING
+AUDIT_RULES = {
+    "missing_channel_0": ("Lights off lighting channel 0, which most meshes use.", missing_channel_0),
+    "non_lumen_units": ("Point, spot and rect lights whose intensity is not in lumens.", non_lumen_units),
+    "zero_radius_point_lights": ("Point lights with a zero attenuation radius, lighting nothing.",
+                                 zero_radius_point_light),
+}
+
+
+def audit_records(records: iter, rule_names: list) -> tuple:
+    """
+    Runs audit rules over light records.
+    Args:
+        records (iter): The light records, e.g. read from a level dump.
+        rule_names (list): Keys of AUDIT_RULES.
+    Returns:
+        tuple: (number of lights, rule name -> labels of the lights it flagged).
+    """
+    checks = [(name, AUDIT_RULES[name][1]) for name in rule_names]
+    findings = {name: [] for name in rule_names}
+    light_count = 0
+    for record in records:
+        light_count += 1
+        for name, check in checks:
+            if check(record):
+                findings[name].append(record.get("label", ""))
+    return light_count, findings
+
+
+def audit_file(file_path: str, rule_names: list) -> dict:
+    """
+    Audits one level dump. Runs in a worker process, so it only takes and returns plain data.
+    Returns:
+        dict: The level entry of the report, with an "error" instead of findings when the dump cannot be read.
+    """
+    try:
+        light_count, findings = audit_records(read_preset(file_path), rule_names)
+    except (OSError, PresetError) as error:
+        return {"file": file_path, "error": str(error)}
+    return {"file": file_path, "lights": light_count, "findings": findings}
+
+
+def audit_files(file_paths: list, rule_names: list, jobs: int = None) -> dict:
+    """
+    Audits level dumps in parallel, one dump per task of a process pool.
+    Args:
+        file_paths (list): The level dumps, preset files written by LightCore.dump_level or "Save Rig...".
+        rule_names (list): Keys of AUDIT_RULES.
+        jobs (int, optional): The number of worker processes, one per CPU by default. 1 audits in this process.
+    Returns:
+        dict: The audit report, ready to be written as JSON.
+    """
+    start = time.perf_counter()
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(file_paths) == 1:
+        levels = [audit_file(file_path, rule_names) for file_path in file_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(file_paths))) as executor:
+            levels = list(executor.map(audit_file, file_paths, [rule_names] * len(file_paths)))
+
+    summary = {name: sum(len(level.get("findings", {}).get(name, ())) for level in levels) for name in rule_names}
+    return {
+        "format": AUDIT_FORMAT,
+        "version": AUDIT_VERSION,
+        "rules": {name: AUDIT_RULES[name][0] for name in rule_names},
+        "levels": levels,
+        "summary": {
+            "levels": len(levels),
+            "unreadable": sum("error" in level for level in levels),
+            "lights": sum(level.get("lights", 0) for level in levels),
+            "findings": summary,
+            "elapsed": round(time.perf_counter() - start, 3),
+        },
+    }
@@ -0,0 +1,97 @@
+LOCAL_LIGHTS = ("PointLight", "SpotLight", "RectLight")
+
+
+def enum_name(value: object) -> str:
+    """ Returns the name of an Unreal enum value, e.g. "MOVABLE" for ComponentMobility.MOVABLE. """
+    return getattr(value, "name", str(value))
+
+
+def texture_name(light_component: object) -> str:
+    """ Returns the name of the IES profile of a light, "" when it has none. """
+    texture = light_component.get_editor_property("ies_texture")
+    return texture.get_name() if texture else ""
+
+
+class AttributeColumn:
+    """
+    Describes one column of the light table: how its values are stored, shown, edited and read from Unreal.
+
+    The table shows the registered columns in order. A `lazy` column is not read by a refresh while it is hidden:
+    its values are fetched for every light when it is shown, then cached in the snapshot until the light is seen
+    to change. Hidden columns then cost nothing to the refresh, however many are registered.
+    """
+
+    __slots__ = ("key", "header", "width", "kind", "editor", "light_types", "lazy", "visible", "getter", "setter",
+                 "bit")
+
+    def __init__(self, key: str, header: str, width: int, kind: str, editor: str = None, light_types: tuple = None,
+                 lazy: bool = False, visible: bool = True, getter: callable = None, setter: callable = None):
+        """
+        Args:
+            key (str): The snapshot column, also the editor property read and written by default.
+            header (str): The header label.
+            width (int): The default width of the column, in pixels.
+            kind (str): How the value is shown: "text", "bool", "float", "count" (a whole number), "color" or "type".
+            editor (str, optional): "check", "mute", "solo", "numeric" or "color", None when read-only.
+            light_types (tuple, optional): The light types having the attribute, None for every type.
+                The other lights are N/A without asking Unreal.
+            lazy (bool, optional): Only read while the column is shown, see the class docstring.
+            visible (bool, optional): Shown by default, every column but the name can be toggled.
+            getter (callable, optional): light component -> value, instead of reading the editor property `key`.
+            setter (callable, optional): (light component, value), instead of writing the editor property `key`.
+        """
+        self.key = key
+        self.header = header
+        self.width = width
+        self.kind = kind
+        self.editor = editor
+        self.light_types = light_types
+        self.lazy = lazy
+        self.visible = visible
+        self.getter = getter
+        self.setter = setter
+        self.bit = 0  # FLAG OF A LAZY COLUMN IN THE "fetched" SNAPSHOT COLUMN
+
+    def applies_to(self, light_type: str) -> bool:
+        """ Returns True when lights of this type have the attribute. """
+        return self.light_types is None or light_type in self.light_types
+
+
+# THE COLUMNS OF THE LIGHT TABLE, IN ORDER. A NEW ATTRIBUTE ONLY NEEDS A LINE HERE:
+# ITS STORAGE, CELLS, EDITOR AND ENGINE READS ARE DERIVED FROM IT.
+ATTRIBUTE_COLUMNS = [
+    AttributeColumn("label", "Name", 150, "text"),
+    AttributeColumn("visible", "V", 20, "bool", "mute"),
+    AttributeColumn("solo", "S", 20, "bool", "solo"),
+    AttributeColumn("type", "Type", 40, "type"),
+    AttributeColumn("color", "Color", 55, "color", "color"),
+    AttributeColumn("intensity", "Intensity", 65, "float", "numeric"),
+    AttributeColumn("use_temperature", "Use Temp.", 70, "bool", "check"),
+    AttributeColumn("temperature", "Temperature", 75, "float", "numeric"),
+    AttributeColumn("attenuation_radius", "Att.Radius", 70, "float", "numeric"),
+    AttributeColumn("overlaps", "Overlaps", 60, "count"),
+    AttributeColumn("channel0", "Chl.0", 35, "bool", "check"),
+    AttributeColumn("channel1", "Chl.1", 35, "bool", "check"),
+    AttributeColumn("channel2", "Chl.2", 35, "bool", "check"),
+    # HIDDEN UNTIL PICKED FROM THE HEADER MENU
+    AttributeColumn("cast_shadows", "Shadows", 60, "bool", "check", lazy=True, visible=False),
+    AttributeColumn("mobility", "Mobility", 75, "text", lazy=True, visible=False,
+                    getter=lambda light_component: enum_name(light_component.get_editor_property("mobility"))),
+    AttributeColumn("source_radius", "Src.Radius", 70, "float", "numeric", ("PointLight", "SpotLight"),
+                    lazy=True, visible=False),
+    AttributeColumn("source_length", "Src.Length", 70, "float", "numeric", ("PointLight", "SpotLight"),
+                    lazy=True, visible=False),
+    AttributeColumn("source_width", "Src.Width", 70, "float", "numeric", ("RectLight",), lazy=True, visible=False),
+    AttributeColumn("source_height", "Src.Height", 70, "float", "numeric", ("RectLight",), lazy=True, visible=False),
+    AttributeColumn("inner_cone_angle", "Inner Cone", 70, "float", "numeric", ("SpotLight",), lazy=True, visible=False),
+    AttributeColumn("outer_cone_angle", "Outer Cone", 70, "float", "numeric", ("SpotLight",), lazy=True, visible=False),
+    AttributeColumn("indirect_lighting_intensity", "Indirect", 65, "float", "numeric", lazy=True, visible=False),
+    AttributeColumn("volumetric_scattering_intensity", "Vol.Scatter", 70, "float", "numeric", lazy=True, visible=False),
+    AttributeColumn("specular_scale", "Specular", 65, "float", "numeric", lazy=True, visible=False),
+    AttributeColumn("ies_texture", "IES", 90, "text", light_types=LOCAL_LIGHTS, lazy=True, visible=False,
+                    getter=texture_name),
+]
+COLUMNS = {column.key: column for column in ATTRIBUTE_COLUMNS}  # KEY -> COLUMN
+LAZY_COLUMNS = [column for column in ATTRIBUTE_COLUMNS if column.lazy]
+for bit_index, lazy_column in enumerate(LAZY_COLUMNS):
+    lazy_column.bit = 1 << bit_index
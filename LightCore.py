@@ -0,0 +1,635 @@
+import os
+import time
+
+import unreal
+
+from LightColumns import COLUMNS
+from LightExport import export_rows, write_export
+from LightIndex import LightIndex
+from LightOverlap import analyse_overlaps
+from LightPreset import ENUM_PROPERTIES, RECORD_PROPERTIES, light_record, read_preset, write_preset
+from LightQuery import LightQuery, NameIndex
+from LightSnapshot import CHANNEL_COLUMNS, LOCATION_COLUMNS, LightSnapshot, level_of, read_column, read_property
+from LightSpatial import SpatialHash
+
+# EDITOR DELEGATES THAT SIGNAL A CHANGE OF THE LIGHT SET: (SUBSYSTEM CLASS, DELEGATE, EVENT KIND).
+# THEY ARE LOOKED UP BY NAME, A DELEGATE MISSING FROM THE RUNNING ENGINE VERSION IS SKIPPED.
+# "actors": ACTORS WERE ADDED OR REMOVED, "level": ANOTHER LEVEL IS LOADED, EVERY LIGHT HAS TO BE RE-READ
+EDITOR_EVENTS = (
+    ("EditorActorSubsystem", "on_new_actors_dropped", "actors"),
+    ("EditorActorSubsystem", "on_duplicate_actors_end", "actors"),
+    ("EditorActorSubsystem", "on_edit_paste_actors_end", "actors"),
+    ("EditorActorSubsystem", "on_edit_cut_actors_end", "actors"),
+    ("EditorActorSubsystem", "on_delete_actors_end", "actors"),
+    ("LevelEditorSubsystem", "on_map_changed", "level"),
+    ("LevelEditorSubsystem", "on_map_opened", "level"),
+)
+
+
+class LightError(ValueError):
+    """ Raised when a light operation cannot be done, e.g. creating a light of an unknown type. """
+
+
+class LightCore:
+    """
+    The Qt-free core of the Light Manager: lists, reads, queries, analyses, creates, renames, deletes and edits
+    the lights of the current level. It only talks to the `unreal` module and never to a widget,
+    so it runs headless (from the editor Python console, or with a stand-in for `unreal`).
+    UnrealLightLogic is the Qt adapter that maps the table and its signals onto this core.
+
+    Lights are addressed by their row in the last snapshot passed to `index_rows`.
+    """
+
+    def __init__(self):
+        self.editor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        self.ell = unreal.EditorLevelLibrary
+        self.light_index = LightIndex()  # LABEL -> ACTOR AND ACTOR -> ROW LOOKUPS
+        self.subscriptions = []  # (DELEGATE, CALLABLE) ADDED BY `subscribe`
+        self.actor_levels = {}  # ACTOR -> LEVEL NAME, AN ACTOR NEVER CHANGES LEVEL
+        self.spatial_hash = SpatialHash()  # LIGHT POSITIONS BY ACTOR PATH, SYNCED BY `sync_spatial_hash`
+        self.lazy_columns = []  # LAZY LightColumns.AttributeColumn READ WITH EVERY LIGHT, THE ONES SHOWN BY THE TABLE
+        self.light_types = {
+            "SkyLight": [unreal.SkyLight, unreal.SkyLightComponent],
+            "RectLight": [unreal.RectLight, unreal.RectLightComponent],
+            "SpotLight": [unreal.SpotLight, unreal.SpotLightComponent],
+            "PointLight": [unreal.PointLight, unreal.PointLightComponent],
+            "DirectionalLight": [unreal.DirectionalLight, unreal.DirectionalLightComponent],
+        }
+
+    # READING --------------------------------------------
+    def light_actors(self, level: str = None) -> list:
+        """
+        Returns every light actor of the loaded levels.
+        Args:
+            level (str, optional): Only returns the lights of this level, see `levels`.
+        """
+        light_actor_class_types = tuple(item[0] for item in self.light_types.values())
+        light_actors = [actor for actor in self.editor_subsystem.get_all_level_actors()
+                        if isinstance(actor, light_actor_class_types)]
+        if level is None:
+            return light_actors
+        actor_levels = self.actor_levels
+        if len(actor_levels) > 2 * len(light_actors):  # FORGETS THE ACTORS DELETED OR UNLOADED SINCE
+            self.actor_levels = actor_levels = {actor: actor_levels[actor] for actor in light_actors
+                                                if actor in actor_levels}
+        for actor in light_actors:
+            if actor not in actor_levels:  # ONE ENGINE CALL PER LIGHT, THE FIRST TIME IT IS SEEN
+                actor_levels[actor] = level_of(actor.get_path_name())
+        return [actor for actor in light_actors if actor_levels[actor] == level]
+
+    def unindexed_labels(self) -> set:
+        """
+        Returns the labels of the level actors missing from the light index: meshes, cameras and the other
+        non-light actors, and the lights not listed yet. A new label must not collide with them either,
+        the indexed lights are checked by the index itself. One engine call per unindexed actor.
+        """
+        indexed = self.light_index.actors()
+        return {actor.get_actor_label() for actor in self.editor_subsystem.get_all_level_actors()
+                if actor not in indexed}
+
+    def read_lights(self, light_actors: list = None) -> LightSnapshot:
+        """
+        Reads every tracked attribute of the given light actors, or of every light of the level, in one pass.
+        Lights without a light component are skipped.
+        """
+        snapshot = LightSnapshot()
+        snapshot.read(self.light_actors() if light_actors is None else light_actors, self.light_types,
+                      lazy_columns=self.lazy_columns)
+        return snapshot
+
+    def fetch_column(self, snapshot: LightSnapshot, key: str, rows: list = None) -> int:
+        """
+        Reads a lazy column (see LightColumns) into a snapshot, for the lights it was not fetched for yet.
+        Lights of a type without the attribute are flagged as N/A without an engine call.
+        Args:
+            snapshot (LightSnapshot): The lights, updated in place.
+            key (str): The lazy column.
+            rows (list, optional): The rows to read, every row by default. Cached rows are skipped either way.
+        Returns:
+            int: The number of lights read from Unreal.
+        """
+        column = COLUMNS[key]
+        fetched = snapshot.columns["fetched"]
+        types = snapshot.columns["type"]
+        read = 0
+        for row in range(len(snapshot)) if rows is None else rows:
+            if fetched[row] & column.bit:
+                continue
+            value = None
+            if column.applies_to(types[row]):
+                value = read_column(snapshot.get(row, "component"), column)
+                read += 1
+            snapshot.set(row, key, value)  # ALSO FLAGS THE ROW AS FETCHED
+        return read
+
+    def levels(self) -> dict:
+        """
+        Returns the persistent level and the streaming sublevels of the editor world.
+        Returns:
+            dict: Level name -> True when it is loaded. Empty when the world cannot be listed.
+        """
+        try:
+            world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+            levels = {level_of(world.get_path_name()): True}
+            for streaming_level in world.get_editor_property("streaming_levels"):
+                levels[level_of(streaming_level.get_world_asset_package_name())] = streaming_level.is_level_loaded()
+        except Exception:  # NO EDITOR WORLD, E.G. A COMMANDLET
+            return {}
+        return levels
+
+    def load_level(self, level: str):
+        """
+        Loads and shows an unloaded streaming sublevel, its lights are then listed by `light_actors`.
+        Raises:
+            LightError: The level is not a streaming sublevel of the editor world, or it did not load.
+        """
+        world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+        for streaming_level in world.get_editor_property("streaming_levels"):
+            if level_of(streaming_level.get_world_asset_package_name()) == level:
+                break
+        else:
+            raise LightError(f"'{level}' is not a streaming level of the world.")
+        streaming_level.set_should_be_loaded(True)
+        streaming_level.set_should_be_visible(True)
+        unreal.GameplayStatics.flush_level_streaming(world)
+        if not streaming_level.is_level_loaded():
+            raise LightError(f"Level '{level}' could not be loaded, load it from the Levels window.")
+
+    def index_rows(self, snapshot: LightSnapshot):
+        """ Re-indexes the lights by row, after the rows of `snapshot` were added, removed or re-ordered. """
+        self.light_index.clear()
+        for row, (actor, label, path) in enumerate(zip(snapshot.columns["actor"], snapshot.labels, snapshot.paths)):
+            self.light_index.add(actor, label, row, path)
+
+    def refresh(self) -> LightSnapshot:
+        """ Reads and indexes every light of the level, the headless counterpart of the table refresh. """
+        snapshot = self.read_lights()
+        self.index_rows(snapshot)
+        return snapshot
+
+    def query(self, snapshot: LightSnapshot, query_text: str, name_index: NameIndex = None,
+              group_rows: callable = None) -> set:
+        """
+        Returns the rows of `snapshot` matching a search query, see LightQuery for the syntax.
+        Args:
+            snapshot (LightSnapshot): The lights to search.
+            query_text (str): The search query, e.g. "key type:SpotLight intensity>500".
+            name_index (NameIndex, optional): The name index of `snapshot` when already built.
+            group_rows (callable, optional): Group name -> rows, for the "group:" field.
+        Raises:
+            QueryError: The query cannot be parsed.
+        """
+        query = LightQuery(query_text)
+        if name_index is None:
+            name_index = NameIndex(snapshot.labels)
+        return query.filter(snapshot, name_index, group_rows or (lambda group_name: []))
+
+    @staticmethod
+    def fingerprint(light_actors: list) -> int:
+        """ Returns a cheap fingerprint of a set of light actors, it changes when a light is added or removed. """
+        return hash(frozenset(light_actors))
+
+    # EDITOR EVENTS --------------------------------------------
+    def subscribe(self, callback: callable) -> int:
+        """
+        Calls `callback(kind)` on the editor events of EDITOR_EVENTS, until `unsubscribe`.
+        The callback may run in the middle of an editor operation: it should only take note of the event.
+        Returns:
+            int: The number of delegates subscribed to, 0 when the engine exposes none of them.
+        """
+        self.unsubscribe()
+        for subsystem_name, delegate_name, kind in EDITOR_EVENTS:
+            subsystem_class = getattr(unreal, subsystem_name, None)
+            if subsystem_class is None:
+                continue
+            delegate = getattr(unreal.get_editor_subsystem(subsystem_class), delegate_name, None)
+            if delegate is None or not hasattr(delegate, "add_callable"):
+                continue
+            function = lambda *args, kind=kind: callback(kind)  # THE DELEGATE ARGUMENTS DIFFER, ONLY THE KIND MATTERS
+            delegate.add_callable(function)
+            self.subscriptions.append((delegate, function))
+        return len(self.subscriptions)
+
+    def unsubscribe(self):
+        """ Removes the callbacks added by `subscribe`. """
+        for delegate, function in self.subscriptions:
+            try:
+                delegate.remove_callable(function)
+            except Exception:  # THE SUBSYSTEM WAS TORN DOWN WITH ITS DELEGATES
+                pass
+        self.subscriptions = []
+
+    def selected_actors(self) -> list:
+        """ Returns the actors selected in the editor. """
+        return self.editor_subsystem.get_selected_level_actors()
+
+    def select_actors(self, actors: list):
+        """ Selects the given actors in the editor, an empty list clears the selection. """
+        self.editor_subsystem.set_selected_level_actors(actors)
+
+    @staticmethod
+    def actor_location(actor: unreal.Actor) -> tuple:
+        """ Returns the location of an actor as an (x, y, z) tuple. """
+        location = actor.get_actor_location()
+        return location.x, location.y, location.z
+
+    def viewport_camera(self) -> tuple:
+        """ Returns the location of the active level viewport camera as an (x, y, z) tuple, None without a viewport. """
+        try:
+            if hasattr(unreal, "UnrealEditorSubsystem"):  # UE5
+                location, _rotation = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_level_viewport_camera_info()
+            else:
+                location, _rotation = self.ell.get_level_viewport_camera_info()
+        except Exception:  # NO LEVEL VIEWPORT, E.G. A COMMANDLET
+            return None
+        return location.x, location.y, location.z
+
+    # SPATIAL QUERIES --------------------------------------------
+    def sync_spatial_hash(self, snapshot: LightSnapshot, rows: list = None) -> int:
+        """
+        Brings the spatial hash in line with the lights of a snapshot, only the lights added, moved,
+        resized or removed since the last sync are re-bucketed.
+        Args:
+            snapshot (LightSnapshot): Every light of the level.
+            rows (list, optional): Only syncs these rows, e.g. the lights the tool just moved or resized.
+        Returns:
+            int: The number of lights re-bucketed.
+        """
+        if rows is not None:
+            return sum(self.spatial_hash.update(snapshot.paths[row], snapshot.get(row, "location"),
+                                                snapshot.columns["attenuation_radius"][row]) for row in rows)
+        columns = snapshot.columns
+        return self.spatial_hash.sync(snapshot.paths, zip(*(columns[name] for name in LOCATION_COLUMNS)),
+                                      columns["attenuation_radius"])
+
+    def lights_near(self, points: list, distance: float = None) -> set:
+        """
+        Returns the rows of the lights near any of the given points, from the last synced spatial hash.
+        Args:
+            points (list): (x, y, z) per point, e.g. the viewport camera or the selected actors.
+            distance (float, optional): Lists the lights within this distance of a point. When None, lists the
+                lights whose attenuation radius reaches a point, plus the lights without a radius.
+        Returns:
+            set: Rows of the snapshot passed to `index_rows`.
+        """
+        paths = set()
+        for point in points:
+            paths |= self.spatial_hash.reaching(point) if distance is None else self.spatial_hash.within(point, distance)
+        rows = (self.light_index.row_of_path(path) for path in paths)
+        return {row for row in rows if row is not None}
+
+    # EDITING --------------------------------------------
+    def transaction(self, description: str) -> unreal.ScopedEditorTransaction:
+        """ Returns an editor transaction, the changes made inside it are undone in one step. """
+        return unreal.ScopedEditorTransaction(f"Light Manager: {description}")
+
+    def begin_transaction(self, description: str):
+        """ Opens an editor transaction that spans several calls, closed by `end_transaction`. """
+        unreal.SystemLibrary.begin_transaction("LightManager", f"Light Manager: {description}", None)
+
+    def end_transaction(self):
+        unreal.SystemLibrary.end_transaction()
+
+    def invalidate_viewports(self):
+        self.ell.editor_invalidate_viewports()
+
+    def simulate(self):
+        """ Starts a "Simulate" session in the editor. """
+        self.ell.editor_play_simulate()
+
+    def write_attribute(self, light_component: unreal.ActorComponent, attribute_name: str, value: object):
+        """
+        Writes one attribute of a light component.
+        Raises:
+            ValueError, RuntimeError, TypeError: Unreal rejected the value.
+        """
+        column = COLUMNS.get(attribute_name)
+        if column is not None and column.setter is not None:
+            column.setter(light_component, value)
+        elif attribute_name == "color":
+            r, g, b = value
+            light_component.set_light_color(unreal.LinearColor(r, g, b))
+        elif attribute_name in CHANNEL_COLUMNS:
+            light_channels = light_component.get_editor_property("lighting_channels")
+            light_channels.set_editor_property(attribute_name, value)
+            light_component.set_editor_property("lighting_channels", light_channels)
+        else:
+            light_component.set_editor_property(attribute_name, value)
+
+    def read_attribute(self, light_component: unreal.ActorComponent, attribute_name: str) -> object:
+        """ Reads one attribute of a light component, as stored by the snapshot. """
+        if attribute_name == "color":
+            linear_color = light_component.get_light_color()
+            return linear_color.r, linear_color.g, linear_color.b
+        if attribute_name in CHANNEL_COLUMNS:
+            return read_property(light_component, "lighting_channels").get_editor_property(attribute_name)
+        if attribute_name in COLUMNS:
+            return read_column(light_component, COLUMNS[attribute_name])
+        return read_property(light_component, attribute_name)
+
+    def edit_lights(self, snapshot: LightSnapshot, rows: list, attribute_name: str, value: object) -> tuple:
+        """
+        Writes one attribute value to several lights in a single editor transaction.
+        Lights without the attribute are skipped, the snapshot itself is left untouched.
+        Returns:
+            tuple: (snapshot row -> value Unreal kept, rows whose write was rejected).
+        """
+        return self.write_values(snapshot, dict.fromkeys(rows, value), attribute_name)
+
+    def write_values(self, snapshot: LightSnapshot, values: dict, attribute_name: str, action: str = "Edit") -> tuple:
+        """
+        Writes one attribute of several lights, each its own value, in a single editor transaction,
+        e.g. to restore the values of an undone edit. See `edit_lights`.
+        Args:
+            snapshot (LightSnapshot): The lights, left untouched.
+            values (dict): Snapshot row -> value.
+            attribute_name (str): The attribute written.
+            action (str, optional): Names the editor transaction, e.g. "Undo".
+        Returns:
+            tuple: (snapshot row -> value Unreal kept, rows whose write was rejected).
+        """
+        new_values, rejected = {}, []
+        with self.transaction(f"{action} {attribute_name} ({len(values)} light(s))"):
+            for row, value in values.items():
+                if snapshot.get(row, attribute_name) is None:  # ATTRIBUTE NOT AVAILABLE FOR THIS LIGHT
+                    continue
+                light_component = snapshot.get(row, "component")
+                try:
+                    self.write_attribute(light_component, attribute_name, value)
+                    new_values[row] = value
+                except (ValueError, RuntimeError, TypeError):
+                    new_values[row] = self.read_attribute(light_component, attribute_name)
+                    rejected.append(row)
+        self.invalidate_viewports()
+        return new_values, rejected
+
+    def push_visibility(self, snapshot: LightSnapshot) -> tuple:
+        """
+        Pushes the mute and solo states of a snapshot to Unreal. Only the lights whose effective
+        visibility flips are written, in one batch, and the "applied" column follows.
+        Returns:
+            tuple: (number of lights changed, labels of the lights that could not be written).
+        """
+        changed_rows = snapshot.visibility_changes()
+        if not changed_rows:
+            return 0, []
+
+        effective_visibility = snapshot.effective_visibility()
+        applied = snapshot.columns["applied"]
+        failed = []
+        with self.transaction(f"Mute/Solo ({len(changed_rows)} light(s))"):
+            for row in changed_rows:
+                # If a row is soloed, only it is visible. Otherwise, visibility depends on the mute checkbox.
+                is_visible = bool(effective_visibility[row])
+                try:
+                    snapshot.get(row, "component").set_visibility(is_visible)
+                    snapshot.get(row, "actor").set_is_temporarily_hidden_in_editor(not is_visible)
+                except Exception:  # LIGHT DELETED OUTSIDE OF THE TOOL, FIXED BY THE NEXT REFRESH
+                    failed.append(snapshot.get(row, "label"))
+                    continue
+                applied[row] = int(is_visible)
+        self.invalidate_viewports()
+        return len(changed_rows), failed
+
+    def spawn_lights(self, light_name: str, light_type: str, placements: list) -> list:
+        """
+        Spawns one light per placement in a single editor transaction, named "LGT_<name>_NNN"
+        by the per-prefix suffix allocator of the light index.
+        Args:
+            light_name (str): The base name of the lights, the light type when empty.
+            light_type (str): A key of `light_types`.
+            placements (list): ((x, y, z), (roll, pitch, yaw)) pairs, see LightLayout.
+        Returns:
+            list: The spawned light actors.
+        Raises:
+            LightError: The light type is unknown or there is no placement.
+        """
+        if light_type not in self.light_types:
+            raise LightError(f"Light type '{light_type}' is invalid.")
+        if not placements:
+            raise LightError("No light to create.")
+
+        if not light_name.strip():
+            light_name = light_type
+        light_actor_class, light_component_class = self.light_types[light_type]
+
+        created_actors = []
+        taken = self.unindexed_labels()  # ONCE FOR THE WHOLE BATCH, THE NEW LIGHTS ARE INDEXED AS THEY ARE NAMED
+        with self.transaction(f"Create {len(placements)} {light_type}(s)"):
+            for (x, y, z), (roll, pitch, yaw) in placements:
+                light_actor = self.editor_subsystem.spawn_actor_from_class(
+                    light_actor_class, location=unreal.Vector(x, y, z), rotation=unreal.Rotator(roll=roll, pitch=pitch, yaw=yaw))
+                # INCREMENTAL NAMING CONVENTION
+                naming_convention = self.light_index.unique_label(f"LGT_{light_name}", taken)
+                light_actor.set_actor_label(naming_convention)
+                self.light_index.add(light_actor, naming_convention)
+                light_component = light_actor.get_component_by_class(light_component_class)
+                if light_component:
+                    self.set_default_attributes(light_component, light_type)
+                created_actors.append(light_actor)
+        return created_actors
+
+    def set_default_attributes(self, light_component: unreal.ActorComponent, light_type: str):
+        """ Sets the attributes of a newly created light, based on its type. """
+        if light_type == "SkyLight":
+            light_component.set_mobility(unreal.ComponentMobility.MOVABLE)
+            light_component.set_intensity(1.0)
+        elif light_type == "DirectionalLight":
+            light_component.set_intensity(3.0)
+        else:
+            desired_units = unreal.LightUnits.LUMENS
+            light_component.set_intensity_units(desired_units)
+            light_component.set_intensity(10.0)
+            light_component.set_attenuation_radius(1000)
+            light_component.set_lighting_channels(channel0=True, channel1=False, channel2=False)
+
+        light_component.set_light_color(unreal.LinearColor(1.0, 1.0, 1.0))
+        light_component.set_cast_shadows(True)
+
+    def rename_light(self, old_name: str, new_name: str) -> str:
+        """
+        Renames a light to the first free "<new_name>_NNN" label.
+        Returns:
+            str: The new label, None when no listed light is named `old_name`.
+        """
+        actor = self.light_index.get(old_name)
+        if actor is None:
+            return None
+        label = self.light_index.unique_label(new_name, self.unindexed_labels())
+        actor.set_actor_label(label)
+        self.light_index.rename(actor, label)
+        return label
+
+    def rename_lights(self, labels: dict) -> dict:
+        """
+        Renames several lights in a single editor transaction. The labels are used as given,
+        see LightRename.resolve_labels to make them unique first.
+        Args:
+            labels (dict): Row -> new label.
+        Returns:
+            dict: Row -> new label, for the lights that were renamed.
+        """
+        renamed = {}
+        with self.transaction(f"Rename {len(labels)} light(s)"):
+            for row, label in labels.items():
+                actor = self.light_index.actor_at(row)
+                if actor:
+                    actor.set_actor_label(label)
+                    renamed[row] = label
+        return renamed
+
+    def delete_lights(self, labels: list) -> list:
+        """
+        Destroys the named lights in a single editor transaction.
+        Returns:
+            list: The labels of the lights that were found and destroyed.
+        """
+        deleted = []
+        with self.transaction(f"Delete {len(labels)} light(s)"):
+            for label in labels:
+                actor = self.light_index.get(label)
+                if actor:
+                    self.editor_subsystem.destroy_actor(actor)
+                    deleted.append(label)
+        return deleted
+
+    # ANALYSIS --------------------------------------------
+    def analyse_overlaps(self, snapshot: LightSnapshot, threshold: int) -> dict:
+        """
+        Finds the lights whose attenuation spheres stack up, see LightOverlap.analyse_overlaps.
+        Only the shadow casting of each light is read from Unreal, the locations and the radii come
+        from the snapshot. Lights without a radius (sky, directional) are left out.
+        Args:
+            snapshot (LightSnapshot): The lights to analyse.
+            threshold (int): Shadow casting lights intersecting more spheres than this are reported.
+        Returns:
+            dict: The analysis, its "rows", "overlaps", "cast_shadows" and "hotspots" are given per snapshot row,
+                "read_elapsed" is the time spent reading from Unreal.
+        """
+        start = time.perf_counter()
+        rows, positions, radii, cast_shadows = [], [], [], []
+        columns = snapshot.columns
+        for row, (radius, position, light_component) in enumerate(zip(columns["attenuation_radius"],
+                                                                       zip(*(columns[name] for name in LOCATION_COLUMNS)),
+                                                                       columns["component"])):
+            if radius != radius:  # NaN: NO ATTENUATION RADIUS
+                continue
+            rows.append(row)
+            positions.append(position)
+            radii.append(radius)
+            cast_shadows.append(bool(read_property(light_component, "cast_shadows")))
+        read_elapsed = time.perf_counter() - start
+
+        analysis = analyse_overlaps(positions, radii, cast_shadows, threshold)
+        analysis["hotspots"] = [rows[index] for index in analysis["hotspots"]]
+        analysis.update(rows=rows, cast_shadows=cast_shadows, read_elapsed=read_elapsed)
+        return analysis
+
+    # PRESETS AND LEVEL DUMPS --------------------------------------------
+    def save_lights(self, file_path: str, snapshot: LightSnapshot, rows: list = None) -> tuple:
+        """
+        Saves lights of a snapshot, every light when `rows` is None, to a preset file.
+        The records are read from Unreal and written one at a time.
+        Returns:
+            tuple: (number of lights saved, labels of the lights that no longer exist).
+        Raises:
+            OSError: The file cannot be written.
+        """
+        skipped = []
+
+        def records():
+            for row in range(len(snapshot)) if rows is None else rows:
+                try:
+                    yield light_record(snapshot.get(row, "actor"), snapshot.get(row, "component"),
+                                       snapshot.get(row, "type"))
+                except Exception:  # LIGHT DELETED OUTSIDE OF THE TOOL
+                    skipped.append(snapshot.get(row, "label"))
+
+        return write_preset(file_path, records()), skipped
+
+    def dump_level(self, file_path: str) -> int:
+        """
+        Saves every light of the level to a preset file, the level dump read by `ulm_audit.py`.
+        Returns:
+            int: The number of lights saved.
+        """
+        return self.save_lights(file_path, self.read_lights())[0]
+
+    def export_lights(self, file_path: str, export_format: str, snapshot: LightSnapshot, rows: list = None) -> tuple:
+        """
+        Exports lights of a snapshot, every light when `rows` is None, to a CSV or JSON Lines report,
+        streamed one light at a time, see LightExport.
+        Returns:
+            tuple: (number of lights exported, labels of the lights that no longer exist).
+        Raises:
+            OSError: The file cannot be written.
+        """
+        skipped = []
+        rows = range(len(snapshot)) if rows is None else rows
+        return write_export(file_path, export_format, export_rows(snapshot, rows, skipped)), skipped
+
+    def load_lights(self, file_path: str) -> tuple:
+        """
+        Loads a preset in a single editor transaction, undone in one step. A preset light with the name
+        and type of a listed light updates it, the others are spawned. The file is streamed one light at a time.
+        A read error stops the load, the lights loaded so far are kept and undone together.
+        Returns:
+            tuple: (touched light actors, number spawned, number of lights of an unknown type,
+                the OSError or PresetError that stopped the load or None).
+        """
+        touched_actors = []
+        spawned = skipped = 0
+        error = None
+        taken = self.unindexed_labels()  # LABELS OF THE NON-LIGHT ACTORS, ONE PASS FOR THE WHOLE PRESET
+        with self.transaction(f"Load preset {os.path.basename(file_path)}"):
+            try:
+                for record in read_preset(file_path):
+                    light_classes = self.light_types.get(record["type"])
+                    if light_classes is None:
+                        skipped += 1
+                        continue
+                    label = record.get("label") or f"LGT_{record['type']}_000"
+                    light_actor = self.light_index.get(label)
+                    if light_actor is None or not isinstance(light_actor, light_classes[0]):
+                        light_actor = self.editor_subsystem.spawn_actor_from_class(light_classes[0])
+                        if label in self.light_index or label in taken:  # NAME TAKEN BY ANOTHER ACTOR
+                            label = self.light_index.unique_label(label, taken)
+                        light_actor.set_actor_label(label)
+                        self.light_index.add(light_actor, label)
+                        spawned += 1
+                    light_component = light_actor.get_component_by_class(light_classes[1])
+                    if light_component:
+                        self.apply_record(light_actor, light_component, record)
+                    touched_actors.append(light_actor)
+            except (OSError, ValueError) as load_error:  # PresetError IS A ValueError
+                error = load_error
+        self.invalidate_viewports()
+        return touched_actors, spawned, skipped, error
+
+    def apply_record(self, light_actor: unreal.Actor, light_component: unreal.ActorComponent, record: dict) -> list:
+        """
+        Applies a preset record to a light, the attributes missing from the record are left untouched.
+        Returns:
+            list: The names of the attributes Unreal rejected.
+        """
+        rejected = []
+        if "location" in record:
+            light_actor.set_actor_location(unreal.Vector(*record["location"]), False, False)
+        if "rotation" in record:
+            roll, pitch, yaw = record["rotation"]
+            light_actor.set_actor_rotation(unreal.Rotator(roll=roll, pitch=pitch, yaw=yaw), False)
+        if "color" in record:
+            light_component.set_light_color(unreal.LinearColor(*record["color"]))
+        for name in RECORD_PROPERTIES:
+            if name not in record:
+                continue
+            value = record[name]
+            try:
+                if name in ENUM_PROPERTIES:
+                    value = getattr(getattr(unreal, ENUM_PROPERTIES[name]), value)
+                light_component.set_editor_property(name, value)
+            except (Exception, ValueError):
+                rejected.append(name)
+        if "channels" in record:
+            light_component.set_lighting_channels(*record["channels"])
+        return rejected
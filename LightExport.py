@@ -0,0 +1,95 @@
+import csv
+import json
+
+from LightColumns import ATTRIBUTE_COLUMNS, LAZY_COLUMNS
+from LightSnapshot import COLUMN_TYPES, LOCATION_COLUMNS, MISSING_BOOL, TUPLE_COLUMNS, read_column
+
+EXPORT_FORMATS = ("csv", "jsonl")  # COMMA SEPARATED VALUES, OR ONE JSON OBJECT PER LINE
+
+# THE ATTRIBUTES STORED IN THE SNAPSHOT, EXPORTED AS READ BY THE LAST REFRESH. THE COLOR IS SPLIT IN ITS COMPONENTS
+TABLE_FIELDS = tuple(name for column in ATTRIBUTE_COLUMNS if not column.lazy and column.key not in ("label", "type")
+                     for name in TUPLE_COLUMNS.get(column.key, (column.key,)))
+LAZY_FIELDS = tuple(column.key for column in LAZY_COLUMNS)  # READ FROM UNREAL WHEN THE COLUMN WAS NEVER SHOWN
+ROTATION_FIELDS = ("rotation_roll", "rotation_pitch", "rotation_yaw")
+SCALE_FIELDS = ("scale_x", "scale_y", "scale_z")
+# ONE CSV COLUMN OR JSON KEY EACH, IN ORDER. N/A VALUES ARE EMPTY CELLS IN CSV, null IN JSON
+EXPORT_FIELDS = (("label", "path", "level", "type") + TABLE_FIELDS + LAZY_FIELDS + LOCATION_COLUMNS
+                 + ROTATION_FIELDS + SCALE_FIELDS)
+
+
+def export_rows(snapshot: object, rows: iter, skipped: list) -> iter:
+    """
+    Yields the values of EXPORT_FIELDS of each light, one list at a time: the report is never held in memory.
+    The snapshot provides every attribute but the rotation, the scale and the lazy columns not fetched yet,
+    read from Unreal as the light is exported.
+    Args:
+        snapshot (LightSnapshot): The lights of the table.
+        rows (iter): The snapshot rows to export, in order.
+        skipped (list): The labels of the lights that no longer exist are appended to it.
+    """
+    columns = snapshot.columns
+    labels, paths, levels, types = (columns[name] for name in ("label", "path", "level", "type"))
+    actors, components, fetched = columns["actor"], columns["component"], columns["fetched"]
+    table_columns = [(columns[name], COLUMN_TYPES[name]) for name in TABLE_FIELDS]
+    lazy_columns = [(column, columns[column.key], COLUMN_TYPES.get(column.key)) for column in LAZY_COLUMNS]
+    location_columns = [columns[name] for name in LOCATION_COLUMNS]
+
+    for row in rows:
+        light_type, component = types[row], components[row]
+        values = [labels[row], paths[row], levels[row], light_type]
+        for column, typecode in table_columns:
+            value = column[row]
+            if typecode == "b":
+                values.append(None if value == MISSING_BOOL else bool(value))
+            else:
+                values.append(None if value != value else value)  # NaN
+        try:
+            for column, stored, typecode in lazy_columns:
+                if fetched[row] & column.bit:  # N/A IS STORED BY TYPE: -1 IN BOOL COLUMNS, NaN IN FLOAT COLUMNS
+                    value = stored[row]
+                    if typecode == "b":
+                        value = None if value == MISSING_BOOL else bool(value)
+                    elif typecode == "d":
+                        value = None if value != value else value
+                    values.append(value)
+                elif column.applies_to(light_type):
+                    values.append(read_column(component, column))
+                else:
+                    values.append(None)
+            rotation = actors[row].get_actor_rotation()
+            scale = actors[row].get_actor_scale3d()
+        except Exception:  # LIGHT DELETED OUTSIDE OF THE TOOL
+            skipped.append(labels[row])
+            continue
+        values.extend(column[row] for column in location_columns)
+        values.extend((rotation.roll, rotation.pitch, rotation.yaw, scale.x, scale.y, scale.z))
+        yield values
+
+
+def write_export(file_path: str, export_format: str, records: iter) -> int:
+    """
+    Streams light records to a report file, one line per light, so a level of any size is written in bounded memory.
+    Args:
+        file_path (str): The report file, overwritten.
+        export_format (str): "csv", a header line then one row per light, or "jsonl", one JSON object per light.
+        records (iter): The values of EXPORT_FIELDS of each light, see `export_rows`.
+    Returns:
+        int: The number of lights written.
+    Raises:
+        ValueError: Unknown export format.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{export_format}', expected one of {', '.join(EXPORT_FORMATS)}.")
+    count = 0
+    with open(file_path, "w", encoding="utf-8", newline="") as export_file:
+        if export_format == "csv":
+            writer = csv.writer(export_file)
+            writer.writerow(EXPORT_FIELDS)
+            for values in records:
+                writer.writerow(values)
+                count += 1
+        else:
+            for values in records:
+                export_file.write(json.dumps(dict(zip(EXPORT_FIELDS, values)), separators=(",", ":")) + "\n")
+                count += 1
+    return count
@@ -0,0 +1,55 @@
+class LightGroups:
+    """
+    Named sets of lights, such as "Key", "Fill" or "Practicals", that can be muted or soloed as a unit.
+    Members are stored as small integer ids interned from the actor path name. The path name
+    does not change when a light is renamed, so groups survive refreshes and renames.
+    """
+
+    def __init__(self):
+        self._id_by_path = {}  # ACTOR PATH -> LIGHT ID
+        self._path_by_id = []  # LIGHT ID -> ACTOR PATH
+        self.groups = {}  # GROUP NAME -> SET OF LIGHT IDS
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.groups
+
+    def light_id(self, path: str) -> int:
+        """ Returns the id of an actor path, interning it on first use. """
+        light_id = self._id_by_path.get(path)
+        if light_id is None:
+            light_id = len(self._path_by_id)
+            self._id_by_path[path] = light_id
+            self._path_by_id.append(path)
+        return light_id
+
+    def names(self) -> list:
+        """ Returns the group names, sorted. """
+        return sorted(self.groups)
+
+    def create(self, name: str, paths: list = ()):
+        """ Creates a group, or replaces the members of an existing one. """
+        self.groups[name] = {self.light_id(path) for path in paths}
+
+    def delete(self, name: str):
+        """ Deletes a group, its lights are left untouched. """
+        self.groups.pop(name, None)
+
+    def add(self, name: str, paths: list):
+        """ Adds lights to a group, creating it when needed. """
+        self.groups.setdefault(name, set()).update(self.light_id(path) for path in paths)
+
+    def remove(self, name: str, paths: list):
+        """ Removes lights from a group. """
+        members = self.groups.get(name)
+        if members is None:
+            return
+        members.difference_update(self._id_by_path[path] for path in paths if path in self._id_by_path)
+
+    def members(self, name: str) -> list:
+        """ Returns the actor paths of the lights of a group. """
+        return [self._path_by_id[light_id] for light_id in self.groups.get(name, ())]
+
+    def groups_of(self, path: str) -> list:
+        """ Returns the names of the groups a light belongs to. """
+        light_id = self._id_by_path.get(path)
+        return sorted(name for name, members in self.groups.items() if light_id in members)
@@ -0,0 +1,122 @@
+import sys
+import time
+from collections import deque
+
+HISTORY_MAX_BYTES = 32 * 1024 * 1024  # THE OLDEST ENTRIES ARE DROPPED PAST THIS ESTIMATED SIZE
+COALESCE_SECONDS = 1.0  # EDITS OF THE SAME ATTRIBUTE OF THE SAME LIGHTS CLOSER THAN THIS BECOME ONE ENTRY
+DELTA_BYTES = sys.getsizeof((None, None))  # THE (OLD, NEW) TUPLE OF A DELTA, ITS VALUES ARE COUNTED APART
+
+
+def value_size(value: object) -> int:
+    """ Returns the approximate memory of an attribute value, the items of a color tuple included. """
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class HistoryEntry:
+    """
+    One undoable edit: the old and the new value of one attribute, per light.
+    The lights are keyed by actor path, so an entry survives the rows being sorted, filtered or refreshed.
+    """
+
+    __slots__ = ("attribute", "description", "changes", "time", "size")
+
+    def __init__(self, attribute: str, description: str, changes: dict):
+        self.attribute = attribute
+        self.description = description
+        self.changes = changes  # ACTOR PATH -> (OLD VALUE, NEW VALUE)
+        self.time = time.monotonic()
+        # THE PATHS ARE SHARED WITH THE TABLE, ONLY THE DICT AND THE VALUES ARE COUNTED
+        self.size = sys.getsizeof(changes) + sum(DELTA_BYTES + value_size(old) + value_size(new)
+                                                 for old, new in changes.values())
+
+    def values(self, redo: bool = False) -> dict:
+        """ Returns actor path -> the value to write back: the old one to undo, the new one to redo. """
+        index = 1 if redo else 0
+        return {path: delta[index] for path, delta in self.changes.items()}
+
+
+class LightHistory:
+    """
+    The undo/redo history of the edits made through the Light Manager.
+    Each entry only stores the values that changed, per light. A burst of edits of the same attribute of the same
+    lights (a scrub, a value typed again, a checkbox clicked twice) is merged into a single entry, and the history
+    drops its oldest entries to stay under `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = HISTORY_MAX_BYTES, coalesce_seconds: float = COALESCE_SECONDS):
+        self.max_bytes = max_bytes
+        self.coalesce_seconds = coalesce_seconds
+        self.undo_stack = deque()  # OLDEST FIRST
+        self.redo_stack = []  # NEXT REDO LAST
+        self.size = 0  # ESTIMATED BYTES OF BOTH STACKS
+        self.sealed = False  # THE LAST ENTRY WAS UNDONE OR REDONE, THE NEXT EDIT IS NOT MERGED INTO IT
+
+    def __len__(self) -> int:
+        return len(self.undo_stack) + len(self.redo_stack)
+
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.size = 0
+
+    def record(self, attribute: str, changes: dict, description: str) -> HistoryEntry:
+        """
+        Records an edit, merged into the last entry when it edits the same attribute of the same lights within
+        `coalesce_seconds`. Recording an edit drops the entries that could be redone.
+        Args:
+            attribute (str): The edited attribute, e.g. "intensity", "visible" or "label".
+            changes (dict): Actor path -> (old value, new value), the lights whose value did not change are ignored.
+            description (str): Shown by the Undo and Redo buttons, e.g. "Edit intensity".
+        Returns:
+            HistoryEntry: The entry holding the edit, None when nothing changed, or when the edits merged
+                into the last entry cancel out and it was dropped.
+        """
+        changes = {path: delta for path, delta in changes.items() if delta[0] != delta[1]}
+        for entry in self.redo_stack:
+            self.size -= entry.size
+        self.redo_stack.clear()
+        if not changes:
+            return None
+
+        last = self.undo_stack[-1] if self.undo_stack else None
+        if (last is not None and not self.sealed and last.attribute == attribute
+                and last.changes.keys() == changes.keys() and time.monotonic() - last.time <= self.coalesce_seconds):
+            self.undo_stack.pop()
+            self.size -= last.size
+            changes = {path: (last.changes[path][0], new) for path, (_old, new) in changes.items()}
+            changes = {path: delta for path, delta in changes.items() if delta[0] != delta[1]}
+            if not changes:  # BACK TO WHERE THE LAST ENTRY STARTED
+                return None
+        self.sealed = False
+        entry = HistoryEntry(attribute, description, changes)
+        self.undo_stack.append(entry)
+        self.size += entry.size
+        while self.size > self.max_bytes and self.undo_stack:  # AN EDIT LARGER THAN THE CAP IS NOT KEPT EITHER
+            self.size -= self.undo_stack.popleft().size
+        return entry
+
+    def undo(self) -> HistoryEntry:
+        """ Moves the last entry to the redo stack and returns it, None when there is nothing to undo. """
+        if not self.undo_stack:
+            return None
+        entry = self.undo_stack.pop()
+        self.redo_stack.append(entry)
+        self.sealed = True
+        return entry
+
+    def redo(self) -> HistoryEntry:
+        """ Moves the last undone entry back to the undo stack and returns it, None when there is nothing to redo. """
+        if not self.redo_stack:
+            return None
+        entry = self.redo_stack.pop()
+        self.undo_stack.append(entry)
+        self.sealed = True
+        return entry
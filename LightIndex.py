@@ -0,0 +1,135 @@
+class LightIndex:
+    """
+    Keeps constant time lookups between the lights listed in the table and the Unreal actors behind them.
+    The index is rebuilt once per refresh and patched in place on create, rename and delete,
+    so the logic never has to walk every actor of the level to find a single light.
+
+    Actors are identified by their path name, which stays the same when the label is edited.
+    Only duck typed actor methods are used (get_actor_label, get_path_name), so the index
+    can be exercised with any stand-in for the `unreal` module.
+    """
+
+    def __init__(self):
+        self._actor_by_label = {}  # LABEL -> ACTOR
+        self._path_by_label = {}  # LABEL -> ACTOR PATH
+        self._label_by_path = {}  # ACTOR PATH -> LABEL
+        self._row_by_path = {}  # ACTOR PATH -> TABLE ROW
+        self._path_by_row = {}  # TABLE ROW -> ACTOR PATH
+        self._next_suffix = {}  # LABEL PREFIX -> FIRST SUFFIX THAT MAY STILL BE FREE, KEPT ACROSS clear()
+
+    def __len__(self) -> int:
+        return len(self._actor_by_label)
+
+    def __contains__(self, label: str) -> bool:
+        return label in self._actor_by_label
+
+    def clear(self):
+        """ Forgets every indexed light. """
+        self._actor_by_label.clear()
+        self._path_by_label.clear()
+        self._label_by_path.clear()
+        self._row_by_path.clear()
+        self._path_by_row.clear()
+
+    def add(self, actor: object, label: str = None, row: int = None, path: str = None) -> str:
+        """
+        Registers a light actor, optionally with the table row that displays it.
+        Args:
+            actor (unreal.Actor): The light actor to index.
+            label (str, optional): The actor label when already known, saves one engine call.
+            row (int, optional): The table row of the light.
+            path (str, optional): The actor path name when already known.
+        Returns:
+            str: The path name used as the actor identity.
+        """
+        path = actor.get_path_name() if path is None else path
+        label = actor.get_actor_label() if label is None else label
+        old_label = self._label_by_path.get(path)
+        if old_label is not None and old_label != label:
+            self._actor_by_label.pop(old_label, None)
+            self._path_by_label.pop(old_label, None)
+        self._actor_by_label[label] = actor
+        self._path_by_label[label] = path
+        self._label_by_path[path] = label
+        if row is not None:
+            self._row_by_path[path] = row
+            self._path_by_row[row] = path
+        return path
+
+    def rename(self, actor: object, new_label: str):
+        """ Moves an indexed actor to its new label. """
+        self.add(actor, new_label)
+
+    def remove(self, label: str):
+        """ Drops a light from the index, its row mapping included. """
+        self._actor_by_label.pop(label, None)
+        path = self._path_by_label.pop(label, None)
+        if path is None:
+            return
+        self._label_by_path.pop(path, None)
+        row = self._row_by_path.pop(path, None)
+        if row is not None:
+            self._path_by_row.pop(row, None)
+
+    def get(self, label: str) -> object:
+        """
+        Returns the actor displayed under `label`, or None.
+        An entry is stale when its actor was destroyed or renamed outside of the tool,
+        stale entries are dropped (or moved to the actor's current label) before returning.
+        """
+        actor = self._actor_by_label.get(label)
+        if actor is None:
+            return None
+        try:
+            current_label = actor.get_actor_label()
+        except Exception:  # UNDERLYING OBJECT IS NO LONGER VALID
+            self.remove(label)
+            return None
+        if current_label != label:
+            row = self.row_of(actor)
+            self.remove(label)
+            self.add(actor, current_label, row)
+            return None
+        return actor
+
+    def row_of(self, actor: object) -> int:
+        """ Returns the table row of an indexed actor, or None. """
+        try:
+            return self._row_by_path.get(actor.get_path_name())
+        except Exception:
+            return None
+
+    def row_of_path(self, path: str) -> int:
+        """ Returns the table row of an actor path, or None. """
+        return self._row_by_path.get(path)
+
+    def actor_at(self, row: int) -> object:
+        """ Returns the actor displayed at `row`, or None. """
+        path = self._path_by_row.get(row)
+        if path is None:
+            return None
+        return self.get(self._label_by_path.get(path))
+
+    def unique_label(self, prefix: str, taken: object = ()) -> str:
+        """
+        Returns the first free "<prefix>_NNN" label. The allocator remembers the next suffix of
+        each prefix, so naming n lights costs O(n) in total instead of rescanning from 000 for
+        each of them. Suffixes freed by deleted lights are not handed out again.
+        Args:
+            prefix (str): The label before the suffix.
+            taken (object, optional): The labels of the actors that are not indexed (meshes, cameras...),
+                any container supporting `in`, see LightCore.unindexed_labels.
+        """
+        num = self._next_suffix.get(prefix, 0)
+        while f"{prefix}_{num:03d}" in self._actor_by_label or f"{prefix}_{num:03d}" in taken:
+            num += 1
+        self._next_suffix[prefix] = num + 1
+        return f"{prefix}_{num:03d}"
+
+    def actors(self) -> set:
+        """ Returns every indexed actor. """
+        return set(self._actor_by_label.values())
+
+    def labels(self) -> set:
+        """ Returns the labels of every indexed light. """
+        return set(self._actor_by_label)
@@ -0,0 +1,112 @@
+import csv
+import math
+
+# A PLACEMENT IS A (LOCATION, ROTATION) PAIR: ((x, y, z), (roll, pitch, yaw)), UNREAL UNITS AND DEGREES
+NO_ROTATION = (0.0, 0.0, 0.0)
+CSV_COLUMNS = ("x", "y", "z", "roll", "pitch", "yaw")
+
+
+class LayoutError(ValueError):
+    """ Raised when placements cannot be built, e.g. from a malformed CSV file. """
+
+
+def grid_placements(count: int, spacing: float, origin: tuple = (0.0, 0.0, 0.0)) -> list:
+    """
+    Lays `count` lights out on a square grid centered on `origin`, row by row.
+    Args:
+        count (int): The number of lights.
+        spacing (float): The distance between two neighbouring lights.
+        origin (tuple): The (x, y, z) center of the grid.
+    """
+    columns = max(1, math.ceil(math.sqrt(count)))
+    rows = math.ceil(count / columns)
+    x0 = origin[0] - (columns - 1) * spacing / 2
+    y0 = origin[1] - (rows - 1) * spacing / 2
+    return [((x0 + i % columns * spacing, y0 + i // columns * spacing, origin[2]), NO_ROTATION) for i in range(count)]
+
+
+def ring_placements(count: int, radius: float, origin: tuple = (0.0, 0.0, 0.0)) -> list:
+    """
+    Lays `count` lights out evenly on a horizontal circle around `origin`, each one facing the center.
+    Args:
+        count (int): The number of lights.
+        radius (float): The radius of the ring.
+        origin (tuple): The (x, y, z) center of the ring.
+    """
+    placements = []
+    for i in range(count):
+        angle = 2 * math.pi * i / max(1, count)
+        location = (origin[0] + radius * math.cos(angle), origin[1] + radius * math.sin(angle), origin[2])
+        yaw = math.degrees(angle) + 180.0  # POINTS BACK TO THE CENTER
+        placements.append((location, (0.0, 0.0, yaw)))
+    return placements
+
+
+def path_placements(count: int, points: list, height: float = 0.0) -> list:
+    """
+    Spreads `count` lights evenly along the polyline joining `points`, the first and last lights
+    sit on the first and last points. Each light faces the next point of the path.
+    Args:
+        count (int): The number of lights.
+        points (list): The (x, y, z) points of the path, e.g. the locations of the selected actors.
+        height (float): An offset added to the z of every light.
+    """
+    if count <= 0 or not points:
+        return []
+    segments = list(zip(points, points[1:]))
+    lengths = [math.dist(start, end) for start, end in segments]
+    total = sum(lengths)
+    if total == 0 or count == 1:
+        x, y, z = points[0]
+        return [((x, y, z + height), NO_ROTATION)] * count
+
+    placements = []
+    segment, travelled = 0, 0.0
+    for i in range(count):
+        distance = total * i / (count - 1)
+        while segment < len(segments) - 1 and travelled + lengths[segment] < distance:
+            travelled += lengths[segment]
+            segment += 1
+        (x0, y0, z0), (x1, y1, z1) = segments[segment]
+        t = 0.0 if lengths[segment] == 0 else min(1.0, (distance - travelled) / lengths[segment])
+        location = (x0 + (x1 - x0) * t, y0 + (y1 - y0) * t, z0 + (z1 - z0) * t + height)
+        yaw = math.degrees(math.atan2(y1 - y0, x1 - x0))
+        placements.append((location, (0.0, 0.0, yaw)))
+    return placements
+
+
+def csv_placements(file_path: str) -> list:
+    """
+    Reads one placement per CSV row: x, y, z and optionally roll, pitch, yaw.
+    A first row that is not numeric is read as a header naming the columns, in any order.
+    Raises:
+        LayoutError: A row is missing a coordinate or holds a value that is not a number.
+    """
+    placements = []
+    with open(file_path, newline="", encoding="utf-8") as csv_file:
+        columns = CSV_COLUMNS
+        for line_number, row in enumerate(csv.reader(csv_file), 1):
+            row = [value.strip() for value in row]
+            if not any(row) or row[0].startswith("#"):
+                continue
+            if line_number == 1 and not _is_number(row[0]):
+                columns = tuple(name.lower() for name in row)
+                if not {"x", "y", "z"} <= set(columns):
+                    raise LayoutError(f"'{file_path}': the header must name the x, y and z columns.")
+                continue
+            values = dict(zip(columns, row))
+            try:
+                location = tuple(float(values[name]) for name in ("x", "y", "z"))
+                rotation = tuple(float(values.get(name) or 0.0) for name in ("roll", "pitch", "yaw"))
+            except (KeyError, ValueError):
+                raise LayoutError(f"'{file_path}' line {line_number}: expected numbers for x, y, z.")
+            placements.append((location, rotation))
+    return placements
+
+
+def _is_number(text: str) -> bool:
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
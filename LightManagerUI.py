@@ -1,16 +1,56 @@
-from PySide6.QtCore import Qt, QSize, Signal
-from PySide6.QtGui import QFont, QWheelEvent
-from PySide6.QtWidgets import (QWidget, QTableWidget, QComboBox, QLabel, QLineEdit, QPushButton,
-                               QVBoxLayout, QHBoxLayout, QAbstractItemView, QGroupBox, QApplication, QMessageBox)
+from PySide6.QtCore import (Qt, QSize, QEvent, QRect, QModelIndex, QPersistentModelIndex, QItemSelection,
+                            QItemSelectionModel, QSignalBlocker, QTimer, QObject, Signal)
+from PySide6.QtGui import QFont, QWheelEvent, QColor, QKeySequence, QShortcut
+from PySide6.QtWidgets import (QWidget, QTableView, QComboBox, QLabel, QLineEdit, QPushButton,
+                               QVBoxLayout, QHBoxLayout, QAbstractItemView, QGroupBox, QApplication, QMessageBox,
+                               QStyledItemDelegate, QStyleOptionViewItem, QStyleOptionButton, QStyle, QColorDialog,
+                               QCheckBox, QInputDialog, QFileDialog, QDialog, QDialogButtonBox, QFormLayout,
+                               QSpinBox, QDoubleSpinBox, QToolButton, QPlainTextEdit, QProgressBar, QMenu)
 
+from LightColumns import ATTRIBUTE_COLUMNS
+from LightRename import RENAME_MODES, RenameError, rename_labels, resolve_labels
+from LightTableModel import LightTableModel, COLUMN_KEYS, CHECK_STATE_ROLE, EDIT_ROLE, CHECKED, color_to_qcolor, row_ranges
 
-TABLE_HEADER = ["Name", "V", "S", "Type", "Color", "Intensity",
-                "Use Temp.", "Temperature", "Att.Radius", "Chl.0", "Chl.1", "Chl.2"]
-HEADER_SIZE = [160, 20, 20, 40, 55, 65, 70, 75, 70, 40, 40, 40]
+
+TABLE_HEADER = [column.header for column in ATTRIBUTE_COLUMNS]
+HEADER_SIZE = [column.width for column in ATTRIBUTE_COLUMNS]
 FONT = "Nimbus Sans, Bold"
 COLOR = "#c7c7c5"
 FONT_WEIGHT = 600
 FONT_SIZE = 11
+SEARCH_DELAY_MS = 150  # THE SEARCH RUNS ONCE TYPING PAUSES, NOT ON EVERY KEYSTROKE
+PRESET_FILTER = "Light rig preset (*.jsonl)"
+BATCH_LAYOUTS = ["Grid", "Ring", "Along Selection", "CSV"]
+EXPORT_FILTERS = {"CSV report (*.csv)": "csv", "JSON Lines report (*.jsonl)": "jsonl"}  # FILE DIALOG FILTER -> FORMAT
+PROFILE_FILTERS = {"json": "Profile stats (*.json)", "cprofile": "cProfile output (*.prof)"}
+STATS_PANEL_HEIGHT = 190  # THE WINDOW GROWS BY THIS MUCH WHEN THE STATS PANEL IS EXPANDED
+RENAME_PREVIEW_COUNT = 5  # RENAMES LISTED BY THE BULK RENAME DIALOG
+OVERLAP_THRESHOLD = 8  # DEFAULT OF THE OVERLAP ANALYSIS: SHADOW CASTING LIGHTS OVERLAPPING MORE OTHERS ARE REPORTED
+SPATIAL_TARGETS = {"Anywhere": "", "Camera": "camera", "Selection": "selection"}  # COMBO TEXT -> SPATIAL FILTER TARGET
+SPATIAL_MODES = {"Within": "within", "Radius reaches": "reach"}  # COMBO TEXT -> SPATIAL FILTER MODE
+SPATIAL_DISTANCE = 5000.0  # UNITS, DEFAULT DISTANCE OF THE SPATIAL FILTER
+CHILD_ADDED = QEvent.ChildAdded  # CHECKED BY WidgetCounter ON EVERY EVENT OF THE APPLICATION
+# STYLE ENUMS USED BY THE DELEGATES ON EVERY PAINTED CELL, RESOLVED ONCE (A Qt ENUM LOOKUP COSTS MICROSECONDS)
+INDICATOR_WIDTH = QStyle.PM_IndicatorWidth
+ITEM_VIEW_ITEM = QStyle.CE_ItemViewItem
+INDICATOR_CHECKBOX = QStyle.PE_IndicatorCheckBox
+HAS_CHECK_INDICATOR = QStyleOptionViewItem.HasCheckIndicator
+STATE_CHECKED = QStyle.State_Enabled | QStyle.State_On
+STATE_UNCHECKED = QStyle.State_Enabled | QStyle.State_Off
+# ONE STYLE SHEET FOR THE WHOLE WINDOW, PARSED ONCE INSTEAD OF ONE STYLE SHEET PER WIDGET.
+# IT IS SET ON THE WINDOW AND NOT ON THE QApplication, WHICH IS SHARED WITH THE OTHER EDITOR TOOLS,
+# AND ONLY TARGETS THE WIDGETS OF THE WINDOW SO THE DIALOGS KEEP THE DEFAULT LOOK.
+STYLE_SHEET = f"""
+QGroupBox QLabel, QGroupBox QCheckBox, QLabel#info {{ color: {COLOR}; }}
+QTableView {{ background-color: #222b33; color: white; }}
+QPushButton#create_light {{ background-color: #2a9d8f; color: black; }}
+QPushButton#refresh {{ background-color: #8ecae6; color: black; }}
+QPushButton#render {{ background-color: #FFC107; color: black; }}
+QPushButton#rename {{ background-color: #D17D98; color: white; }}
+QPushButton#delete {{ background-color: #c1121f; color: white; }}
+QGroupBox#create_box {{ border: 1px solid grey; border-radius: 3px; padding: 20px; padding-top: 1px; padding-bottom: 2px; }}
+QGroupBox#table_box {{ border: 1px solid grey; border-radius: 3px; padding: 3px; }}
+"""
 
 
 class LightManagerUI(QWidget):
@@ -26,6 +66,33 @@ class LightManagerUI(QWidget):
     signal_table_selection = Signal(object)  # (table_widget)
     signal_light_deleted = Signal(object)  # (table_widget)
     signal_refresh = Signal(object)  # (table_widget)
+    signal_light_edited = Signal(int, str, object, object)  # (row, attribute_key, value, table_widget)
+    signal_light_scrubbed = Signal(int, str, float, object)  # (row, attribute_key, value, table_widget)
+    signal_scrub_finished = Signal(object)  # (table_widget)
+    signal_group_created = Signal(str, object)  # (group_name, table_widget)
+    signal_group_edited = Signal(str, str, object)  # (group_name, "add" or "remove", table_widget)
+    signal_group_deleted = Signal(str, object)  # (group_name, table_widget)
+    signal_group_changed = Signal(str, object)  # (group_name, table_widget)
+    signal_group_selected = Signal(str, object)  # (group_name, table_widget)
+    signal_group_muted = Signal(str, bool, object)  # (group_name, muted, table_widget)
+    signal_group_soloed = Signal(str, bool, object)  # (group_name, soloed, table_widget)
+    signal_multi_solo = Signal(bool)  # (enabled)
+    signal_preset_saved = Signal(str, object)  # (file_path, table_widget)
+    signal_preset_loaded = Signal(str, object)  # (file_path, table_widget)
+    signal_lights_exported = Signal(str, str, object)  # (file_path, export_format, table_widget)
+    signal_lights_batch_created = Signal(str, str, str, object, object)  # (light_name, light_type, layout, options, table_widget)
+    signal_lights_bulk_renamed = Signal(str, object, object)  # (mode, options, table_widget)
+    signal_overlap_analysis = Signal(int, object)  # (shadow_threshold, table_widget)
+    signal_rows_sorted = Signal(object)  # (table_widget)
+    signal_spatial_filter = Signal(str, str, float, object)  # (target, mode, distance, table_widget)
+    signal_level_filter = Signal(str, object)  # (level_name, table_widget)
+    signal_column_toggled = Signal(str, bool, object)  # (attribute_key, shown, table_widget)
+    signal_undo = Signal(object)  # (table_widget)
+    signal_redo = Signal(object)  # (table_widget)
+    signal_closed = Signal()
+    signal_profiling_toggled = Signal(bool)  # (enabled)
+    signal_profile_reset = Signal()
+    signal_profile_saved = Signal(str, str)  # (file_path, "json" or "cprofile")
 
     LIGHT_TYPES = [
         "SkyLight",
@@ -50,8 +117,10 @@ class LightManagerUI(QWidget):
         """
         self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)  # KEEP WINDOW ON TOP
         self.setWindowTitle("Unreal Light Manager")
-        self.setMinimumSize(775, 690)
-        self.setMaximumSize(775, 690)
+        self.setMinimumSize(775, 725)
+        self.setMaximumSize(775, 725)
+        self.setFont(QFont(FONT, FONT_SIZE))  # INHERITED BY EVERY CHILD WIDGET
+        self.setStyleSheet(STYLE_SHEET)
 
         self.logo = QLabel()
         self.logo.setAlignment(Qt.AlignCenter)
@@ -60,69 +129,215 @@ class LightManagerUI(QWidget):
         self.entry_light_name = self.bar_text("Name your light", 160)
 
         self.info_text = self.label_text("Light Manager initialized")
+        self.info_text.setObjectName("info")
         self.info_text.setFont(QFont(FONT, 9))
 
-        title_ligh_search = self.label_text("Search by name:")
-        self.entry_ligh_search = self.bar_text("Type light name to search", 750)
+        title_ligh_search = self.label_text("Search:")
+        self.entry_ligh_search = self.bar_text(
+            "Name, *glob*, /regex/, type:SpotLight, group:Key, intensity>500, channel1, muted...", 750)
+        self.entry_ligh_search.setToolTip(
+            "Terms separated by spaces must all match:\n"
+            "  key               name contains 'key'\n"
+            "  key*_0?           glob on the name\n"
+            "  /regex/  re:regex regular expression on the name\n"
+            "  type:spot         light type\n"
+            "  group:Key         member of a light group\n"
+            "  level:Sub_A       placed in a level or streaming sublevel\n"
+            "  intensity>500     compare intensity, temp, radius or overlaps (< <= > >= = !=)\n"
+            "  channel1  muted   flags (channel0-2, muted, visible, solo, usetemp, shadows), '!' negates")
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY_MS)
+
+        # LEVEL FILTER, ON TOP OF THE SEARCH: THE PERSISTENT LEVEL AND ITS STREAMING SUBLEVELS
+        title_level = self.label_text("Level:")
+        self.combo_level = QComboBox()
+        self.combo_level.setFixedWidth(150)
+        self.combo_level.setToolTip("Only lists the lights of one level, an unloaded level is loaded when picked")
+        self.set_levels([])
+
+        # SPATIAL FILTER, ON TOP OF THE SEARCH
+        title_spatial = self.label_text("Near:")
+        self.combo_spatial_target = self.combo_list(SPATIAL_TARGETS)
+        self.combo_spatial_target.setToolTip("Only lists the lights near the viewport camera or the selected actors")
+        self.combo_spatial_mode = QComboBox()
+        self.combo_spatial_mode.addItems(list(SPATIAL_MODES))  # "Within" FIRST, NOT SORTED
+        self.combo_spatial_mode.setToolTip("Within: the light is within the distance of the camera or selection\n"
+                                           "Radius reaches: the attenuation radius of the light reaches it")
+        self.spin_spatial_distance = QDoubleSpinBox(decimals=0, minimum=0.0, maximum=1e7, singleStep=500.0, suffix=" u")
+        self.spin_spatial_distance.setValue(SPATIAL_DISTANCE)
+        self.spin_spatial_distance.setKeyboardTracking(False)  # FILTERS ONCE THE DISTANCE IS TYPED, NOT PER DIGIT
+        self.spin_spatial_distance.setFixedWidth(90)
+        self.combo_spatial_mode.setEnabled(False)
+        self.spin_spatial_distance.setEnabled(False)
 
         title_light_type = self.label_text("Light Type:")
         self.combo_light_type = self.combo_list(self.LIGHT_TYPES)  # COMBO BOX DRIVEN BY DICT
 
-        self.button_create_light = self.push_button("Create Light")
-        self.button_create_light.setStyleSheet(" background-color: #2a9d8f ; color: black;")
+        self.button_create_light = self.push_button("Create Light", "create_light")
+        self.button_refresh = self.push_button("Refresh", "refresh")
 
-        self.button_refresh = self.push_button("Refresh")
-        self.button_refresh.setStyleSheet(" background-color: #8ecae6 ; color: black;")
-
-        self.button_render = self.push_button(" Simulate ")
+        self.button_render = self.push_button(" Simulate ", "render")
         self.button_render.setFixedSize(70, 30)
         self.button_render.setContentsMargins(0, 0, 0, 0)
         self.button_render.setLayoutDirection(Qt.RightToLeft)  # SET THE BUTTON TO POINT RIGHT
-        self.button_render.setStyleSheet(" background-color: #FFC107 ; color: black;")
 
-        self.button_rename = self.push_button("Rename Light")
-        self.button_rename.setStyleSheet(" background-color: #D17D98 ; color: white;")
+        # UNDO / REDO OF THE EDITS MADE THROUGH THE TOOL, ALSO ON CTRL+Z / CTRL+Y OUTSIDE OF A TEXT FIELD
+        self.button_undo = self.push_button("Undo")
+        self.button_redo = self.push_button("Redo")
+        for button in (self.button_undo, self.button_redo):
+            button.setFixedWidth(62)
+        self.shortcut_undo = QShortcut(QKeySequence.Undo, self)
+        self.shortcut_redo = QShortcut(QKeySequence.Redo, self)
+        self.set_history_state(None, None)
+
+        self.button_rename = self.push_button("Rename Light", "rename")
+        self.button_batch_create = self.push_button("Batch Create...")
+        self.button_bulk_rename = self.push_button("Bulk Rename...")
+        self.button_preset_save = self.push_button("Save Rig...")
+        self.button_preset_load = self.push_button("Load Rig...")
+        self.button_export = self.push_button("Export...")
+        self.button_export.setToolTip("Writes every attribute of the selected lights, or of the listed ones when none "
+                                      "is selected, to a CSV or JSON Lines report")
+        self.button_overlaps = self.push_button("Overlaps...")
+        self.button_overlaps.setToolTip("Counts the overlapping attenuation radii and reports where the lights stack up")
+        self.button_delete = self.push_button("Delete", "delete")
 
-        self.button_delete = self.push_button("Delete")
-        self.button_delete.setStyleSheet(" background-color: #c1121f ; color: white;")
+        # LIGHT GROUPS
+        title_group = self.label_text("Group:")
+        self.combo_group = QComboBox()
+        self.combo_group.setFixedWidth(130)
+        self.button_group_new = self.push_button("New")
+        self.button_group_add = self.push_button("Add")
+        self.button_group_remove = self.push_button("Remove")
+        self.button_group_select = self.push_button("Select")
+        self.button_group_mute = self.push_button("Mute")
+        self.button_group_mute.setCheckable(True)
+        self.button_group_solo = self.push_button("Solo")
+        self.button_group_solo.setCheckable(True)
+        self.button_group_delete = self.push_button("Delete")
+        self.checkbox_multi_solo = QCheckBox("Multi Solo")
 
-        self.light_table = QTableWidget()
-        # SELECT ONLY ONE ROW AT A TIME
-        self.light_table.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.light_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # MAKE CELLS NON-EDITABLE
-        self.light_table.setStyleSheet("QTableWidget { background-color: #222b33 ; color: white; }")
+        # PROFILING STATS, COLLAPSED BY DEFAULT
+        self.button_stats = QToolButton(text="Profiling stats", checkable=True)
+        self.button_stats.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+        self.button_stats.setArrowType(Qt.RightArrow)
+        self.button_stats.setAutoRaise(True)
+        self.checkbox_profiling = QCheckBox("Enable profiling")
+        self.button_profile_reset = self.push_button("Reset")
+        self.button_profile_json = self.push_button("Save JSON...")
+        self.button_profile_cprofile = self.push_button("Save cProfile...")
+        self.text_stats = QPlainTextEdit(readOnly=True)
+        self.text_stats.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.text_stats.setFont(QFont("monospace", 9))
+        self.text_stats.setPlainText("Enable profiling to record the duration, unreal calls and widgets of each operation.")
+        self.widget_counter = WidgetCounter(self)
+
+        self.progress_lights = QProgressBar()  # SHOWN WHILE THE LIGHTS ARE READ
+        self.progress_lights.setFixedHeight(12)
+        self.progress_lights.setTextVisible(False)
+        size_policy = self.progress_lights.sizePolicy()
+        size_policy.setRetainSizeWhenHidden(True)  # THE TABLE DOES NOT JUMP WHEN THE BAR SHOWS UP
+        self.progress_lights.setSizePolicy(size_policy)
+        self.progress_lights.setVisible(False)
+
+        self.light_model = LightTableModel(TABLE_HEADER, self)
+        self.light_table = LightTableView()
+        self.light_table.setModel(self.light_model)
+        # SHIFT/CTRL SELECT SEVERAL ROWS, AN EDIT ON ONE OF THEM IS APPLIED TO THE WHOLE SELECTION
+        self.light_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.light_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # EDITORS ARE ONLY CREATED FOR THE CELL BEING EDITED
+        self.light_table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked |
+                                         QAbstractItemView.EditKeyPressed)
+        self.light_table.verticalHeader().setDefaultSectionSize(30)
+        header = self.light_table.horizontalHeader()
         for y in range(len(TABLE_HEADER)):
-            self.light_table.setColumnCount(y+1)
-            self.light_table.setHorizontalHeaderLabels(TABLE_HEADER)  # SET THE HEADER LABELS
-            header = self.light_table.horizontalHeader()
             header.resizeSection(y, HEADER_SIZE[y])
+        # A CLICK ON A HEADER SORTS THE ROWS, BY NAME UNTIL THEN
+        header.setSortIndicator(COLUMN_KEYS.index("label"), Qt.AscendingOrder)
+        self.light_table.setSortingEnabled(True)
+        # A RIGHT CLICK ON THE HEADER SHOWS OR HIDES THE COLUMNS
+        header.setContextMenuPolicy(Qt.CustomContextMenu)
+        for column, attribute_column in enumerate(ATTRIBUTE_COLUMNS):
+            self.light_table.setColumnHidden(column, not attribute_column.visible)
 
-        group_box_01 = QGroupBox()
-        group_box_02 = QGroupBox()
-        group_box_01.setStyleSheet(
-            "QGroupBox { border: 1px solid grey; border-radius: 3px; padding: 20px; padding-top: 1px;padding-bottom: 2px;}")
-        group_box_02.setStyleSheet(
-            "QGroupBox { border: 1px solid grey; border-radius: 3px; padding: 3px;}")
+        # DELEGATES ARE KEPT ON SELF, THE VIEW DOES NOT OWN THEM
+        self.mute_delegate = CheckBoxDelegate(self.light_table, unchecked_color="#f94144")
+        self.solo_delegate = CheckBoxDelegate(self.light_table, checked_color="#adb5bd")
+        self.check_delegate = CheckBoxDelegate(self.light_table)
+        self.color_delegate = ColorDelegate(self.light_table)
+        self.numeric_delegate = NumericDelegate(self.light_table)
+        editor_delegates = {"mute": self.mute_delegate, "solo": self.solo_delegate, "check": self.check_delegate,
+                            "color": self.color_delegate, "numeric": self.numeric_delegate}
+        for column, attribute_column in enumerate(ATTRIBUTE_COLUMNS):
+            if attribute_column.editor in editor_delegates:
+                self.light_table.setItemDelegateForColumn(column, editor_delegates[attribute_column.editor])
+
+        group_box_01 = QGroupBox(objectName="create_box")
+        group_box_02 = QGroupBox(objectName="table_box")
         layoutV_01 = QVBoxLayout()
         layoutV_02 = QVBoxLayout()
-        layoutV_01_01 = QVBoxLayout()
+        layoutH_01 = QHBoxLayout()
         layoutH_02 = QHBoxLayout()
         layoutH_03 = QHBoxLayout()
+        layoutH_04 = QHBoxLayout()
+        layoutH_05 = QHBoxLayout()
 
-        layoutV_01_01.addWidget(self.button_render)
+        layoutH_01.addWidget(self.button_render)
+        layoutH_01.addStretch()
+        layoutH_01.addWidget(self.button_export)
+        layoutH_01.addWidget(self.button_undo)
+        layoutH_01.addWidget(self.button_redo)
         layoutH_02.addWidget(title_light_name)
         layoutH_02.addWidget(self.entry_light_name)
         layoutH_02.addWidget(title_light_type)
         layoutH_02.addWidget(self.combo_light_type)
         layoutH_03.addWidget(self.button_create_light)
+        layoutH_03.addWidget(self.button_batch_create)
         layoutH_03.addWidget(self.button_rename)
-        layoutV_02.addWidget(title_ligh_search)
+        layoutH_03.addWidget(self.button_bulk_rename)
+        layoutH_03.addWidget(self.button_preset_save)
+        layoutH_03.addWidget(self.button_preset_load)
+        layoutH_03.addWidget(self.button_overlaps)
+        layoutH_04.addWidget(title_group)
+        layoutH_04.addWidget(self.combo_group)
+        for button in (self.button_group_new, self.button_group_add, self.button_group_remove, self.button_group_select,
+                       self.button_group_mute, self.button_group_solo, self.button_group_delete):
+            button.setFixedWidth(62)
+            layoutH_04.addWidget(button)
+        layoutH_04.addWidget(self.checkbox_multi_solo)
+        layoutV_02.addLayout(layoutH_04)
+        layoutH_05.addWidget(title_ligh_search)
+        layoutH_05.addStretch()
+        layoutH_05.addWidget(title_level)
+        layoutH_05.addWidget(self.combo_level)
+        layoutH_05.addWidget(title_spatial)
+        layoutH_05.addWidget(self.combo_spatial_target)
+        layoutH_05.addWidget(self.combo_spatial_mode)
+        layoutH_05.addWidget(self.spin_spatial_distance)
+        layoutV_02.addLayout(layoutH_05)
         layoutV_02.addWidget(self.entry_ligh_search)
         layoutV_02.addWidget(self.light_table)
+        layoutV_02.addWidget(self.progress_lights)
         layoutV_02.addWidget(self.button_refresh)
         layoutV_02.addWidget(self.button_delete)
 
-        layoutV_01.addLayout(layoutV_01_01)
+        self.stats_panel = QWidget()
+        layoutV_stats = QVBoxLayout(self.stats_panel)
+        layoutV_stats.setContentsMargins(0, 0, 0, 0)
+        layoutH_stats = QHBoxLayout()
+        layoutH_stats.addWidget(self.checkbox_profiling)
+        layoutH_stats.addStretch()
+        layoutH_stats.addWidget(self.button_profile_reset)
+        layoutH_stats.addWidget(self.button_profile_json)
+        layoutH_stats.addWidget(self.button_profile_cprofile)
+        layoutV_stats.addLayout(layoutH_stats)
+        layoutV_stats.addWidget(self.text_stats)
+        self.stats_panel.setFixedHeight(STATS_PANEL_HEIGHT)
+        self.stats_panel.setVisible(False)
+
+        layoutV_01.addLayout(layoutH_01)
         layoutV_01.addLayout(layoutH_02)
         layoutV_01.addLayout(layoutH_03)
 
@@ -133,31 +348,34 @@ class LightManagerUI(QWidget):
         # self.main_layout.addWidget(self.logo)  # DISABLED LOGO
         self.main_layout.addWidget(group_box_01)
         self.main_layout.addWidget(group_box_02)
+        self.main_layout.addWidget(self.button_stats)
+        self.main_layout.addWidget(self.stats_panel)
         self.main_layout.addWidget(self.info_text)
 
         self.main_layout.setAlignment(Qt.AlignCenter)
         self.setLayout(self.main_layout)
 
+    def closeEvent(self, event: QEvent):
+        """ Emits the `signal_closed`, the logic stops following the level. """
+        self.signal_closed.emit()
+        super().closeEvent(event)
+
     # GENERIC WIDGETS --------------------------------------------
     def label_text(self, text: str) -> QLabel:
-        """ Creates a QLabel with standardized font and color. 
+        """ Creates a QLabel, its font and color come from the window.
         Args:
             text (str): The text to display in the label.
         """
-        label = QLabel(text=text)
-        label.setFont(QFont(FONT, FONT_SIZE))
-        label.setStyleSheet(f"color:{COLOR}")
-        return label
+        return QLabel(text=text)
 
     def bar_text(self, text: str = None, length=20) -> QLineEdit:
-        """ Creates a QLineEdit with standardized font and size.
+        """ Creates a QLineEdit with standardized size.
         Args:
             text (str, optional): Placeholder text for the line edit. Defaults to None.
             length (int, optional): The width of the line edit. Defaults to 20.
         """
         line_edit = QLineEdit(placeholderText=text)
         line_edit.setFixedSize(QSize(length, 25))
-        line_edit.setFont(QFont(FONT, FONT_SIZE))
         return line_edit
 
     def combo_list(self, light_list: list) -> QComboBox:
@@ -166,18 +384,18 @@ class LightManagerUI(QWidget):
             light_list (list): A list of strings to add as items to the combo box.
         """
         combo_box = QComboBox()
-        for light in sorted(light_list):
-            combo_box.addItem(light)
-            combo_box.setFont(QFont(FONT, FONT_SIZE))
+        combo_box.addItems(sorted(light_list))
         return combo_box
 
-    def push_button(self, text: str) -> QPushButton:
-        """Creates a QPushButton with a standardized font.
+    def push_button(self, text: str, name: str = None) -> QPushButton:
+        """Creates a QPushButton, its font comes from the window.
         Args:
             text (str): The text to display on the button.
+            name (str, optional): The object name, which selects the button style in STYLE_SHEET.
         """
         button = QPushButton(text)
-        button.setFont(QFont(FONT, FONT_SIZE))
+        if name:
+            button.setObjectName(name)
         return button
 
     # SIGNALS --------------------------------------------
@@ -190,9 +408,48 @@ class LightManagerUI(QWidget):
         self.button_rename.clicked.connect(self.emit_light_renamed)
         self.button_refresh.clicked.connect(self.emit_refresh)
         self.button_delete.clicked.connect(self.emit_light_deleted)
-        self.light_table.itemSelectionChanged.connect(
+        self.light_table.selectionModel().selectionChanged.connect(
             self.emit_table_selection)
-        self.entry_ligh_search.textChanged.connect(self.emit_light_search)
+        self.light_model.signal_edit_requested.connect(self.emit_light_edited)
+        self.light_model.signal_rows_sorted.connect(self.emit_rows_sorted)
+        self.numeric_delegate.signal_scrubbed.connect(self.emit_light_scrubbed)
+        self.numeric_delegate.signal_scrub_finished.connect(self.emit_scrub_finished)
+        self.entry_ligh_search.textChanged.connect(self.search_timer.start)  # DEBOUNCE
+        self.search_timer.timeout.connect(self.emit_light_search)
+        self.combo_level.activated.connect(self.emit_level_filter)
+        self.combo_spatial_target.currentTextChanged.connect(self.emit_spatial_filter)
+        self.combo_spatial_mode.currentTextChanged.connect(self.emit_spatial_filter)
+        self.spin_spatial_distance.valueChanged.connect(self.emit_spatial_filter)
+        self.button_group_new.clicked.connect(self.emit_group_created)
+        self.button_group_add.clicked.connect(lambda: self.emit_group_edited("add"))
+        self.button_group_remove.clicked.connect(lambda: self.emit_group_edited("remove"))
+        self.button_group_delete.clicked.connect(self.emit_group_deleted)
+        self.button_group_select.clicked.connect(self.emit_group_selected)
+        self.button_group_mute.clicked.connect(self.emit_group_muted)
+        self.button_group_solo.clicked.connect(self.emit_group_soloed)
+        self.combo_group.currentTextChanged.connect(self.emit_group_changed)
+        self.checkbox_multi_solo.toggled.connect(self.signal_multi_solo.emit)
+        self.button_batch_create.clicked.connect(self.emit_lights_batch_created)
+        self.button_bulk_rename.clicked.connect(self.emit_lights_bulk_renamed)
+        self.button_preset_save.clicked.connect(self.emit_preset_saved)
+        self.button_preset_load.clicked.connect(self.emit_preset_loaded)
+        self.button_export.clicked.connect(self.emit_lights_exported)
+        self.button_overlaps.clicked.connect(self.emit_overlap_analysis)
+        self.light_table.horizontalHeader().customContextMenuRequested.connect(self.show_column_menu)
+        self.button_undo.clicked.connect(self.emit_undo)
+        self.button_redo.clicked.connect(self.emit_redo)
+        self.shortcut_undo.activated.connect(self.emit_undo)
+        self.shortcut_redo.activated.connect(self.emit_redo)
+        self.button_stats.toggled.connect(self.toggle_stats_panel)
+        self.checkbox_profiling.toggled.connect(self.emit_profiling_toggled)
+        self.button_profile_reset.clicked.connect(self.signal_profile_reset.emit)
+        self.button_profile_json.clicked.connect(lambda: self.emit_profile_saved("json"))
+        self.button_profile_cprofile.clicked.connect(lambda: self.emit_profile_saved("cprofile"))
+
+    def selected_light_names(self) -> list:
+        """ Returns the names of the lights selected in the table. """
+        labels = self.light_model.rows.labels
+        return [labels[self.light_model.source_row(row)] for row in self.light_table.selected_view_rows()]
 
     # EMITTERS --------------------------------------
     def emit_light_created(self):
@@ -212,8 +469,9 @@ class LightManagerUI(QWidget):
         from the input field, then emits the `signal_light_renamed`.
         Clears the light name field.
         """
-        if self.light_table.selectedItems():
-            self.old_name = self.light_table.currentItem().text()
+        selection = self.selected_light_names()
+        if selection:
+            self.old_name = selection[0]
             self.new_name = self.entry_light_name.text()
             self.signal_light_renamed.emit(
                 self.old_name, self.new_name, self.light_table)
@@ -224,10 +482,11 @@ class LightManagerUI(QWidget):
         Confirms with the user and then emits the `signal_light_deleted`
         for the currently selected light.
         """
-        if self.light_table.selectedItems():
-            selection = self.light_table.currentItem().text()
+        selection = self.selected_light_names()
+        if selection:
+            target = selection[0] if len(selection) == 1 else f"these {len(selection)} lights"
             btn_question = QMessageBox.question(
-                self, "Question", f"Are you sure you want to delete {selection} ?")
+                self, "Question", f"Are you sure you want to delete {target} ?")
             if btn_question == QMessageBox.Yes:
                 self.signal_light_deleted.emit(self.light_table)
             else:
@@ -241,6 +500,21 @@ class LightManagerUI(QWidget):
         search_text = self.entry_ligh_search.text()
         self.signal_light_search.emit(search_text, self.light_table)
 
+    def emit_spatial_filter(self):
+        """
+        Gathers the target, the mode and the distance of the spatial filter and emits the `signal_spatial_filter`.
+        The distance only applies to the "Within" mode.
+        """
+        target = SPATIAL_TARGETS[self.combo_spatial_target.currentText()]
+        mode = SPATIAL_MODES[self.combo_spatial_mode.currentText()]
+        self.combo_spatial_mode.setEnabled(bool(target))
+        self.spin_spatial_distance.setEnabled(bool(target) and mode == "within")
+        self.signal_spatial_filter.emit(target, mode, self.spin_spatial_distance.value(), self.light_table)
+
+    def emit_level_filter(self):
+        """ Emits the `signal_level_filter` with the picked level, "" for every level. """
+        self.signal_level_filter.emit(self.combo_level.currentData() or "", self.light_table)
+
     def emit_table_selection(self):
         """ Emits the `signal_table_selection` when the table selection changes. """
         self.signal_table_selection.emit(self.light_table)
@@ -249,16 +523,258 @@ class LightManagerUI(QWidget):
         """ Emits the `signal_refresh. """
         self.signal_refresh.emit(self.light_table)
 
+    def emit_light_edited(self, row: int, attribute_key: str, value: object):
+        """ Emits the `signal_light_edited` when a cell of the table is edited. """
+        self.signal_light_edited.emit(row, attribute_key, value, self.light_table)
+
+    def emit_light_scrubbed(self, row: int, attribute_key: str, value: float):
+        """ Emits the `signal_light_scrubbed` on each mouse wheel tick of a numeric cell editor. """
+        self.signal_light_scrubbed.emit(row, attribute_key, value, self.light_table)
+
+    def emit_scrub_finished(self):
+        """ Emits the `signal_scrub_finished` when a numeric cell editor is closed. """
+        self.signal_scrub_finished.emit(self.light_table)
+
+    def emit_group_created(self):
+        """ Asks for a group name and emits the `signal_group_created` to group the selected lights. """
+        group_name, accepted = QInputDialog.getText(self, "New Group", "Group name:")
+        if accepted and group_name.strip():
+            self.signal_group_created.emit(group_name.strip(), self.light_table)
+
+    def emit_group_edited(self, action: str):
+        """ Emits the `signal_group_edited` to add or remove the selected lights from the current group. """
+        if self.combo_group.currentText():
+            self.signal_group_edited.emit(self.combo_group.currentText(), action, self.light_table)
+
+    def emit_group_deleted(self):
+        """ Emits the `signal_group_deleted` for the current group. """
+        if self.combo_group.currentText():
+            self.signal_group_deleted.emit(self.combo_group.currentText(), self.light_table)
+
+    def emit_group_changed(self, group_name: str):
+        """ Emits the `signal_group_changed` when another group is picked. """
+        self.signal_group_changed.emit(group_name, self.light_table)
+
+    def emit_group_selected(self):
+        """ Emits the `signal_group_selected` to select the lights of the current group. """
+        if self.combo_group.currentText():
+            self.signal_group_selected.emit(self.combo_group.currentText(), self.light_table)
+
+    def emit_group_muted(self, muted: bool):
+        """ Emits the `signal_group_muted` when the group Mute button is toggled. """
+        if self.combo_group.currentText():
+            self.signal_group_muted.emit(self.combo_group.currentText(), muted, self.light_table)
+
+    def emit_group_soloed(self, soloed: bool):
+        """ Emits the `signal_group_soloed` when the group Solo button is toggled. """
+        if self.combo_group.currentText():
+            self.signal_group_soloed.emit(self.combo_group.currentText(), soloed, self.light_table)
+
+    def emit_lights_batch_created(self):
+        """
+        Asks for a layout and emits the `signal_lights_batch_created` to create several lights
+        of the type and name set in the creation fields.
+        """
+        dialog = BatchCreateDialog(self)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        light_name = self.entry_light_name.text()
+        light_type = self.combo_light_type.currentText()
+        self.signal_lights_batch_created.emit(light_name, light_type, dialog.combo_layout.currentText(),
+                                              dialog.options(), self.light_table)
+
+    def emit_lights_bulk_renamed(self):
+        """
+        Asks for a rename pattern and emits the `signal_lights_bulk_renamed` to rename
+        the selected lights, or every listed light when none is selected.
+        """
+        labels = self.selected_light_names()
+        if not labels:
+            labels = [self.light_model.rows.labels[self.light_model.source_row(row)]
+                      for row in range(self.light_model.rowCount())]
+        if not labels:
+            return
+        dialog = BulkRenameDialog(labels, self)
+        if dialog.exec() == QDialog.Accepted:
+            self.signal_lights_bulk_renamed.emit(dialog.combo_mode.currentText(), dialog.options(), self.light_table)
+
+    def emit_preset_saved(self):
+        """ Asks for a preset file and emits the `signal_preset_saved` to save the selected or all lights. """
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Light Rig", "", PRESET_FILTER)
+        if file_path:
+            self.signal_preset_saved.emit(file_path, self.light_table)
+
+    def emit_preset_loaded(self):
+        """ Asks for a preset file and emits the `signal_preset_loaded`. """
+        file_path, _ = QFileDialog.getOpenFileName(self, "Load Light Rig", "", PRESET_FILTER)
+        if file_path:
+            self.signal_preset_loaded.emit(file_path, self.light_table)
+
+    def emit_lights_exported(self):
+        """ Asks for a report file, its format picked by the file type, and emits the `signal_lights_exported`. """
+        file_path, selected_filter = QFileDialog.getSaveFileName(self, "Export Lights", "", ";;".join(EXPORT_FILTERS))
+        if file_path:
+            self.signal_lights_exported.emit(file_path, EXPORT_FILTERS.get(selected_filter, "csv"), self.light_table)
+
+    def emit_overlap_analysis(self):
+        """ Asks for the overlap threshold of the shadow casting lights and emits the `signal_overlap_analysis`. """
+        threshold, accepted = QInputDialog.getInt(
+            self, "Overlap Analysis", "Report the shadow casting lights overlapping more than:",
+            OVERLAP_THRESHOLD, 0, 100000)
+        if accepted:
+            self.signal_overlap_analysis.emit(threshold, self.light_table)
+
+    def show_column_menu(self, position: object):
+        """ Lists every column but the name in a menu under the mouse, to show or hide them. """
+        menu = QMenu(self)
+        for column, attribute_column in enumerate(ATTRIBUTE_COLUMNS):
+            if attribute_column.key == "label":
+                continue
+            action = menu.addAction(attribute_column.header)
+            action.setCheckable(True)
+            action.setChecked(not self.light_table.isColumnHidden(column))
+            action.toggled.connect(lambda shown, key=attribute_column.key: self.emit_column_toggled(key, shown))
+        menu.exec(self.light_table.horizontalHeader().mapToGlobal(position))
+        menu.deleteLater()
+
+    def emit_column_toggled(self, key: str, shown: bool):
+        """ Shows or hides a column and emits the `signal_column_toggled`, the logic fetches the values it lacks. """
+        self.light_table.setColumnHidden(COLUMN_KEYS.index(key), not shown)
+        self.signal_column_toggled.emit(key, shown, self.light_table)
+
+    def emit_undo(self):
+        """ Emits the `signal_undo`, when there is an edit to undo. """
+        if self.button_undo.isEnabled():
+            self.signal_undo.emit(self.light_table)
+
+    def emit_redo(self):
+        """ Emits the `signal_redo`, when there is an edit to redo. """
+        if self.button_redo.isEnabled():
+            self.signal_redo.emit(self.light_table)
+
+    def emit_rows_sorted(self):
+        """ Emits the `signal_rows_sorted` when a click on a header re-ordered the rows. """
+        self.signal_rows_sorted.emit(self.light_table)
+
+    def emit_profiling_toggled(self, enabled: bool):
+        """ Counts the created widgets while profiling, and emits the `signal_profiling_toggled`. """
+        self.widget_counter.set_enabled(enabled)
+        self.signal_profiling_toggled.emit(enabled)
+
+    def emit_profile_saved(self, output_format: str):
+        """ Asks for an output file and emits the `signal_profile_saved`. """
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Profile", "", PROFILE_FILTERS[output_format])
+        if file_path:
+            self.signal_profile_saved.emit(file_path, output_format)
+
+    def toggle_stats_panel(self, expanded: bool):
+        """ Expands or collapses the stats panel, the fixed size window grows to make room for it. """
+        self.button_stats.setArrowType(Qt.DownArrow if expanded else Qt.RightArrow)
+        self.stats_panel.setVisible(expanded)
+        height = self.maximumHeight() + (STATS_PANEL_HEIGHT if expanded else -STATS_PANEL_HEIGHT)
+        self.setMinimumHeight(height)
+        self.setMaximumHeight(height)
+
+    def set_progress(self, done: int, total: int):
+        """ Shows how many lights were read, the progress bar is hidden once `done` reaches `total`. """
+        if done >= total:
+            self.progress_lights.setVisible(False)
+            return
+        self.progress_lights.setMaximum(total)
+        self.progress_lights.setValue(done)
+        self.progress_lights.setVisible(True)
+
+    def show_report(self, title: str, text: str):
+        """ Shows a multi-line report in a message box. """
+        QMessageBox.information(self, title, text)
+
+    def set_profile_stats(self, text: str):
+        """ Shows the profiling stats. """
+        self.text_stats.setPlainText(text)
+
+    def set_groups(self, group_names: list, current: str = None):
+        """ Fills the group combo box, keeping or setting the current group. """
+        current = current or self.combo_group.currentText()
+        self.combo_group.blockSignals(True)
+        self.combo_group.clear()
+        self.combo_group.addItems(group_names)
+        if current in group_names:
+            self.combo_group.setCurrentText(current)
+        self.combo_group.blockSignals(False)
+        self.emit_group_changed(self.combo_group.currentText())
+
+    def set_levels(self, levels: list, current: str = None):
+        """
+        Fills the level combo box, keeping the current level.
+        Args:
+            levels (list): (level name, number of lights listed, loaded) per level.
+            current (str, optional): The level to show as current, None for every level.
+        """
+        self.combo_level.blockSignals(True)
+        self.combo_level.clear()
+        self.combo_level.addItem("All levels", "")
+        for level, light_count, loaded in levels:
+            self.combo_level.addItem(f"{level} ({light_count})" if loaded else f"{level} (unloaded)", level)
+        self.combo_level.setCurrentIndex(max(self.combo_level.findData(current or ""), 0))
+        self.combo_level.blockSignals(False)
+
+    def set_history_state(self, undo_text: str, redo_text: str):
+        """ Enables the Undo and Redo buttons, their tooltip tells what they would do. None disables a button. """
+        self.button_undo.setEnabled(undo_text is not None)
+        self.button_undo.setToolTip(undo_text or "Nothing to undo")
+        self.button_redo.setEnabled(redo_text is not None)
+        self.button_redo.setToolTip(redo_text or "Nothing to redo")
+
+    def set_group_state(self, muted: bool, soloed: bool):
+        """ Reflects the state of the current group on the Mute and Solo buttons. """
+        self.button_group_mute.setChecked(muted)
+        self.button_group_solo.setChecked(soloed)
+
+
+class WidgetCounter(QObject):
+    """
+    Counts the widgets created in the application, from the child-added events of their parents.
+    Filtering every event of the application has a cost, so the filter is only installed while profiling.
+    """
+
+    def __init__(self, parent: QObject = None):
+        super().__init__(parent)
+        self.created = 0
+        self.installed = False
+
+    def count(self) -> int:
+        """ Returns the number of widgets created while counting. """
+        return self.created
+
+    def set_enabled(self, enabled: bool):
+        """ Installs or removes the application event filter. """
+        app = QApplication.instance()
+        if app is None or enabled == self.installed:
+            return
+        if enabled:
+            app.installEventFilter(self)
+        else:
+            app.removeEventFilter(self)
+        self.installed = enabled
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == CHILD_ADDED and event.child().isWidgetType():
+            self.created += 1
+        return False
+
 
 class CustomLineEditNum(QLineEdit):
     """
     A custom QLineEdit that allows numerical values to be adjusted using the mouse wheel.
     It supports different step sizes based on keyboard modifiers (Ctrl, Shift).
+    Each wheel tick emits `signal_value_scrubbed` so the value can be previewed live.
     """
 
-    def __init__(self,):
+    signal_value_scrubbed = Signal(float)  # (new_value)
+
+    def __init__(self, parent: QWidget = None):
         """Initializes the QLineEdit and sets the default text."""
-        super().__init__()
+        super().__init__(parent)
         self.setText("0.000")
 
     def wheelEvent(self, event: QWheelEvent):
@@ -278,10 +794,363 @@ class CustomLineEditNum(QLineEdit):
             super().wheelEvent(event)
             return
 
-        current_value = float(self.text())
-        delta = event.angleDelta().y() / 120
-        new_value = current_value + delta * step
         try:
-            self.setText(f"{new_value:.3f}")
+            current_value = float(self.text())
         except ValueError:
-            pass
+            return
+        delta = event.angleDelta().y() / 120
+        new_value = round(current_value + delta * step, 3)
+        self.setText(f"{new_value:.3f}")
+        self.signal_value_scrubbed.emit(new_value)
+
+
+class BatchCreateDialog(QDialog):
+    """
+    Asks how to lay out a batch of new lights: on a grid, on a ring, along the actors
+    selected in the level, or at the positions listed in a CSV file.
+    """
+
+    def __init__(self, parent: QWidget = None):
+        super().__init__(parent)
+        self.setWindowTitle("Batch Create Lights")
+        self.combo_layout = QComboBox()
+        self.combo_layout.addItems(BATCH_LAYOUTS)
+        self.spin_count = QSpinBox()
+        self.spin_count.setRange(1, 100000)
+        self.spin_count.setValue(10)
+        self.spin_spacing = QDoubleSpinBox()
+        self.spin_spacing.setRange(0.0, 1000000.0)
+        self.spin_spacing.setValue(200.0)
+        self.spin_spacing.setToolTip("Distance between two lights of a grid, radius of a ring.")
+        self.spin_height = QDoubleSpinBox()
+        self.spin_height.setRange(-1000000.0, 1000000.0)
+        self.spin_height.setValue(100.0)
+        self.spin_height.setToolTip("Height above the selected actors, or above the world origin.")
+        self.entry_csv = QLineEdit(placeholderText="x, y, z[, roll, pitch, yaw] per line")
+        button_browse = QPushButton("...")
+        button_browse.setFixedWidth(30)
+        button_browse.clicked.connect(self.browse_csv)
+        layout_csv = QHBoxLayout()
+        layout_csv.addWidget(self.entry_csv)
+        layout_csv.addWidget(button_browse)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+
+        layout = QFormLayout(self)
+        layout.addRow("Layout:", self.combo_layout)
+        layout.addRow("Count:", self.spin_count)
+        layout.addRow("Spacing / Radius:", self.spin_spacing)
+        layout.addRow("Height:", self.spin_height)
+        layout.addRow("CSV File:", layout_csv)
+        layout.addRow(buttons)
+
+    def browse_csv(self):
+        """ Picks the CSV file of positions. """
+        file_path, _ = QFileDialog.getOpenFileName(self, "Light Positions", "", "CSV file (*.csv *.txt)")
+        if file_path:
+            self.entry_csv.setText(file_path)
+            self.combo_layout.setCurrentText("CSV")
+
+    def options(self) -> dict:
+        """ Returns the layout options, see UnrealLightLogic.batch_create. """
+        return {
+            "count": self.spin_count.value(),
+            "spacing": self.spin_spacing.value(),
+            "height": self.spin_height.value(),
+            "csv_path": self.entry_csv.text(),
+        }
+
+
+class BulkRenameDialog(QDialog):
+    """
+    Asks for a rename pattern: find and replace, regex with capture groups, prefix and suffix,
+    or renumbering, and previews its result on the first lights to rename.
+    """
+
+    def __init__(self, labels: list, parent: QWidget = None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Rename {len(labels)} Light(s)")
+        self.labels = labels
+        self.combo_mode = QComboBox()
+        self.combo_mode.addItems(RENAME_MODES)
+        self.entry_find = QLineEdit(placeholderText="Text or regex, e.g. ^LGT_(\\w+)_(\\d+)$")
+        self.entry_replace = QLineEdit(placeholderText="Regex groups as \\1 or \\g<name>")
+        self.entry_prefix = QLineEdit()
+        self.entry_suffix = QLineEdit()
+        self.entry_name = QLineEdit(placeholderText="Empty keeps each name without its number")
+        self.spin_start = QSpinBox()
+        self.spin_start.setRange(0, 999999)
+        self.spin_start.setValue(1)
+        self.spin_padding = QSpinBox()
+        self.spin_padding.setRange(1, 6)
+        self.spin_padding.setValue(3)
+        self.label_preview = QLabel()
+        self.buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+
+        layout = QFormLayout(self)
+        layout.addRow("Mode:", self.combo_mode)
+        layout.addRow("Find:", self.entry_find)
+        layout.addRow("Replace:", self.entry_replace)
+        layout.addRow("Prefix:", self.entry_prefix)
+        layout.addRow("Suffix:", self.entry_suffix)
+        layout.addRow("Name:", self.entry_name)
+        layout.addRow("Start:", self.spin_start)
+        layout.addRow("Padding:", self.spin_padding)
+        layout.addRow("Preview:", self.label_preview)
+        layout.addRow(self.buttons)
+        # FIELDS USED BY EACH MODE, THE OTHERS ARE DISABLED
+        self.mode_fields = {
+            "Find / Replace": (self.entry_find, self.entry_replace),
+            "Regex": (self.entry_find, self.entry_replace),
+            "Prefix / Suffix": (self.entry_prefix, self.entry_suffix),
+            "Renumber": (self.entry_name, self.spin_start, self.spin_padding),
+        }
+
+        self.combo_mode.currentTextChanged.connect(self.update_preview)
+        for entry in (self.entry_find, self.entry_replace, self.entry_prefix, self.entry_suffix, self.entry_name):
+            entry.textChanged.connect(self.update_preview)
+        self.spin_start.valueChanged.connect(self.update_preview)
+        self.spin_padding.valueChanged.connect(self.update_preview)
+        self.update_preview()
+
+    def options(self) -> dict:
+        """ Returns the pattern options, see LightRename.rename_labels. """
+        return {
+            "find": self.entry_find.text(),
+            "replace": self.entry_replace.text(),
+            "prefix": self.entry_prefix.text(),
+            "suffix": self.entry_suffix.text(),
+            "name": self.entry_name.text().strip(),
+            "start": self.spin_start.value(),
+            "padding": self.spin_padding.value(),
+        }
+
+    def update_preview(self):
+        """ Enables the fields of the current mode and previews the first renames. """
+        mode = self.combo_mode.currentText()
+        for fields in self.mode_fields.values():
+            for field in fields:
+                field.setEnabled(False)
+        for field in self.mode_fields[mode]:
+            field.setEnabled(True)
+
+        labels = self.labels[:RENAME_PREVIEW_COUNT]  # CONFLICTS ARE ONLY RESOLVED WHEN APPLIED
+        try:
+            new_labels = resolve_labels(labels, rename_labels(labels, mode, self.options()), ())
+        except RenameError as error:
+            self.label_preview.setText(str(error))
+            self.buttons.button(QDialogButtonBox.Ok).setEnabled(False)
+            return
+        self.buttons.button(QDialogButtonBox.Ok).setEnabled(True)
+        lines = [f"{old} -> {new}" for old, new in zip(labels, new_labels)]
+        if len(self.labels) > RENAME_PREVIEW_COUNT:
+            lines.append(f"... and {len(self.labels) - RENAME_PREVIEW_COUNT} more")
+        self.label_preview.setText("\n".join(lines))
+
+
+class LightTableView(QTableView):
+    """
+    A QTableView that keeps a multi-selection when an editable cell of a selected row is clicked,
+    so the edit can be applied to every selected light instead of collapsing the selection.
+    The selected rows follow their light when the model re-orders them, see `hold_selection`.
+    `signal_first_painted` is emitted once, right after the table was painted for the first time.
+    """
+
+    signal_first_painted = Signal()
+
+    def __init__(self, parent: QWidget = None):
+        super().__init__(parent)
+        self.painted = False
+        self.held_rows = []  # VIEW ROWS SELECTED WHEN THE MODEL STARTED A RE-ORDER
+
+    def setModel(self, model: LightTableModel):
+        super().setModel(model)
+        model.signal_rows_reordering.connect(self.hold_selection)
+        model.signal_rows_reordered.connect(self.restore_selection)
+
+    def hold_selection(self):
+        """
+        Takes the selection out of the view while the model re-orders its rows. Left in place, the selection
+        model would save a persistent index per selected cell (the sort hint that avoids it cannot be emitted from
+        Python), which takes seconds once thousands of rows are selected.
+        The selection is the same once restored, so neither step emits `selectionChanged`.
+        """
+        self.held_rows = self.selected_view_rows()
+        if self.held_rows:
+            with QSignalBlocker(self.selectionModel()):
+                self.selectionModel().clearSelection()
+
+    def restore_selection(self, moved: list):
+        """ Selects the held rows again at their new place, `moved` maps each old view row to the new one. """
+        if not self.held_rows:
+            return
+        last_column = self.model().columnCount() - 1
+        selection = QItemSelection()
+        for first, last in row_ranges(sorted(moved[row] for row in self.held_rows)):
+            selection.select(self.model().index(first, 0), self.model().index(last, last_column))
+        self.held_rows = []
+        with QSignalBlocker(self.selectionModel()):
+            self.selectionModel().select(selection, QItemSelectionModel.Select)
+        self.viewport().update()
+
+    def paintEvent(self, event: QEvent):
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            QTimer.singleShot(0, self.signal_first_painted.emit)  # ONCE THE PAINTED FRAME IS ON SCREEN
+
+    def selected_view_rows(self) -> list:
+        """
+        Returns the selected view rows, in ascending order. They are read from the selection ranges:
+        `selectedRows` checks every cell of every row (one `flags` call each), too slow on a large table.
+        Rows are selected whole (SelectRows), so a range always spans every column.
+        """
+        rows = set()
+        for selection_range in self.selectionModel().selection():
+            rows.update(range(selection_range.top(), selection_range.bottom() + 1))
+        return sorted(rows)
+
+    def visible_view_rows(self) -> range:
+        """ Returns the view rows shown in the viewport, an empty range when the table is empty. """
+        row_count = self.model().rowCount()
+        if not row_count:
+            return range(0)
+        first = max(self.rowAt(0), 0)
+        last = self.rowAt(self.viewport().height() - 1)
+        return range(first, (row_count if last < 0 else last + 1))
+
+    def selectionCommand(self, index: QModelIndex, event: QEvent = None) -> QItemSelectionModel.SelectionFlag:
+        if (event is not None and index.isValid()
+                and event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick)
+                and event.modifiers() == Qt.NoModifier
+                and index.flags() & (Qt.ItemIsUserCheckable | Qt.ItemIsEditable)
+                and self.selectionModel().isRowSelected(index.row(), QModelIndex())):
+            return QItemSelectionModel.NoUpdate
+        return super().selectionCommand(index, event)
+
+
+class CheckBoxDelegate(QStyledItemDelegate):
+    """
+    Paints a centered checkbox for boolean cells and toggles it on click.
+    Nothing is instantiated per cell, the checkbox is only drawn.
+    """
+
+    def __init__(self, parent: QWidget = None, checked_color: str = None, unchecked_color: str = None):
+        """
+        Args:
+            parent (QWidget, optional): The view using the delegate.
+            checked_color (str, optional): Indicator background when checked.
+            unchecked_color (str, optional): Indicator background when unchecked.
+        """
+        super().__init__(parent)
+        self.checked_color = QColor(checked_color) if checked_color else None
+        self.unchecked_color = QColor(unchecked_color) if unchecked_color else None
+
+    def check_rect(self, option: QStyleOptionViewItem) -> QRect:
+        """ Returns the rectangle of the indicator, centered in the cell. """
+        style = QApplication.style()
+        size = style.pixelMetric(INDICATOR_WIDTH)
+        rect = QRect(0, 0, size, size)
+        rect.moveCenter(option.rect.center())
+        return rect
+
+    def paint(self, painter, option: QStyleOptionViewItem, index):
+        state = index.data(CHECK_STATE_ROLE)
+        if state is None:  # N/A CELL
+            super().paint(painter, option, index)
+            return
+
+        # CELL BACKGROUND (SELECTION HIGHLIGHT) WITHOUT THE DEFAULT LEFT ALIGNED INDICATOR
+        view_option = QStyleOptionViewItem(option)
+        self.initStyleOption(view_option, index)
+        view_option.features &= ~HAS_CHECK_INDICATOR
+        view_option.text = ""
+        style = QApplication.style()
+        style.drawControl(ITEM_VIEW_ITEM, view_option, painter, option.widget)
+
+        checked = state == CHECKED
+        rect = self.check_rect(option)
+        fill = self.checked_color if checked else self.unchecked_color
+        if fill:
+            painter.fillRect(rect, fill)
+        button_option = QStyleOptionButton()
+        button_option.rect = rect
+        button_option.state = STATE_CHECKED if checked else STATE_UNCHECKED
+        style.drawPrimitive(INDICATOR_CHECKBOX, button_option, painter, option.widget)
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index) -> bool:
+        if not index.flags() & Qt.ItemIsUserCheckable:
+            return False
+        if event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick):
+            return self.check_rect(option).contains(event.position().toPoint())
+        if event.type() == QEvent.MouseButtonRelease:
+            if not self.check_rect(option).contains(event.position().toPoint()):
+                return False
+        elif not (event.type() == QEvent.KeyPress and event.key() in (Qt.Key_Space, Qt.Key_Select)):
+            return False
+        state = Qt.Unchecked if index.data(Qt.CheckStateRole) == Qt.Checked else Qt.Checked
+        return model.setData(index, state, Qt.CheckStateRole)
+
+
+class ColorDelegate(QStyledItemDelegate):
+    """
+    Paints the light color as a swatch and opens a color picker on click.
+    """
+
+    def paint(self, painter, option: QStyleOptionViewItem, index):
+        super().paint(painter, option, index)
+        color = index.data(EDIT_ROLE)
+        if color is None:
+            return
+        rect = QRect(0, 0, min(56, option.rect.width() - 4), min(26, option.rect.height() - 4))
+        rect.moveCenter(option.rect.center())
+        painter.fillRect(rect, color_to_qcolor(color))
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index) -> QWidget:
+        return None  # THE PICKER IS OPENED FROM editorEvent
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index) -> bool:
+        if not index.flags() & Qt.ItemIsEditable or event.type() != QEvent.MouseButtonRelease:
+            return False
+        new_color = QColorDialog.getColor(color_to_qcolor(index.data(Qt.EditRole)), option.widget)
+        if new_color.isValid():
+            model.setData(index, (new_color.redF(), new_color.greenF(), new_color.blueF()), Qt.EditRole)
+        return True
+
+
+class NumericDelegate(QStyledItemDelegate):
+    """
+    Creates a CustomLineEditNum only while a numeric cell is being edited.
+    Its wheel ticks are forwarded as `signal_scrubbed` and `signal_scrub_finished` is emitted
+    once the editor is gone, whether the edit was committed, cancelled or the table was reset.
+    """
+
+    signal_scrubbed = Signal(int, str, float)  # (row, attribute_key, value)
+    signal_scrub_finished = Signal()
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index) -> QWidget:
+        editor = CustomLineEditNum(parent)
+        editor.setAlignment(Qt.AlignCenter)
+        edited_index = QPersistentModelIndex(index)  # FOLLOWS THE ROW IF THE TABLE IS RE-SORTED WHILE SCRUBBING
+        editor.signal_value_scrubbed.connect(lambda value: self.emit_scrubbed(edited_index, value))
+        editor.destroyed.connect(self.signal_scrub_finished)
+        return editor
+
+    def emit_scrubbed(self, index: QPersistentModelIndex, value: float):
+        """ Emits the `signal_scrubbed` with the record row of the edited cell. """
+        if index.isValid():
+            model = index.model()
+            self.signal_scrubbed.emit(model.source_row(index.row()), COLUMN_KEYS[index.column()], value)
+
+    def setEditorData(self, editor: QWidget, index):
+        value = index.data(Qt.EditRole)
+        if isinstance(value, float):
+            editor.setText(f"{value:.3f}")
+        elif isinstance(value, int):
+            editor.setText(f"{value}")
+
+    def setModelData(self, editor: QWidget, model, index):
+        model.setData(index, editor.text(), Qt.EditRole)
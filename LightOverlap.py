@@ -0,0 +1,222 @@
+import math
+import time
+from collections import Counter, defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # NOT SHIPPED WITH EVERY ENGINE PYTHON, THE PURE PYTHON GRID IS USED INSTEAD
+    np = None
+
+DENSEST_REGIONS = 5  # GRID CELLS REPORTED AS THE DENSEST REGIONS
+LARGE_RADIUS_PERCENTILE = 0.99  # THE GRID CELL FITS THIS SHARE OF THE RADII, LARGER LIGHTS USE COARSER CELLS
+MIN_CELL_SIZE = 1.0  # UNITS, 2**CELL_BITS CELLS OF THIS SIZE SPAN 20 KM
+PAIR_BATCH = 1 << 20  # CANDIDATE PAIRS TESTED PER NUMPY BATCH, BOUNDS THE MEMORY OF DENSE CLUSTERS
+CELL_BITS = 21  # BITS PER AXIS OF A PACKED CELL KEY
+CELL_OFFSET = 1 << (CELL_BITS - 1)  # CELL COORDINATES ARE SHIFTED TO BE POSITIVE BEFORE PACKING
+FULL_NEIGHBOURS = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
+# HALF OF THE 26 NEIGHBOUR CELLS: EACH PAIR OF ADJACENT CELLS IS VISITED ONCE
+HALF_NEIGHBOURS = [offset for offset in FULL_NEIGHBOURS if offset > (0, 0, 0)]
+
+
+def grid_cell_size(radii: list) -> float:
+    """
+    Returns the edge of the grid cells: twice the LARGE_RADIUS_PERCENTILE radius, so two such spheres
+    can only intersect when their cells touch.
+    """
+    if not len(radii):
+        return MIN_CELL_SIZE
+    ordered = sorted(radii)
+    return max(2.0 * ordered[min(int(len(ordered) * LARGE_RADIUS_PERCENTILE), len(ordered) - 1)], MIN_CELL_SIZE)
+
+
+def overlap_counts(positions: list, radii: list) -> list:
+    """
+    Counts, for each light, the other lights whose attenuation sphere intersects its own.
+    The lights are bucketed on a uniform grid and only the lights of neighbouring cells are compared,
+    with NumPy when it is available.
+    Args:
+        positions (list): (x, y, z) per light.
+        radii (list): Attenuation radius per light.
+    Returns:
+        list: The number of intersecting spheres per light.
+    """
+    if not len(radii):
+        return []
+    cell_size = grid_cell_size(radii)
+    if np is not None:
+        return _overlap_counts_numpy(np.asarray(positions, dtype=float).reshape(-1, 3),
+                                     np.asarray(radii, dtype=float), cell_size).tolist()
+    return _overlap_counts_python(positions, radii, cell_size)
+
+
+def _overlap_counts_numpy(positions: "np.ndarray", radii: "np.ndarray", cell_size: float) -> "np.ndarray":
+    """ `overlap_counts` on NumPy arrays: the candidate pairs of each pair of neighbour cells are tested at once. """
+    counts = np.zeros(len(radii), dtype=np.int64)
+    # HIERARCHICAL GRID: A LIGHT LIVES ON THE FIRST LEVEL WHOSE CELLS FIT ITS SPHERE, EACH LEVEL DOUBLES THE CELLS
+    levels = np.maximum(np.ceil(np.log2(np.maximum(2 * radii, 1e-9) / cell_size)), 0).astype(np.int64)
+    for level in np.unique(levels):
+        level_size = cell_size * 2.0 ** level
+        level_grid = _grid(positions, radii, np.flatnonzero(levels == level), level_size)
+        # PAIRS OF THE LEVEL: THE SAME CELL AND HALF OF THE NEIGHBOUR CELLS
+        for offset in [(0, 0, 0)] + HALF_NEIGHBOURS:
+            _count_cell_pairs(level_grid, level_grid, offset)
+        # PAIRS WITH THE SMALLER LIGHTS, BUCKETED ON THE CELLS OF THE LEVEL: EVERY NEIGHBOUR CELL
+        smaller = np.flatnonzero(levels < level)
+        if len(smaller):
+            smaller_grid = _grid(positions, radii, smaller, level_size)
+            for offset in FULL_NEIGHBOURS:
+                _count_cell_pairs(level_grid, smaller_grid, offset)
+            counts[smaller_grid["members"]] += smaller_grid["counts"]
+        counts[level_grid["members"]] += level_grid["counts"]
+    return counts
+
+
+def _grid(positions: "np.ndarray", radii: "np.ndarray", index: "np.ndarray", cell_size: float) -> dict:
+    """
+    Buckets lights on a uniform grid. The lights are sorted by cell: "members" holds their indexes, "x", "y", "z"
+    and "radius" their coordinates and radii, and "counts" their intersections found so far. Each cell is
+    described by its packed key in "keys", sorted, and by the "starts" and "sizes" of its lights.
+    """
+    cells = np.floor(positions[index] / cell_size)
+    # CLIPPED, THE NEIGHBOURS OF THE OUTERMOST CELLS STILL FIT THEIR KEY FIELD
+    np.clip(cells, -CELL_OFFSET + 1, CELL_OFFSET - 2, out=cells)
+    keys = _pack(*cells.astype(np.int64).T)
+    order = np.argsort(keys, kind="stable")
+    members = index[order]
+    cell_keys, cell_starts, cell_sizes = np.unique(keys[order], return_index=True, return_counts=True)
+    sorted_positions = positions[members]
+    return {"members": members, "x": sorted_positions[:, 0].copy(), "y": sorted_positions[:, 1].copy(),
+            "z": sorted_positions[:, 2].copy(), "radius": radii[members], "counts": np.zeros(len(members), np.int64),
+            "keys": cell_keys, "starts": cell_starts, "sizes": cell_sizes}
+
+
+def _pack(x: "np.ndarray", y: "np.ndarray", z: "np.ndarray") -> "np.ndarray":
+    """ Packs cell coordinates into one sortable int64 key. """
+    return (((np.asarray(x) + CELL_OFFSET) << (2 * CELL_BITS)) | ((np.asarray(y) + CELL_OFFSET) << CELL_BITS)
+            | (np.asarray(z) + CELL_OFFSET))
+
+
+def _ranges(starts: "np.ndarray", sizes: "np.ndarray") -> "np.ndarray":
+    """ Concatenates the ranges [start, start + size), without a Python loop. """
+    return np.repeat(starts - (np.cumsum(sizes) - sizes), sizes) + np.arange(sizes.sum())
+
+
+def _count_cell_pairs(first: dict, second: dict, offset: tuple):
+    """
+    Tests every light of each cell of the `first` grid against every light of the cell at `offset` in the
+    `second` grid, in batches of about PAIR_BATCH pairs, and adds the intersections to the grid counts.
+    """
+    same_cell = first is second and offset == (0, 0, 0)
+    neighbour_keys = first["keys"] + (_pack(*offset) - _pack(0, 0, 0))
+    found = np.minimum(np.searchsorted(second["keys"], neighbour_keys), len(second["keys"]) - 1)
+    first_cells = np.flatnonzero(second["keys"][found] == neighbour_keys)
+    second_cells = found[first_cells]
+    pair_counts = first["sizes"][first_cells] * second["sizes"][second_cells]
+    if not len(pair_counts):
+        return
+
+    batch_ends = np.searchsorted(np.cumsum(pair_counts), np.arange(1, pair_counts.sum() // PAIR_BATCH + 1)
+                                 * PAIR_BATCH, side="right")
+    batch_start = 0
+    for batch_end in list(batch_ends) + [len(first_cells)]:
+        batch_end = max(batch_end, batch_start + 1)  # A CELL PAIR LARGER THAN A BATCH IS ITS OWN BATCH
+        if batch_start >= len(first_cells):
+            break
+        first_batch, second_batch = first_cells[batch_start:batch_end], second_cells[batch_start:batch_end]
+        batch_start = batch_end
+        # EVERY LIGHT OF THE FIRST CELLS, THEN EACH OF THEM AGAINST THE RANGE OF LIGHTS OF ITS SECOND CELL
+        first_sizes = first["sizes"][first_batch]
+        a = _ranges(first["starts"][first_batch], first_sizes)
+        second_sizes = np.repeat(second["sizes"][second_batch], first_sizes)
+        b = _ranges(np.repeat(second["starts"][second_batch], first_sizes), second_sizes)
+        a = np.repeat(a, second_sizes)
+        if same_cell:
+            keep = a < b
+            a, b = a[keep], b[keep]
+        distance = first["x"][a] - second["x"][b]
+        distance *= distance
+        delta = first["y"][a] - second["y"][b]
+        delta *= delta
+        distance += delta
+        delta = first["z"][a] - second["z"][b]
+        delta *= delta
+        distance += delta
+        reach = first["radius"][a] + second["radius"][b]
+        reach *= reach
+        hit = distance < reach
+        first["counts"] += np.bincount(a[hit], minlength=len(first["counts"]))
+        second["counts"] += np.bincount(b[hit], minlength=len(second["counts"]))
+
+
+def _overlap_counts_python(positions: list, radii: list, cell_size: float) -> list:
+    """ `overlap_counts` without NumPy: the lights larger than a cell are compared with every other light. """
+    counts = [0] * len(radii)
+    grid = defaultdict(list)  # CELL -> INDEXES OF THE SMALL LIGHTS IN IT
+    large = []
+    for index, ((x, y, z), radius) in enumerate(zip(positions, radii)):
+        if radius > cell_size / 2:
+            large.append(index)
+        else:
+            grid[(math.floor(x / cell_size), math.floor(y / cell_size), math.floor(z / cell_size))].append(index)
+
+    def test(a: int, b: int):
+        (ax, ay, az), (bx, by, bz) = positions[a], positions[b]
+        reach = radii[a] + radii[b]
+        if (ax - bx) ** 2 + (ay - by) ** 2 + (az - bz) ** 2 < reach * reach:
+            counts[a] += 1
+            counts[b] += 1
+
+    for (cx, cy, cz), cell in grid.items():
+        for rank, a in enumerate(cell):
+            for b in cell[rank + 1:]:
+                test(a, b)
+        for dx, dy, dz in HALF_NEIGHBOURS:
+            for b in grid.get((cx + dx, cy + dy, cz + dz), ()):
+                for a in cell:
+                    test(a, b)
+    small = [index for cell in grid.values() for index in cell]
+    for rank, a in enumerate(large):
+        for b in small + large[rank + 1:]:
+            test(a, b)
+    return counts
+
+
+def densest_regions(positions: list, cell_size: float, limit: int = DENSEST_REGIONS) -> list:
+    """
+    Returns the grid cells holding the most lights, the densest first.
+    Returns:
+        list: (cell center (x, y, z), number of lights) per cell.
+    """
+    cells = Counter((math.floor(x / cell_size), math.floor(y / cell_size), math.floor(z / cell_size))
+                    for x, y, z in positions)
+    return [(tuple((coordinate + 0.5) * cell_size for coordinate in cell), light_count)
+            for cell, light_count in cells.most_common(limit)]
+
+
+def analyse_overlaps(positions: list, radii: list, cast_shadows: list, threshold: int) -> dict:
+    """
+    Finds where the lights stack up: overlapping attenuation spheres of shadowed dynamic lights are
+    the main cost of a lighting setup.
+    Args:
+        positions (list): (x, y, z) per light.
+        radii (list): Attenuation radius per light.
+        cast_shadows (list): Whether each light casts shadows.
+        threshold (int): Shadow casting lights intersecting more spheres than this are reported.
+    Returns:
+        dict: "overlaps" (count per light), "hotspots" (indexes of the shadow casting lights over the
+            threshold, most overlapped first), "densest" (see `densest_regions`), "cell_size",
+            "backend" ("numpy" or "python") and "elapsed" (seconds).
+    """
+    start = time.perf_counter()
+    overlaps = overlap_counts(positions, radii)
+    cell_size = grid_cell_size(radii)
+    hotspots = [index for index, count in enumerate(overlaps) if cast_shadows[index] and count > threshold]
+    hotspots.sort(key=overlaps.__getitem__, reverse=True)
+    return {
+        "overlaps": overlaps,
+        "hotspots": hotspots,
+        "densest": densest_regions(positions, cell_size),
+        "cell_size": cell_size,
+        "backend": "python" if np is None else "numpy",
+        "elapsed": time.perf_counter() - start,
+    }
@@ -0,0 +1,89 @@
+import json
+
+from LightSnapshot import CHANNEL_COLUMNS, read_property
+
+PRESET_FORMAT = "unreal-light-manager-rig"
+PRESET_VERSION = 1  # BUMPED WHEN THE RECORD LAYOUT CHANGES, OLDER FILES MUST STAY READABLE
+
+# COMPONENT PROPERTIES SAVED AS IS, READ AND WRITTEN WITH get/set_editor_property
+RECORD_PROPERTIES = ("intensity", "intensity_units", "use_temperature", "temperature", "attenuation_radius",
+                     "cast_shadows", "mobility")
+ENUM_PROPERTIES = {"intensity_units": "LightUnits", "mobility": "ComponentMobility"}  # SAVED BY NAME
+
+
+class PresetError(ValueError):
+    """ Raised when a preset file cannot be read. """
+
+
+def light_record(light_actor: object, light_component: object, light_type: str) -> dict:
+    """
+    Reads the preset record of one light from Unreal.
+    Attributes the light type does not have are left out of the record.
+    """
+    location = light_actor.get_actor_location()
+    rotation = light_actor.get_actor_rotation()
+    color = light_component.get_light_color()
+    record = {
+        "label": light_actor.get_actor_label(),
+        "type": light_type,
+        "location": [location.x, location.y, location.z],
+        "rotation": [rotation.roll, rotation.pitch, rotation.yaw],
+        "color": [color.r, color.g, color.b],
+    }
+    for name in RECORD_PROPERTIES:
+        value = read_property(light_component, name)
+        if value is None:
+            continue
+        record[name] = getattr(value, "name", str(value)) if name in ENUM_PROPERTIES else value
+    light_channels = read_property(light_component, "lighting_channels")
+    if light_channels is not None:
+        record["channels"] = [light_channels.get_editor_property(channel) for channel in CHANNEL_COLUMNS]
+    return record
+
+
+def write_preset(file_path: str, records: iter) -> int:
+    """
+    Streams light records to a preset file: a header line, then one compact JSON line per light,
+    so a rig of any size is written without being held in memory.
+    Args:
+        file_path (str): The preset file, overwritten.
+        records (iter): The light records, see `light_record`.
+    Returns:
+        int: The number of lights written.
+    """
+    count = 0
+    with open(file_path, "w", encoding="utf-8") as preset_file:
+        preset_file.write(json.dumps({"format": PRESET_FORMAT, "version": PRESET_VERSION}) + "\n")
+        for record in records:
+            preset_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            count += 1
+    return count
+
+
+def read_preset(file_path: str) -> iter:
+    """
+    Streams the light records of a preset file, one line at a time.
+    Raises:
+        PresetError: The file is not a preset, comes from a newer version of the tool, or a line is corrupted.
+    """
+    with open(file_path, encoding="utf-8") as preset_file:
+        try:
+            header = json.loads(preset_file.readline())
+        except json.JSONDecodeError:
+            header = None
+        if not isinstance(header, dict) or header.get("format") != PRESET_FORMAT:
+            raise PresetError(f"'{file_path}' is not a light rig preset.")
+        if header.get("version", 0) > PRESET_VERSION:
+            raise PresetError(f"'{file_path}' was saved by a newer version of the Light Manager "
+                              f"(preset version {header['version']}).")
+
+        for line_number, line in enumerate(preset_file, 2):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise PresetError(f"'{file_path}' line {line_number}: {error.msg}")
+            if not isinstance(record, dict) or "type" not in record:
+                raise PresetError(f"'{file_path}' line {line_number}: not a light record.")
+            yield record
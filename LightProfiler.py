@@ -0,0 +1,191 @@
+import cProfile
+import functools
+import json
+import pstats
+import re
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+
+import unreal
+
+PROFILE_FORMAT = "unreal-light-manager-profile"
+MAX_RECORDS = 500  # LATEST OPERATIONS KEPT FOR THE JSON DUMP
+# HOW cProfile NAMES THE C FUNCTIONS OF THE `unreal` MODULE
+BUILTIN_METHOD = re.compile(r"^<method '(\w+)' of '(?:unreal\.)?(\w+)' objects>$")
+BUILTIN_FUNCTION = re.compile(r"^<built-in method unreal\.(\w+)>$")
+
+
+def profiled(method: callable) -> callable:
+    """
+    Profiles a public operation of a class holding a `profiler` (LightProfiler).
+    Disabled, the cost is one attribute check. Only the outermost profiled operation is recorded,
+    the operations it calls are part of its record.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = self.profiler
+        if not profiler.enabled or profiler.running:
+            return method(self, *args, **kwargs)
+        with profiler.operation(name):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class LightProfiler:
+    """
+    Records the duration, the `unreal` API calls by name and the widgets created by each operation of the tool.
+    Each operation runs under its own cProfile session: the engine calls are read from its caller/callee table,
+    so a single C-level hook does both the counting and the profiling. The sessions are merged into one
+    cProfile output, dumped with `dump_cprofile`.
+
+    `widget_counter` is an optional callable returning the number of widgets created so far, set by the UI.
+    `on_record` is an optional callable run after each recorded operation, e.g. to show the stats.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.running = False  # AN OPERATION IS BEING RECORDED
+        self.widget_counter = None
+        self.on_record = None
+        self.records = deque(maxlen=MAX_RECORDS)  # LATEST OPERATIONS, OLDEST FIRST
+        self.totals = {}  # OPERATION NAME -> AGGREGATED RECORD
+        self.stats = None  # pstats.Stats OF EVERY RECORDED OPERATION
+        self._engine_names = {}  # cProfile FUNCTION KEY -> ENGINE CALL NAME, OR None FOR ANY OTHER FUNCTION
+        self._engine_file = getattr(unreal, "__file__", None)  # SET FOR A PYTHON STAND-IN OF THE MODULE
+
+    def reset(self):
+        """ Forgets every recorded operation. """
+        self.records.clear()
+        self.totals.clear()
+        self.stats = None
+
+    @contextmanager
+    def operation(self, name: str):
+        """ Records one operation, see `profiled`. """
+        widgets = self.widget_counter() if self.widget_counter else 0
+        profile = cProfile.Profile()
+        self.running = True
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            duration = time.perf_counter() - start
+            self.running = False
+            widgets = (self.widget_counter() - widgets) if self.widget_counter else 0
+            self.add_record(name, duration, profile, widgets)
+
+    def add_record(self, name: str, duration: float, profile: cProfile.Profile, widgets: int):
+        engine_calls = self.engine_calls(profile)
+        record = {
+            "operation": name,
+            "time": time.time(),
+            "ms": round(duration * 1000, 3),
+            "engine_calls": sum(engine_calls.values()),
+            "engine_calls_by_name": dict(engine_calls.most_common()),
+            "widgets_created": widgets,
+        }
+        self.records.append(record)
+        total = self.totals.setdefault(name, {"count": 0, "ms": 0.0, "max_ms": 0.0, "engine_calls": 0,
+                                              "widgets_created": 0, "engine_calls_by_name": Counter()})
+        total["count"] += 1
+        total["ms"] += record["ms"]
+        total["max_ms"] = max(total["max_ms"], record["ms"])
+        total["engine_calls"] += record["engine_calls"]
+        total["widgets_created"] += widgets
+        total["engine_calls_by_name"].update(engine_calls)
+
+        profile.create_stats()
+        if self.stats is None:
+            self.stats = pstats.Stats(profile)
+        else:
+            self.stats.add(profile)
+        if self.on_record:
+            self.on_record()
+
+    def engine_calls(self, profile: cProfile.Profile) -> Counter:
+        """
+        Counts the `unreal` API calls of a profile session by name, e.g. "Actor.get_actor_label".
+        Only the calls made from outside of the module are counted, not the ones a stand-in makes internally.
+        """
+        calls = Counter()
+        for entry in profile.getstats():
+            if self.engine_name(entry.code) is not None or not entry.calls:
+                continue
+            for sub_entry in entry.calls:
+                name = self.engine_name(sub_entry.code)
+                if name is not None:
+                    calls[name] += sub_entry.callcount
+        return calls
+
+    def engine_name(self, code: object) -> str:
+        """ Returns the engine call name of a cProfile function (a code object or a C function label), or None. """
+        if isinstance(code, str):
+            key = code
+        else:
+            key = (code.co_filename, code.co_firstlineno, getattr(code, "co_qualname", code.co_name))
+        if key in self._engine_names:
+            return self._engine_names[key]
+        name = None
+        if isinstance(code, str):
+            match = BUILTIN_METHOD.match(code)
+            if match and isinstance(getattr(unreal, match.group(2), None), type):
+                name = f"{match.group(2)}.{match.group(1)}"
+            else:
+                match = BUILTIN_FUNCTION.match(code)
+                name = match.group(1) if match else None
+        elif self._engine_file and code.co_filename == self._engine_file:
+            name = getattr(code, "co_qualname", code.co_name)
+        self._engine_names[key] = name
+        return name
+
+    def summary(self) -> list:
+        """ Returns one aggregated record per operation, the slowest in total first. """
+        rows = []
+        for name, total in self.totals.items():
+            rows.append({
+                "operation": name,
+                "count": total["count"],
+                "ms": round(total["ms"], 3),
+                "mean_ms": round(total["ms"] / total["count"], 3),
+                "max_ms": total["max_ms"],
+                "engine_calls": total["engine_calls"],
+                "widgets_created": total["widgets_created"],
+                "top_engine_calls": dict(total["engine_calls_by_name"].most_common(5)),
+            })
+        return sorted(rows, key=lambda row: row["ms"], reverse=True)
+
+    def report(self) -> str:
+        """ Returns the last operation and the aggregated operations as text, for the stats panel. """
+        if not self.records:
+            return "No operation recorded."
+        last = self.records[-1]
+        top_calls = ", ".join(f"{name} {count}" for name, count in list(last["engine_calls_by_name"].items())[:3])
+        lines = [f"Last: {last['operation']} {last['ms']:.1f} ms, {last['engine_calls']} unreal calls"
+                 + (f" ({top_calls})" if top_calls else "") + f", {last['widgets_created']} widgets", "",
+                 f"{'operation':<30}{'count':>7}{'total ms':>11}{'mean ms':>10}{'max ms':>10}{'calls':>10}{'widgets':>9}"]
+        for row in self.summary():
+            lines.append(f"{row['operation']:<30}{row['count']:>7}{row['ms']:>11.1f}{row['mean_ms']:>10.1f}"
+                         f"{row['max_ms']:>10.1f}{row['engine_calls']:>10}{row['widgets_created']:>9}")
+        return "\n".join(lines)
+
+    def dump_json(self, file_path: str):
+        """ Writes the aggregated operations and the latest records to a JSON file. """
+        with open(file_path, "w", encoding="utf-8") as json_file:
+            json.dump({"format": PROFILE_FORMAT, "operations": self.summary(), "records": list(self.records)},
+                      json_file, indent=2)
+
+    def dump_cprofile(self, file_path: str) -> bool:
+        """
+        Writes the merged cProfile output of every recorded operation, readable with pstats or snakeviz.
+        Returns:
+            bool: False when no operation was recorded.
+        """
+        if self.stats is None:
+            return False
+        self.stats.dump_stats(file_path)
+        return True
@@ -0,0 +1,174 @@
+import fnmatch
+import operator
+import re
+
+from LightSnapshot import LAZY_BITS
+
+# SEARCH FIELD -> SNAPSHOT COLUMN
+NUMERIC_FIELDS = {
+    "intensity": "intensity",
+    "temperature": "temperature",
+    "temp": "temperature",
+    "radius": "attenuation_radius",
+    "attenuation_radius": "attenuation_radius",
+    "overlaps": "overlaps",
+}
+# SEARCH FLAG -> (SNAPSHOT COLUMN, STORED VALUE)
+FLAG_FIELDS = {
+    "muted": ("visible", 0),
+    "visible": ("visible", 1),
+    "solo": ("solo", 1),
+    "soloed": ("solo", 1),
+    "usetemp": ("use_temperature", 1),
+    "use_temperature": ("use_temperature", 1),
+    "channel0": ("channel0", 1),
+    "channel1": ("channel1", 1),
+    "channel2": ("channel2", 1),
+    "shadows": ("cast_shadows", 1),
+}
+OPERATORS = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "!=": operator.ne,
+    "=": operator.eq,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+COMPARISON = re.compile(r"^(\w+)(<=|>=|!=|=|<|>)(-?\d+(?:\.\d*)?|-?\.\d+)$")
+GLOB_CHARACTERS = set("*?[")
+
+
+class QueryError(ValueError):
+    """ Raised when a search query cannot be parsed. """
+
+
+class NameIndex:
+    """
+    A trigram index over the lower-cased light names of the table.
+    A name search only verifies the rows sharing every trigram of the searched text,
+    instead of scanning every name.
+    """
+
+    def __init__(self, labels: list):
+        self.labels = [label.lower() for label in labels]
+        self.trigrams = {}  # TRIGRAM -> SET OF ROWS
+        for row, label in enumerate(self.labels):
+            for i in range(len(label) - 2):
+                self.trigrams.setdefault(label[i:i + 3], set()).add(row)
+
+    def contains(self, text: str) -> set:
+        """ Returns the rows whose name contains `text`, case-insensitive. """
+        text = text.lower()
+        if len(text) < 3:
+            return {row for row, label in enumerate(self.labels) if text in label}
+        candidates = None
+        for i in range(len(text) - 2):
+            rows = self.trigrams.get(text[i:i + 3])
+            if not rows:
+                return set()
+            candidates = set(rows) if candidates is None else candidates & rows
+        return {row for row in candidates if text in self.labels[row]}
+
+
+class LightQuery:
+    """
+    A parsed search query. Terms are separated by spaces and must all match:
+
+    - `key`            name contains "key" (case-insensitive)
+    - `key*_0?`        glob on the whole name
+    - `/^lgt_.*_00\\d$/` or `re:pattern`   regular expression on the name
+    - `type:spot`      light type starts with "spot"
+    - `group:Key`      light belongs to the group "Key"
+    - `level:Sub_A`    light belongs to the level or streaming sublevel "Sub_A"
+    - `intensity>500`  numeric comparison on intensity, temperature (temp), radius or overlaps, with < <= > >= = !=
+    - `channel1`, `muted`, `visible`, `solo`, `usetemp`, `shadows`   flags, negated with a leading "!" or "-"
+
+    `overlaps` and `shadows` are filled by the overlap analysis, see LightOverlap. A lazy column (`shadows`)
+    not fetched for a light is N/A: the light matches neither the flag nor its negation.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.terms = [self.parse_term(token) for token in text.split()]
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+    @staticmethod
+    def parse_term(token: str) -> tuple:
+        """ Parses one search token into a (kind, ...) tuple. """
+        lowered = token.lower()
+        negated = lowered[:1] in ("!", "-") and lowered[1:] in FLAG_FIELDS
+        if negated or lowered in FLAG_FIELDS:
+            column, value = FLAG_FIELDS[lowered[1:] if negated else lowered]
+            return ("flag", column, (1 - value) if negated else value)
+
+        comparison = COMPARISON.match(lowered)
+        if comparison and comparison.group(1) in NUMERIC_FIELDS:
+            field, op, value = comparison.groups()
+            return ("compare", NUMERIC_FIELDS[field], OPERATORS[op], float(value))
+
+        if lowered.startswith("type:"):
+            return ("type", lowered[5:])
+        if lowered.startswith("group:"):
+            return ("group", token[6:])
+        if lowered.startswith("level:"):
+            return ("level", lowered[6:])
+
+        pattern = None
+        if lowered.startswith("re:"):
+            pattern = token[3:]
+        elif len(token) > 2 and token.startswith("/") and token.endswith("/"):
+            pattern = token[1:-1]
+        if pattern is not None:
+            try:
+                return ("regex", re.compile(pattern, re.IGNORECASE))
+            except re.error as error:
+                raise QueryError(f"Invalid regular expression '{pattern}': {error}")
+        if GLOB_CHARACTERS & set(token):
+            return ("glob", re.compile(fnmatch.translate(lowered)))
+        return ("name", lowered)
+
+    def filter(self, snapshot: object, name_index: NameIndex, group_rows: callable = None) -> set:
+        """
+        Returns the rows of the snapshot matching every term, or None when the query is empty.
+        Only the snapshot columns are read, the engine is never queried.
+        Args:
+            snapshot (LightSnapshot): The rows to filter.
+            name_index (NameIndex): The name index built on the same rows.
+            group_rows (callable, optional): Group name -> list of rows, for `group:` terms.
+        """
+        if not self.terms:
+            return None
+        rows = None
+        # NAME AND GROUP TERMS FIRST, THEY NARROW THE CANDIDATES THROUGH AN INDEX
+        for term in sorted(self.terms, key=lambda term: term[0] not in ("name", "group")):
+            kind = term[0]
+            if kind == "name":
+                matched = name_index.contains(term[1])
+            elif kind == "group":
+                matched = set(group_rows(term[1])) if group_rows else set()
+            else:
+                candidates = range(len(snapshot)) if rows is None else rows
+                if kind in ("regex", "glob"):
+                    test = term[1].search if kind == "regex" else term[1].match
+                    matched = {row for row in candidates if test(name_index.labels[row])}
+                elif kind == "type":
+                    types = snapshot.columns["type"]
+                    matched = {row for row in candidates if types[row].lower().startswith(term[1])}
+                elif kind == "level":
+                    levels = snapshot.columns["level"]
+                    matched = {row for row in candidates if levels[row].lower() == term[1]}
+                elif kind == "flag":
+                    column, value = snapshot.columns[term[1]], term[2]
+                    matched = {row for row in candidates if column[row] == value}
+                    if term[1] in LAZY_BITS:  # THE STORED VALUE OF AN UNFETCHED ROW IS STALE OR UNSET
+                        fetched, bit = snapshot.columns["fetched"], LAZY_BITS[term[1]]
+                        matched = {row for row in matched if fetched[row] & bit}
+                else:  # COMPARE, N/A (NaN) NEVER MATCHES
+                    column, compare, value = snapshot.columns[term[1]], term[2], term[3]
+                    matched = {row for row in candidates if column[row] == column[row] and compare(column[row], value)}
+            rows = matched if rows is None else rows & matched
+            if not rows:
+                break
+        return rows
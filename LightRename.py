@@ -0,0 +1,75 @@
+import re
+
+RENAME_MODES = ("Find / Replace", "Regex", "Prefix / Suffix", "Renumber")
+TRAILING_NUMBER = re.compile(r"_?\d+$")  # "_007" IN "Key_007", STRIPPED BY A RENUMBER WITHOUT A BASE NAME
+
+
+class RenameError(ValueError):
+    """ Raised when a rename pattern is invalid, e.g. a regex that does not compile. """
+
+
+def rename_labels(labels: list, mode: str, options: dict) -> list:
+    """
+    Applies a rename pattern to a list of labels, in order.
+    Args:
+        labels (list): The current labels.
+        mode (str): One of RENAME_MODES.
+        options (dict): "find" and "replace" for Find / Replace and Regex (a regex replacement
+            may use the capture groups: \\1 or \\g<name>), "prefix" and "suffix" for Prefix / Suffix,
+            "name", "start" and "padding" for Renumber (an empty name keeps each label without its number).
+    Returns:
+        list: The new labels, before any conflict is resolved, see `resolve_labels`.
+    Raises:
+        RenameError: The mode is unknown or the regex is invalid.
+    """
+    if mode == "Find / Replace":
+        find, replace = options.get("find", ""), options.get("replace", "")
+        if not find:
+            return list(labels)
+        return [label.replace(find, replace) for label in labels]
+    if mode == "Regex":
+        try:
+            pattern = re.compile(options.get("find", ""))
+            return [pattern.sub(options.get("replace", ""), label) for label in labels]
+        except (re.error, IndexError) as error:  # BAD PATTERN, OR A REPLACEMENT NAMING A MISSING GROUP
+            raise RenameError(f"Invalid regex: {error}")
+    if mode == "Prefix / Suffix":
+        prefix, suffix = options.get("prefix", ""), options.get("suffix", "")
+        return [f"{prefix}{label}{suffix}" for label in labels]
+    if mode == "Renumber":
+        name, start, padding = options.get("name", ""), options.get("start", 1), options.get("padding", 3)
+        return [f"{name or TRAILING_NUMBER.sub('', label)}_{start + i:0{padding}d}" for i, label in enumerate(labels)]
+    raise RenameError(f"Unknown rename mode '{mode}'.")
+
+
+def resolve_labels(old_labels: list, new_labels: list, taken: object) -> list:
+    """
+    Makes the new labels unique, against each other and against the labels that are not renamed.
+    The labels being renamed are free to reuse, so two lights can swap names.
+    A conflicting label gets the first free "_NNN" suffix, e.g. "Key" -> "Key_001".
+    Args:
+        old_labels (list): The labels being renamed.
+        new_labels (list): Their new labels, in the same order.
+        taken (object): Every label in use, any container supporting `in` (e.g. a LightIndex).
+    Returns:
+        list: The new labels, an empty one is replaced by the old label.
+    """
+    freed = set(old_labels)
+    assigned = set()
+    next_suffix = {}  # CONFLICTING LABEL -> NEXT SUFFIX TO TRY
+
+    def is_free(label: str) -> bool:
+        return label not in assigned and (label in freed or label not in taken)
+
+    resolved = []
+    for old_label, label in zip(old_labels, new_labels):
+        label = label.strip() or old_label
+        if not is_free(label):
+            num = next_suffix.get(label, 1)
+            while not is_free(f"{label}_{num:03d}"):
+                num += 1
+            next_suffix[label] = num + 1
+            label = f"{label}_{num:03d}"
+        assigned.add(label)
+        resolved.append(label)
+    return resolved
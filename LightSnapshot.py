@@ -0,0 +1,318 @@
+import time
+from array import array
+
+from LightColumns import LAZY_COLUMNS
+
+MISSING_BOOL = -1  # BOOL COLUMNS STORE -1 WHEN THE LIGHT TYPE DOES NOT HAVE THE ATTRIBUTE, FLOAT COLUMNS STORE NaN
+NAN = float("nan")
+
+# COLUMN -> ARRAY TYPECODE ("b" FOR BOOLS, "d" FOR FLOATS)
+COLUMN_TYPES = {
+    "visible": "b",  # MUTE CHECKBOX, OWNED BY THE TOOL
+    "solo": "b",  # SOLO CHECKBOX, OWNED BY THE TOOL
+    "applied": "b",  # VISIBILITY LAST READ FROM OR PUSHED TO UNREAL
+    "color_r": "d",
+    "color_g": "d",
+    "color_b": "d",
+    "intensity": "d",
+    "use_temperature": "b",
+    "temperature": "d",
+    "attenuation_radius": "d",
+    "channel0": "b",
+    "channel1": "b",
+    "channel2": "b",
+    "overlaps": "d",  # ATTENUATION SPHERES INTERSECTING THE LIGHT'S OWN, SET BY THE OVERLAP ANALYSIS
+    "location_x": "d",  # ACTOR LOCATION, FOR THE SPATIAL FILTER AND THE OVERLAP ANALYSIS
+    "location_y": "d",
+    "location_z": "d",
+    "fetched": "q",  # FLAGS OF THE LAZY COLUMNS READ FOR THE LIGHT, SEE LightColumns.AttributeColumn.bit
+}
+# LAZY COLUMNS (LightColumns), ONLY READ WHILE SHOWN: N/A UNTIL THEIR FLAG IS SET IN "fetched"
+COLUMN_TYPES.update({column.key: {"bool": "b", "float": "d"}[column.kind]
+                     for column in LAZY_COLUMNS if column.kind in ("bool", "float")})
+OBJECT_COLUMNS = ("label", "path", "type", "level", "actor", "component") + tuple(
+    column.key for column in LAZY_COLUMNS if column.kind == "text")  # PLAIN PYTHON LISTS
+LAZY_BITS = {column.key: column.bit for column in LAZY_COLUMNS}
+COLOR_COLUMNS = ("color_r", "color_g", "color_b")
+CHANNEL_COLUMNS = ("channel0", "channel1", "channel2")
+LOCATION_COLUMNS = ("location_x", "location_y", "location_z")
+TUPLE_COLUMNS = {"color": COLOR_COLUMNS, "location": LOCATION_COLUMNS}  # KEYS READ AND WRITTEN AS ONE TUPLE
+BOOL_COLUMNS = tuple(name for name, typecode in COLUMN_TYPES.items() if typecode == "b")
+FLOAT_COLUMNS = tuple(name for name, typecode in COLUMN_TYPES.items()
+                      if typecode == "d" and name not in COLOR_COLUMNS + LOCATION_COLUMNS)
+ENGINE_PROPERTIES = ("intensity", "use_temperature", "temperature", "attenuation_radius")  # READ WITH get_editor_property
+
+
+def level_of(path: str) -> str:
+    """
+    Returns the name of the level an actor belongs to, from its path or the package name of the level:
+    "/Game/Maps/Sub_A.Sub_A:PersistentLevel.PointLight_3" and "/Game/Maps/Sub_A" both give "Sub_A".
+    """
+    return path.split(":", 1)[0].rsplit("/", 1)[-1].split(".", 1)[0]
+
+
+def read_property(light_component: object, attribute_name: str) -> object:
+    """ Returns an editor property of a light component, or None when the light type does not have it. """
+    try:
+        return light_component.get_editor_property(attribute_name)
+    except (Exception, ValueError):
+        return None
+
+
+def read_column(light_component: object, column: object) -> object:
+    """ Returns the value of a LightColumns.AttributeColumn for a light component, None when it does not have it. """
+    if column.getter is None:
+        return read_property(light_component, column.key)
+    try:
+        return column.getter(light_component)
+    except (Exception, ValueError):
+        return None
+
+
+_fetched_cache = {}  # "fetched" FLAGS -> COLUMN NAMES
+
+
+def fetched_columns(fetched: int) -> tuple:
+    """ Returns the names of the columns holding a value in a row: every column but the lazy ones not fetched. """
+    names = _fetched_cache.get(fetched)
+    if names is None:
+        names = _fetched_cache[fetched] = tuple(name for name in (*COLUMN_TYPES, *OBJECT_COLUMNS)
+                                                if name not in LAZY_BITS or fetched & LAZY_BITS[name])
+    return names
+
+
+class LightRecord:
+    """
+    A lightweight view on one row of a LightSnapshot, read like a dict: record["intensity"].
+    No value is copied, the record reads straight from the snapshot columns.
+    """
+
+    __slots__ = ("snapshot", "index")
+
+    def __init__(self, snapshot: "LightSnapshot", index: int):
+        self.snapshot = snapshot
+        self.index = index
+
+    def __getitem__(self, key: str) -> object:
+        return self.snapshot.get(self.index, key)
+
+    def get(self, key: str, default: object = None) -> object:
+        value = self.snapshot.get(self.index, key)
+        return default if value is None else value
+
+
+class LightSnapshot:
+    """
+    Columnar storage of the light attributes shown by the Light Manager.
+    Every tracked attribute of every light is read from Unreal in a single pass and stored
+    in one compact `array` column per attribute, so the table, the search and the sorting
+    never go back to the engine. `engine_calls` counts the Unreal calls made by the reads.
+
+    The lazy columns of LightColumns are only read when asked for, each row flags the ones it holds in "fetched".
+    """
+
+    def __init__(self):
+        self.columns = {name: array(typecode) for name, typecode in COLUMN_TYPES.items()}
+        for name in OBJECT_COLUMNS:
+            self.columns[name] = []
+        self.engine_calls = 0
+
+    def __len__(self) -> int:
+        return len(self.columns["path"])
+
+    def __getitem__(self, index: int) -> LightRecord:
+        return LightRecord(self, index)
+
+    def __iter__(self):
+        return (LightRecord(self, index) for index in range(len(self)))
+
+    @property
+    def labels(self) -> list:
+        return self.columns["label"]
+
+    @property
+    def paths(self) -> list:
+        return self.columns["path"]
+
+    # READING FROM UNREAL --------------------------------------------
+    def read(self, light_actors: iter, light_types: dict, deadline: float = None, lazy_columns: list = ()) -> int:
+        """
+        Appends one row per light actor, reading each tracked attribute exactly once.
+        Args:
+            light_actors (iter): The light actors to read. An iterator is consumed up to where the read stops.
+            light_types (dict): Light type name -> [actor class, component class].
+            deadline (float, optional): A time.perf_counter() value, the read stops after the first light past it.
+            lazy_columns (list, optional): The lazy LightColumns.AttributeColumn to read as well, the shown ones.
+        Returns:
+            int: The number of light actors read.
+        """
+        count = 0
+        for light_actor in light_actors:
+            self.read_light(light_actor, light_types, lazy_columns)
+            count += 1
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+        return count
+
+    def read_light(self, light_actor: object, light_types: dict, lazy_columns: list = ()) -> bool:
+        """ Appends the row of a single light, returns False when it has no light component. See `read`. """
+        for light_type, (actor_class, component_class) in light_types.items():
+            if isinstance(light_actor, actor_class):
+                break
+        else:
+            return False
+        light_component = light_actor.get_component_by_class(component_class)
+        self.engine_calls += 1
+        if not light_component:
+            return False
+
+        visible = light_component.is_visible()
+        path = light_actor.get_path_name()
+        values = {
+            "label": light_actor.get_actor_label(),
+            "path": path,
+            "type": light_type,
+            "level": level_of(path),  # FROM THE PATH, NO ENGINE CALL
+            "actor": light_actor,
+            "component": light_component,
+            "visible": visible,
+            "solo": False,
+            "applied": visible,
+            "color": light_component.get_light_color(),
+            "location": light_actor.get_actor_location(),
+        }
+        for attribute_name in ENGINE_PROPERTIES:
+            values[attribute_name] = read_property(light_component, attribute_name)
+        light_channels = read_property(light_component, "lighting_channels")  # ONE READ FOR THE 3 CHANNELS
+        for channel in CHANNEL_COLUMNS:
+            values[channel] = None if light_channels is None else light_channels.get_editor_property(channel)
+        self.engine_calls += 6 + len(ENGINE_PROPERTIES) + (0 if light_channels is None else len(CHANNEL_COLUMNS))
+        fetched = 0
+        for column in lazy_columns:
+            if column.applies_to(light_type):  # THE OTHER TYPES ARE N/A WITHOUT AN ENGINE CALL
+                values[column.key] = read_column(light_component, column)
+                self.engine_calls += 1
+            fetched |= column.bit
+        values["fetched"] = fetched
+
+        values["color"] = (values["color"].r, values["color"].g, values["color"].b)
+        values["location"] = (values["location"].x, values["location"].y, values["location"].z)
+        self.append(values)
+        return True
+
+    # ROW ACCESS --------------------------------------------
+    def append(self, values: dict):
+        """ Appends a row from a dict of attribute values, missing attributes are stored as N/A. """
+        columns = self.columns
+        for name in OBJECT_COLUMNS:
+            columns[name].append(values.get(name))
+        for name, channel_value in zip(COLOR_COLUMNS, values.get("color") or (1.0, 1.0, 1.0)):
+            columns[name].append(float(channel_value))
+        for name, coordinate in zip(LOCATION_COLUMNS, values.get("location") or (NAN, NAN, NAN)):
+            columns[name].append(float(coordinate))
+        # SAME CONVERSION AS _to_stored, INLINED: THIS RUNS FOR EVERY ATTRIBUTE OF EVERY LIGHT READ
+        for name in BOOL_COLUMNS:
+            value = values.get(name)
+            columns[name].append(MISSING_BOOL if value is None else 1 if value else 0)
+        for name in FLOAT_COLUMNS:
+            value = values.get(name)
+            columns[name].append(NAN if value is None else float(value))
+        columns["fetched"].append(values.get("fetched", 0))
+
+    def get(self, index: int, key: str) -> object:
+        """ Returns one attribute of a row, None when the light does not have it or a lazy column was not fetched. """
+        if key in LAZY_BITS and not self.columns["fetched"][index] & LAZY_BITS[key]:
+            return None
+        if key in TUPLE_COLUMNS:
+            return tuple(self.columns[name][index] for name in TUPLE_COLUMNS[key])
+        column = self.columns[key]
+        if isinstance(column, list):
+            return column[index]
+        return _from_stored(column.typecode, column[index])
+
+    def set(self, index: int, key: str, value: object):
+        """ Writes one attribute of a row, a lazy column is then flagged as fetched for it. """
+        if key in LAZY_BITS:
+            self.columns["fetched"][index] |= LAZY_BITS[key]
+        if key in TUPLE_COLUMNS:
+            for name, component_value in zip(TUPLE_COLUMNS[key], value):
+                self.columns[name][index] = component_value
+            return
+        column = self.columns[key]
+        column[index] = value if isinstance(column, list) else _to_stored(column.typecode, value)
+
+    # MUTE / SOLO --------------------------------------------
+    def effective_visibility(self) -> array:
+        """ Returns the visibility each light should have: the soloed lights when any, otherwise the unmuted ones. """
+        solo = self.columns["solo"]
+        return solo if 1 in solo else self.columns["visible"]
+
+    def visibility_changes(self) -> list:
+        """ Returns the rows whose effective visibility differs from the visibility applied in Unreal. """
+        applied = self.columns["applied"]
+        return [row for row, (wanted, current) in enumerate(zip(self.effective_visibility(), applied)) if wanted != current]
+
+    def row_by_path(self) -> dict:
+        """ Returns actor path -> row for every row. """
+        return {path: row for row, path in enumerate(self.columns["path"])}
+
+    def differs(self, index: int, other: "LightSnapshot", other_index: int, skip: tuple = ()) -> bool:
+        """
+        Compares a row with the row of another snapshot, NaN (N/A) equals NaN.
+        The lazy columns the other row did not fetch are not compared.
+        """
+        columns, other_columns = self.columns, other.columns
+        for name in fetched_columns(other_columns["fetched"][other_index]):
+            if name in skip or name in ("actor", "component", "fetched"):
+                continue
+            value, other_value = columns[name][index], other_columns[name][other_index]
+            if value != other_value and (value == value or other_value == other_value):
+                return True
+        return False
+
+    def copy_row(self, index: int, other: "LightSnapshot", other_index: int, skip: tuple = (),
+                 keep_fetched: bool = False):
+        """
+        Overwrites a row with the row of another snapshot.
+        Args:
+            keep_fetched (bool, optional): The lazy columns the other row did not fetch keep their cached values,
+                otherwise they are dropped with the rest of the row.
+        """
+        columns, other_columns = self.columns, other.columns
+        fetched = columns["fetched"][index]
+        for name in fetched_columns(other_columns["fetched"][other_index]):
+            if name not in skip:
+                columns[name][index] = other_columns[name][other_index]
+        if keep_fetched:
+            columns["fetched"][index] |= fetched
+
+    def extend_rows(self, other: "LightSnapshot", other_indexes: list):
+        """ Appends rows of another snapshot. """
+        for name, column in self.columns.items():
+            other_column = other.columns[name]
+            column.extend([other_column[other_index] for other_index in other_indexes])
+
+    def delete_rows(self, first: int, last: int):
+        """ Removes the rows from `first` to `last` included. """
+        for column in self.columns.values():
+            del column[first:last + 1]
+
+    def reorder(self, order: list):
+        """ Permutes every column so that the new row `i` is the old row `order[i]`, the rows left out are dropped. """
+        for name, column in self.columns.items():
+            reordered = [column[old_index] for old_index in order]
+            self.columns[name] = reordered if isinstance(column, list) else array(column.typecode, reordered)
+
+
+def _to_stored(typecode: str, value: object) -> object:
+    """ Converts an attribute value to its column representation. """
+    if typecode == "b":
+        return MISSING_BOOL if value is None else int(bool(value))
+    return NAN if value is None else float(value)
+
+
+def _from_stored(typecode: str, value: object) -> object:
+    """ Converts a column value back to the attribute value, None for N/A. """
+    if typecode == "b":
+        return None if value == MISSING_BOOL else bool(value)
+    return None if value != value else value
@@ -0,0 +1,165 @@
+import math
+
+CELL_SIZE = 1000.0  # UNITS, THE DEFAULT ATTENUATION RADIUS OF A LOCAL LIGHT
+MIN_CELL_SIZE = 1.0
+CELL_RADIUS_PERCENTILE = 0.99  # THE CELLS FIT THIS SHARE OF THE RADII
+MAX_LARGE_SHARE = 0.05  # A SYNC LEAVING MORE LIGHTS THAN THIS LARGER THAN A CELL RE-SIZES THE CELLS
+
+
+def fitting_cell_size(radii: iter) -> float:
+    """ Returns a cell size larger than CELL_RADIUS_PERCENTILE of the radii, None and NaN radii are ignored. """
+    radii = sorted(radius for radius in radii if radius is not None and radius == radius)
+    if not radii:
+        return CELL_SIZE
+    return max(radii[int((len(radii) - 1) * CELL_RADIUS_PERCENTILE)], MIN_CELL_SIZE)
+
+
+class SpatialHash:
+    """
+    A uniform grid of light positions keyed by actor path. It is kept up to date in place: a light that moves
+    or whose radius changes is only moved to another cell when it crosses a cell border, nothing is rebuilt.
+
+    It answers the two questions of the spatial filter: which lights are within a distance of a point, and
+    which lights' attenuation sphere reaches a point. Lights without a radius (sky, directional) light the
+    whole level, they reach every point.
+    """
+
+    def __init__(self, cell_size: float = CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # CELL -> SET OF KEYS
+        self.entries = {}  # KEY -> (x, y, z, radius, cell), radius IS None WITHOUT AN ATTENUATION RADIUS
+        self.large = set()  # KEYS WHOSE RADIUS EXCEEDS A CELL, TESTED BY EVERY REACH QUERY
+        self.unbounded = set()  # KEYS WITHOUT A RADIUS
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def cell_of(self, x: float, y: float, z: float) -> tuple:
+        size = self.cell_size
+        return math.floor(x / size), math.floor(y / size), math.floor(z / size)
+
+    # UPDATES --------------------------------------------
+    def update(self, key: str, position: tuple, radius: float = None) -> bool:
+        """
+        Adds a light, or moves it to its new position.
+        Args:
+            key (str): The actor path of the light.
+            position (tuple): (x, y, z).
+            radius (float, optional): The attenuation radius, None or NaN when the light has none.
+        Returns:
+            bool: False when the light was already there with the same radius.
+        """
+        x, y, z = position
+        if radius is not None and radius != radius:
+            radius = None
+        entry = self.entries.get(key)
+        if entry is not None and entry[:4] == (x, y, z, radius):
+            return False
+        cell = self.cell_of(x, y, z)
+        if entry is None or entry[4] != cell:
+            if entry is not None:
+                self._discard(key, entry[4])
+            self.cells.setdefault(cell, set()).add(key)
+        self.entries[key] = (x, y, z, radius, cell)
+        if radius is None:
+            self.unbounded.add(key)
+            self.large.discard(key)
+        else:
+            self.unbounded.discard(key)
+            if radius > self.cell_size:
+                self.large.add(key)
+            else:
+                self.large.discard(key)
+        return True
+
+    def remove(self, key: str) -> bool:
+        """ Removes a light, returns False when it was not there. """
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        self._discard(key, entry[4])
+        self.large.discard(key)
+        self.unbounded.discard(key)
+        return True
+
+    def _discard(self, key: str, cell: tuple):
+        keys = self.cells[cell]
+        keys.discard(key)
+        if not keys:
+            del self.cells[cell]
+
+    def sync(self, keys: list, positions: iter, radii: iter) -> int:
+        """
+        Brings the hash in line with a list of lights: only the lights added, moved, resized or gone are touched.
+        Args:
+            keys (list): The actor paths of the lights.
+            positions (iter): (x, y, z) per light.
+            radii (iter): The attenuation radius per light, None or NaN when it has none.
+        Returns:
+            int: The number of lights added, moved, resized or removed.
+        """
+        radii = list(radii)
+        if not self.entries:  # FIRST SYNC: CELLS FITTING THE RADII RIGHT AWAY
+            self.cell_size = fitting_cell_size(radii)
+        changed = 0
+        for key, position, radius in zip(keys, positions, radii):
+            changed += self.update(key, position, radius)
+        if len(self.entries) > len(keys):
+            listed = set(keys)
+            for key in [key for key in self.entries if key not in listed]:
+                changed += self.remove(key)
+        if len(self.large) > MAX_LARGE_SHARE * len(self.entries):  # EVERY REACH QUERY WOULD TEST THEM ALL
+            self.resize(fitting_cell_size(entry[3] for entry in self.entries.values()))
+        return changed
+
+    def resize(self, cell_size: float):
+        """ Re-buckets every light on cells of a new size. """
+        entries = list(self.entries.items())
+        self.cell_size = cell_size
+        self.cells, self.entries = {}, {}
+        self.large.clear()
+        self.unbounded.clear()
+        for key, (x, y, z, radius, _cell) in entries:
+            self.update(key, (x, y, z), radius)
+
+    # QUERIES --------------------------------------------
+    def within(self, center: tuple, distance: float) -> set:
+        """ Returns the keys of the lights at most `distance` away from `center`. """
+        cx, cy, cz = center
+        limit = distance * distance
+        entries = self.entries
+        found = set()
+        for key in self._keys_near(center, distance):
+            x, y, z = entries[key][:3]
+            if (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2 <= limit:
+                found.add(key)
+        return found
+
+    def reaching(self, center: tuple) -> set:
+        """ Returns the keys of the lights whose attenuation sphere contains `center`, and of the lights without a radius. """
+        cx, cy, cz = center
+        entries = self.entries
+        found = set(self.unbounded)
+        # A LIGHT NO LARGER THAN A CELL CAN ONLY REACH THE CENTER FROM A NEIGHBOUR CELL
+        for key in self.large.union(self._keys_near(center, self.cell_size)):
+            x, y, z, radius = entries[key][:4]
+            if radius is not None and (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2 <= radius * radius:
+                found.add(key)
+        return found
+
+    def _keys_near(self, center: tuple, distance: float) -> iter:
+        """ Yields the keys of the cells overlapping the cube of half-size `distance` around `center`. """
+        (x0, y0, z0), (x1, y1, z1) = (self.cell_of(*(value - distance for value in center)),
+                                      self.cell_of(*(value + distance for value in center)))
+        cells = self.cells
+        if (x1 - x0 + 1) * (y1 - y0 + 1) * (z1 - z0 + 1) > len(cells):  # FEWER OCCUPIED CELLS THAN CELLS IN RANGE
+            for (x, y, z), keys in cells.items():
+                if x0 <= x <= x1 and y0 <= y <= y1 and z0 <= z <= z1:
+                    yield from keys
+            return
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                for z in range(z0, z1 + 1):
+                    keys = cells.get((x, y, z))
+                    if keys:
+                        yield from keys
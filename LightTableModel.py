@@ -0,0 +1,509 @@
+import os
+from contextlib import contextmanager, nullcontext
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from PySide6.QtGui import QColor, QGuiApplication, QPixmap
+
+from LightColumns import ATTRIBUTE_COLUMNS
+from LightSnapshot import LAZY_BITS, MISSING_BOOL, TUPLE_COLUMNS, LightSnapshot
+
+SCRIPT_PATH = os.path.dirname(os.path.abspath(__file__))
+
+# ONE KEY PER TABLE COLUMN, DERIVED FROM THE COLUMN REGISTRY OF LightColumns
+COLUMN_KEYS = [column.key for column in ATTRIBUTE_COLUMNS]
+CHECK_KEYS = {column.key for column in ATTRIBUTE_COLUMNS if column.kind == "bool"}
+NUMERIC_KEYS = {column.key for column in ATTRIBUTE_COLUMNS if column.editor == "numeric"}
+COUNT_KEYS = {column.key for column in ATTRIBUTE_COLUMNS if column.kind == "count"}  # SHOWN AS WHOLE NUMBERS
+# A FIRST CLICK ON THESE HEADERS SORTS A TO Z, ON THE OTHERS THE LARGEST VALUES FIRST
+ASCENDING_KEYS = {column.key for column in ATTRIBUTE_COLUMNS if column.kind in ("text", "type")}
+EDITABLE_KEYS = NUMERIC_KEYS | {column.key for column in ATTRIBUTE_COLUMNS if column.editor == "color"}
+CHANNEL_KEYS = ("channel0", "channel1", "channel2")
+# SET BY THE TOOL, KEPT WHEN A ROW IS RE-READ FROM UNREAL: MUTE/SOLO AND THE RESULTS OF THE LAST OVERLAP ANALYSIS.
+# THE SHADOW CASTING READ BY THE ANALYSIS IS A LAZY COLUMN, KEPT WHILE THE LIGHT DOES NOT CHANGE
+PRESERVED_KEYS = ("visible", "solo", "overlaps")
+MAX_REMOVE_NOTIFICATIONS = 64  # MORE SCATTERED BLOCKS OF REMOVED ROWS ARE APPLIED AS ONE RESET
+
+# QT ENUMS RESOLVED ONCE: EACH Qt.<NAME> LOOKUP COSTS MICROSECONDS AND data() RUNS SEVERAL TIMES PER PAINTED CELL
+DISPLAY_ROLE = Qt.DisplayRole
+EDIT_ROLE = Qt.EditRole
+CHECK_STATE_ROLE = Qt.CheckStateRole
+DECORATION_ROLE = Qt.DecorationRole
+TOOL_TIP_ROLE = Qt.ToolTipRole
+TEXT_ALIGNMENT_ROLE = Qt.TextAlignmentRole
+DATA_ROLES = {DISPLAY_ROLE, EDIT_ROLE, CHECK_STATE_ROLE, DECORATION_ROLE, TOOL_TIP_ROLE, TEXT_ALIGNMENT_ROLE}
+CHECKED = Qt.Checked
+UNCHECKED = Qt.Unchecked
+ALIGN_CENTER = Qt.AlignCenter
+DESCENDING = Qt.DescendingOrder
+ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+CHECKABLE_ITEM_FLAGS = ITEM_FLAGS | Qt.ItemIsUserCheckable
+EDITABLE_ITEM_FLAGS = ITEM_FLAGS | Qt.ItemIsEditable
+
+_icon_cache = {}  # LIGHT TYPE -> QPixmap, SHARED BY EVERY MODEL OF THE PROCESS SO A RELAUNCH DOES NOT RELOAD THEM
+
+
+class LightTableModel(QAbstractTableModel):
+    """
+    A table model reading its cells from a columnar LightSnapshot, one snapshot row per table row.
+    The view only paints the visible rows and the delegates create editors on demand,
+    so no widget is kept alive per cell. Edits are not applied here: they are forwarded
+    through `signal_edit_requested` and the logic writes the record back once Unreal accepted them.
+
+    A filter can restrict the table to some snapshot rows (`view_rows`). Every method of the
+    model takes and emits snapshot rows, `source_row` and `view_row` convert from and to table rows.
+
+    The snapshot rows themselves are kept in the order of the sort keys, by light name by default.
+    A click on a header sorts by its column, a Shift+click adds it as a further key.
+    `signal_rows_sorted` is emitted when a click on a header re-orders them, `signal_rows_reordering` and
+    `signal_rows_reordered` around any re-order, so a view can carry its selection over.
+    """
+
+    signal_edit_requested = Signal(int, str, object)  # (snapshot row, attribute key, value)
+    signal_rows_sorted = Signal()
+    signal_rows_reordering = Signal()  # BEFORE THE ROWS MOVE
+    signal_rows_reordered = Signal(list)  # OLD TABLE ROW -> NEW TABLE ROW
+
+    def __init__(self, headers: list, parent: object = None):
+        """
+        Args:
+            headers (list): The header labels, one per entry of COLUMN_KEYS.
+            parent (QObject, optional): The Qt parent of the model.
+        """
+        super().__init__(parent)
+        self.headers = headers
+        self.rows = LightSnapshot()
+        self.view_rows = None  # SNAPSHOT ROWS SHOWN BY THE TABLE WHILE FILTERED, NONE SHOWS EVERY ROW
+        self.revision = 0  # BUMPED WHEN ROWS ARE ADDED, REMOVED, REORDERED OR RENAMED
+        self._view_row_of = {}  # SNAPSHOT ROW -> TABLE ROW WHILE FILTERED
+        self.edited_paths = None  # PATHS OF THE ROWS EDITED OR REMOVED SINCE `track_edits`, NONE WHEN NOT TRACKING
+        self.sort_keys = [("label", False)]  # (KEY OF COLUMN_KEYS, DESCENDING) THE ROWS ARE ORDERED BY, FIRST KEY FIRST
+        self._resetting = False
+
+    # QT MODEL INTERFACE --------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.rows) if self.view_rows is None else len(self.view_rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMN_KEYS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        if role == Qt.DisplayRole:
+            if len(self.sort_keys) > 1:  # "Intensity ▼2": THE DIRECTION AND RANK OF EACH SORT KEY
+                for rank, (key, descending) in enumerate(self.sort_keys, 1):
+                    if key == COLUMN_KEYS[section]:
+                        return f"{self.headers[section]} {'▼' if descending else '▲'}{rank}"
+            return self.headers[section]
+        if role == Qt.InitialSortOrderRole:
+            return Qt.AscendingOrder if COLUMN_KEYS[section] in ASCENDING_KEYS else Qt.DescendingOrder
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role not in DATA_ROLES or not index.isValid():
+            return None
+        if role == TEXT_ALIGNMENT_ROLE:
+            return ALIGN_CENTER
+        key = COLUMN_KEYS[index.column()]
+        value = self.value(self.source_row(index.row()), key)
+
+        if role == DISPLAY_ROLE:
+            if key in CHECK_KEYS and value is not None or key in ("type", "color"):
+                return None
+            if value is None:
+                return "N/A"
+            if isinstance(value, float):
+                return str(int(value)) if key in COUNT_KEYS else f"{value:.3f}"
+            return str(value)
+        if role == EDIT_ROLE:
+            return value
+        if role == CHECK_STATE_ROLE and key in CHECK_KEYS and value is not None:
+            return CHECKED if value else UNCHECKED
+        if role == DECORATION_ROLE and key == "type":
+            return light_icon(value)
+        if role == TOOL_TIP_ROLE and key == "type":
+            return value
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        key = COLUMN_KEYS[index.column()]
+        if self.value(self.source_row(index.row()), key) is None:
+            return ITEM_FLAGS
+        if key in CHECK_KEYS:
+            return CHECKABLE_ITEM_FLAGS
+        if key in EDITABLE_KEYS:
+            return EDITABLE_ITEM_FLAGS
+        return ITEM_FLAGS
+
+    def setData(self, index: QModelIndex, value: object, role: int = Qt.EditRole) -> bool:
+        """ Forwards a cell edit to the logic instead of storing it. """
+        if not index.isValid():
+            return False
+        key = COLUMN_KEYS[index.column()]
+        if role == Qt.CheckStateRole and key in CHECK_KEYS:
+            value = Qt.CheckState(value) == Qt.Checked
+        elif role != Qt.EditRole:
+            return False
+        self.signal_edit_requested.emit(self.source_row(index.row()), key, value)
+        return True
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        """
+        Orders the rows by a column, called by the view when a header is clicked.
+        With Shift held, the column is added as a further sort key, or its direction flips when it is one already.
+        """
+        key, descending = COLUMN_KEYS[column], order == DESCENDING
+        if QGuiApplication.keyboardModifiers() & Qt.ShiftModifier:
+            directions = dict(self.sort_keys)
+            directions[key] = not directions[key] if key in directions else descending
+            sort_keys = list(directions.items())
+        else:
+            sort_keys = [(key, descending)]
+        if sort_keys != self.sort_keys and self.sort_by_keys(sort_keys):
+            self.signal_rows_sorted.emit()
+
+    def sort_by(self, key: str, descending: bool = False) -> bool:
+        """
+        Orders the rows by a single key of COLUMN_KEYS, see `sort_rows`.
+        Returns:
+            bool: True when the rows moved.
+        """
+        return self.sort_by_keys([(key, descending)])
+
+    def sort_by_keys(self, sort_keys: list) -> bool:
+        """
+        Orders the rows by several keys, see `sort_rows`.
+        Args:
+            sort_keys (list): (key of COLUMN_KEYS, descending) pairs, the first key first.
+        Returns:
+            bool: True when the rows moved.
+        """
+        self.sort_keys = list(sort_keys)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(COLUMN_KEYS) - 1)
+        return self.sort_rows()
+
+    # TABLE ROWS --------------------------------------------
+    def source_row(self, row: int) -> int:
+        """ Returns the snapshot row shown at a table row. """
+        return row if self.view_rows is None else self.view_rows[row]
+
+    def view_row(self, row: int) -> int:
+        """ Returns the table row showing a snapshot row, None when it is filtered out. """
+        return row if self.view_rows is None else self._view_row_of.get(row)
+
+    def set_filter(self, rows: set = None) -> bool:
+        """
+        Only shows the given snapshot rows, in snapshot order. The table is reset once instead of
+        hiding rows one at a time, which is what keeps filtering tens of thousands of lights interactive.
+        Args:
+            rows (set, optional): The snapshot rows to show, None shows every row.
+        Returns:
+            bool: True when the shown rows changed, the selection of the view is then cleared.
+        """
+        view_rows = None if rows is None or len(rows) == len(self.rows) else sorted(rows)
+        if view_rows == self.view_rows:
+            return False
+        self.beginResetModel()
+        self._set_view_rows(view_rows)
+        self.endResetModel()
+        return True
+
+    def _set_view_rows(self, view_rows: list):
+        self.view_rows = view_rows
+        self._view_row_of = {} if view_rows is None else {row: view_row for view_row, row in enumerate(view_rows)}
+
+    @contextmanager
+    def _structure_change(self):
+        """
+        Wraps row insertions, removals and reorders. Unfiltered, they emit their own fine-grained
+        notifications. Filtered, they are applied under a single model reset and the filter keeps
+        showing the same lights, plus the new ones.
+        """
+        if self.view_rows is None or self._resetting:
+            yield
+            return
+        paths = self.rows.paths
+        shown_paths = {paths[row] for row in self.view_rows}
+        known_paths = set(paths)
+        self.beginResetModel()
+        self._resetting = True
+        self._set_view_rows(None)
+        try:
+            yield
+        finally:
+            paths = self.rows.paths
+            self._set_view_rows([row for row, path in enumerate(paths) if path in shown_paths or path not in known_paths])
+            self._resetting = False
+            self.endResetModel()
+
+    def _emit_rows_changed(self, rows: list):
+        """ Repaints snapshot rows, one notification per contiguous block of table rows. """
+        if self._resetting:
+            return
+        view_rows = [view_row for view_row in map(self.view_row, rows) if view_row is not None]
+        for first, last in row_ranges(view_rows):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, len(COLUMN_KEYS) - 1))
+
+    # RECORDS --------------------------------------------
+    def value(self, row: int, key: str) -> object:
+        """ Returns the displayed value of a cell, None when it is N/A. """
+        if key == "temperature" and not self.rows.get(row, "use_temperature"):
+            return None  # ONLY EDITABLE WHILE "Use Temp." IS CHECKED
+        return self.rows.get(row, key)
+
+    def set_rows(self, rows: LightSnapshot):
+        """ Replaces every record at once. """
+        self.beginResetModel()
+        self.rows = rows
+        self._set_view_rows(None)
+        self.revision += 1
+        self.endResetModel()
+
+    def reconcile(self, snapshot: LightSnapshot, partial: bool = False, removed_rows: list = None) -> tuple:
+        """
+        Brings the rows in line with a freshly read snapshot and only touches the rows that differ.
+        Rows are matched on the actor "path", so selection, scroll position and the
+        mute/solo state of the lights already listed survive the refresh.
+        While filtered, added or removed lights reset the table once, see `_structure_change`.
+        Args:
+            snapshot (LightSnapshot): The lights read from Unreal.
+            partial (bool, optional): When True the snapshot only covers some lights, the other rows are kept.
+            removed_rows (list, optional): With `partial`, the rows of the lights known to be gone.
+        Returns:
+            tuple: The number of (inserted, updated, removed) rows.
+        """
+        incoming = snapshot.row_by_path()
+        if partial:
+            stale_rows = list(removed_rows or ())
+        else:
+            stale_rows = [row for row, path in enumerate(self.rows.paths) if path not in incoming]
+        known_paths = set(self.rows.paths)
+        structural = stale_rows or any(path not in known_paths for path in incoming)
+
+        with self._structure_change() if structural else nullcontext():
+            removed = self.remove_rows(stale_rows)
+
+            updated_rows = []
+            for row, path in enumerate(self.rows.paths):
+                snapshot_row = incoming.pop(path, None)
+                if snapshot_row is None:
+                    continue
+                changed = self.rows.differs(row, snapshot, snapshot_row, skip=PRESERVED_KEYS)
+                if changed:
+                    updated_rows.append(row)
+                # ALSO REFRESHES THE ACTOR HANDLES. A LIGHT THAT CHANGED DROPS THE LAZY VALUES THE SNAPSHOT DID NOT READ
+                self.rows.copy_row(row, snapshot, snapshot_row, skip=PRESERVED_KEYS, keep_fetched=not changed)
+            self._emit_rows_changed(updated_rows)
+
+            inserted = len(incoming)
+            if inserted:
+                if not self._resetting:
+                    self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + inserted - 1)
+                self.rows.extend_rows(snapshot, sorted(incoming.values()))
+                if not self._resetting:
+                    self.endInsertRows()
+            if inserted or updated_rows:
+                self.revision += 1
+                self.sort_rows()
+        return inserted, len(updated_rows), removed
+
+    def update_rows(self, snapshot: LightSnapshot, rows: dict) -> int:
+        """
+        Overwrites rows with the rows of a freshly read snapshot, only the rows that differ are repainted.
+        The rows are re-sorted when one of them changed, e.g. a light renamed in the editor.
+        Args:
+            snapshot (LightSnapshot): The lights read from Unreal.
+            rows (dict): Row -> snapshot row of the same light.
+        Returns:
+            int: The number of rows that changed.
+        """
+        updated_rows = []
+        for row, snapshot_row in rows.items():
+            changed = self.rows.differs(row, snapshot, snapshot_row, skip=PRESERVED_KEYS)
+            if changed:
+                updated_rows.append(row)
+            # ALSO REFRESHES THE ACTOR HANDLES. A LIGHT THAT CHANGED DROPS THE LAZY VALUES THE SNAPSHOT DID NOT READ
+            self.rows.copy_row(row, snapshot, snapshot_row, skip=PRESERVED_KEYS, keep_fetched=not changed)
+        if updated_rows:
+            self._emit_rows_changed(updated_rows)
+            self.revision += 1
+            self.sort_rows()
+        return len(updated_rows)
+
+    def track_edits(self, enabled: bool):
+        """
+        Starts or stops collecting the paths of the rows edited or removed, into `edited_paths`.
+        A reader that takes several event loop turns uses it to drop what it read before an edit.
+        """
+        self.edited_paths = set() if enabled else None
+
+    def remove_rows(self, rows: list) -> int:
+        """
+        Removes the given snapshot rows, one model notification per contiguous block.
+        Past MAX_REMOVE_NOTIFICATIONS blocks, each of which would shift every following row,
+        the remaining rows are kept in a single pass under one model reset.
+        """
+        if not rows:
+            return 0
+        if self.edited_paths is not None:
+            self.edited_paths.update(self.rows.paths[row] for row in rows)
+        ranges = row_ranges(rows)
+        if len(ranges) > MAX_REMOVE_NOTIFICATIONS:
+            removed = set(rows)
+            with self._structure_change():
+                reset = not self._resetting
+                if reset:
+                    self.beginResetModel()
+                self.rows.reorder([row for row in range(len(self.rows)) if row not in removed])
+                self.revision += 1
+                if reset:
+                    self.endResetModel()
+            return len(rows)
+        with self._structure_change():
+            for first, last in reversed(ranges):
+                if not self._resetting:
+                    self.beginRemoveRows(QModelIndex(), first, last)
+                self.rows.delete_rows(first, last)
+                self.revision += 1
+                if not self._resetting:
+                    self.endRemoveRows()
+        return len(rows)
+
+    def sort_values(self, key: str) -> list:
+        """
+        Returns the sort key of every row, None when it is N/A, read straight from the snapshot columns:
+        the same values as `value`, without a call per cell.
+        """
+        columns = self.rows.columns
+        if key in TUPLE_COLUMNS:
+            return list(zip(*(columns[name] for name in TUPLE_COLUMNS[key])))
+        column = columns[key]
+        if isinstance(column, list):
+            values = column
+        elif column.typecode == "b":
+            values = [None if value == MISSING_BOOL else value for value in column]
+        else:
+            values = [None if value != value else value for value in column]  # NaN
+        if key == "temperature":  # N/A WHILE "Use Temp." IS NOT CHECKED, SEE `value`
+            values = [value if use_temperature == 1 else None
+                      for value, use_temperature in zip(values, columns["use_temperature"])]
+        elif key in LAZY_BITS:
+            bit = LAZY_BITS[key]
+            values = [value if fetched & bit else None for value, fetched in zip(values, columns["fetched"])]
+        return values
+
+    def sort_rows(self) -> bool:
+        """
+        Orders the rows by the sort keys, then by light name. N/A values come last in either direction.
+        Each key is a stable sort of the order left by the keys after it, from the cached values.
+        Persistent indexes (selection, current cell) follow their row, filtered or not.
+        Returns:
+            bool: True when the rows moved.
+        """
+        order = sorted(range(len(self.rows)), key=self.rows.labels.__getitem__)
+        for key, descending in reversed(self.sort_keys):
+            values = self.sort_values(key)
+            missing = [row for row in order if values[row] is None]
+            if missing:
+                order = [row for row in order if values[row] is not None]
+            order.sort(key=values.__getitem__, reverse=descending)  # STABLE, ALSO REVERSED: TIES KEEP THEIR ORDER
+            order += missing
+        if all(old_row == new_row for new_row, old_row in enumerate(order)):
+            return False
+        if self._resetting:
+            self.rows.reorder(order)
+            self.revision += 1
+            return True
+        # A SELECTION LEFT TO THE VIEW WOULD BE SAVED AS ONE PERSISTENT INDEX PER SELECTED CELL, SEE LightTableView
+        self.signal_rows_reordering.emit()
+        self.layoutAboutToBeChanged.emit()
+        new_position = [0] * len(order)
+        for new_row, old_row in enumerate(order):
+            new_position[old_row] = new_row
+        self.rows.reorder(order)
+        self.revision += 1
+        if self.view_rows is None:
+            moved = new_position
+        else:  # TABLE ROW -> SNAPSHOT ROW -> NEW SNAPSHOT ROW -> NEW TABLE ROW, THE SAME LIGHTS STAY SHOWN
+            old_view_rows = [new_position[row] for row in self.view_rows]
+            self._set_view_rows(sorted(old_view_rows))
+            moved = [self._view_row_of[row] for row in old_view_rows]
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [self.index(moved[index.row()], index.column())
+                                                     for index in old_indexes])
+        self.layoutChanged.emit()
+        self.signal_rows_reordered.emit(moved)
+        return True
+
+    def rename_rows(self, labels: dict):
+        """
+        Writes new light names without re-reading the lights, then re-sorts the rows.
+        Args:
+            labels (dict): Snapshot row -> new label.
+        """
+        if not labels:
+            return
+        self.update_column("label", labels)
+        self.revision += 1  # THE NAMES CHANGED, E.G. FOR THE SEARCH NAME INDEX
+        self.sort_rows()
+
+    def update_row(self, row: int, **values):
+        """ Writes attribute values into a record and repaints its row. """
+        if self.edited_paths is not None:
+            self.edited_paths.add(self.rows.paths[row])
+        for key, value in values.items():
+            self.rows.set(row, key, value)
+        self._emit_rows_changed([row])
+
+    def column_changed(self, key: str):
+        """ Repaints a whole column, e.g. once its values were fetched into the records. """
+        if key in COLUMN_KEYS and self.rowCount() and not self._resetting:
+            column = COLUMN_KEYS.index(key)
+            self.dataChanged.emit(self.index(0, column), self.index(self.rowCount() - 1, column))
+
+    def update_column(self, key: str, values: dict):
+        """
+        Writes one attribute for several records and repaints the column in a single pass.
+        Args:
+            key (str): The attribute key, a snapshot column not shown by the table is only written.
+            values (dict): Snapshot row -> new value.
+        """
+        if not values:
+            return
+        if self.edited_paths is not None:
+            self.edited_paths.update(self.rows.paths[row] for row in values)
+        for row, value in values.items():
+            self.rows.set(row, key, value)
+        view_rows = [view_row for view_row in map(self.view_row, values) if view_row is not None]
+        if view_rows and not self._resetting and key in COLUMN_KEYS:
+            column = COLUMN_KEYS.index(key)
+            self.dataChanged.emit(self.index(min(view_rows), column), self.index(max(view_rows), column))
+
+
+def row_ranges(rows: list) -> list:
+    """ Groups row numbers into sorted (first, last) runs of consecutive rows. """
+    ranges = []
+    for row in sorted(rows):
+        if ranges and row == ranges[-1][1] + 1:
+            ranges[-1][1] = row
+        else:
+            ranges.append([row, row])
+    return ranges
+
+
+def light_icon(light_type: str) -> QPixmap:
+    """ Returns the icon of a light type, loaded from disk once per process. """
+    icon = _icon_cache.get(light_type)
+    if icon is None:
+        icon = _icon_cache[light_type] = QPixmap(os.path.join(SCRIPT_PATH, "img", "icons", f"{light_type}.png"))
+    return icon
+
+
+def color_to_qcolor(color: tuple) -> QColor:
+    """ Converts a linear (r, g, b) tuple in the 0-1 range to a QColor. """
+    r, g, b = (max(0, min(255, int(channel * 255))) for channel in color[:3])
+    return QColor(r, g, b)
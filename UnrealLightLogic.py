@@ -1,20 +1,41 @@
-from functools import partial
 import os
-
-from PySide6.QtWidgets import QWidget, QTableWidgetItem, QPushButton, QHBoxLayout, QCheckBox, QLabel, QColorDialog, QApplication
-from PySide6.QtCore import Qt, QTimer, QObject
-from PySide6.QtGui import QPixmap, QColor
-import unreal
-
-from LightManagerUI import CustomLineEditNum
+import time
+from collections import Counter
+
+from PySide6.QtCore import Qt, QTimer, QObject, QItemSelection, QItemSelectionModel
+from PySide6.QtWidgets import QAbstractItemView
+
+from LightColumns import COLUMNS
+from LightCore import LightCore, LightError
+from LightLayout import (NO_ROTATION, LayoutError, csv_placements, grid_placements, path_placements,
+                         ring_placements)
+from LightGroups import LightGroups
+from LightHistory import LightHistory
+from LightProfiler import LightProfiler, profiled
+from LightQuery import NameIndex, QueryError
+from LightRename import RenameError, rename_labels, resolve_labels
+from LightSnapshot import LightSnapshot
+from LightTableModel import COLUMN_KEYS, NUMERIC_KEYS, row_ranges
 
 SCRIPT_PATH = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_LOCATION = (0.0, 0.0, 100.0)  # WHERE create_light SPAWNS A SINGLE LIGHT
+SCRUB_INTERVAL_MS = 16  # AT MOST ONE ENGINE WRITE PER FRAME (~60 FPS) WHILE SCRUBBING
+SYNC_DELAY_MS = 100  # EDITOR EVENTS ARRIVING WITHIN THIS WINDOW ARE APPLIED IN ONE SYNC
+SYNC_POLL_MS = 2000  # FALLBACK POLL OF THE LEVEL, FOR THE CHANGES NO EDITOR EVENT REPORTS
+POPULATE_BUDGET_MS = 12  # ENGINE READS PER EVENT LOOP TURN WHILE POPULATING, THE REST OF THE FRAME STAYS FOR THE EDITOR
+SYNC_MAX_READS = 500  # A SYNC FINDING MORE NEW LIGHTS THAN THIS READS THEM WITH A POPULATION
+SYNC_VERIFY_ROWS = 250  # ROWS RE-READ BY EACH POLL, IN TURN, TO CATCH RENAMES AND EDITS MADE IN THE EDITOR
+REPORT_HOTSPOTS = 10  # SHADOW CASTING LIGHTS NAMED BY THE OVERLAP REPORT
+SPATIAL_POLL_MS = 250  # HOW OFTEN THE SPATIAL FILTER CHECKS WHETHER THE CAMERA OR THE SELECTION MOVED
+SPATIAL_MAX_TARGETS = 200  # SELECTED ACTORS FOLLOWED BY THE SPATIAL FILTER, A HUGE SELECTION IS CUT HERE
 
 
 class UnrealLightLogic(QObject):
     """
     A class that handles the logic and interaction between the UI and Unreal Engine.
     It manages light creation, renaming, deletion, and attribute modification.
+    The work on the lights themselves is done by the Qt-free LightCore, this class maps
+    the table rows, the selection and the UI messages onto it.
     """
 
     def __init__(self, ui):
@@ -25,458 +46,1175 @@ class UnrealLightLogic(QObject):
         """
         super().__init__()
         self.ui = ui
-        self.editor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-        self.ell = unreal.EditorLevelLibrary
+        self.core = LightCore()  # READS AND EDITS THE UNREAL LIGHTS
         self.script_jobs = []  # JOB ID COLLECTOR
-        self.lightTypes = {
-            "SkyLight": [unreal.SkyLight, unreal.SkyLightComponent],
-            "RectLight": [unreal.RectLight, unreal.RectLightComponent],
-            "SpotLight": [unreal.SpotLight, unreal.SpotLightComponent],
-            "PointLight": [unreal.PointLight, unreal.PointLightComponent],
-            "DirectionalLight": [unreal.DirectionalLight, unreal.DirectionalLightComponent],
-        }
-
-    def get_actor_by_label(self, actor_name) -> unreal.Actor:
-        """Finds an actor in the current level by its display label."""
-        all_actors = self.editor_subsystem.get_all_level_actors()
-        for actor in all_actors:
-            if actor.get_actor_label() == actor_name:
-                return actor
-        return
-
+        self.light_index = self.core.light_index  # LABEL -> ACTOR AND ACTOR -> ROW LOOKUPS, SHARED WITH THE CORE
+        self.search_text = ""  # CURRENT SEARCH FILTER, RE-APPLIED AFTER EACH REFRESH
+        self.name_index = NameIndex([])  # TRIGRAM INDEX OF THE LIGHT NAMES, REBUILT WHEN THE ROWS CHANGE
+        self.name_index_revision = -1
+        self.rows_touched = 0  # ROWS INSERTED, UPDATED OR REMOVED BY THE LAST REFRESH
+        self.engine_calls = 0  # UNREAL CALLS MADE TO READ THE LIGHTS OF THE LAST REFRESH
+        self.light_groups = LightGroups()  # NAMED LIGHT GROUPS, KEYED BY ACTOR PATH
+        self.multi_solo = False  # ALLOW SEVERAL SOLOED LIGHTS AT ONCE
+        self.history = LightHistory()  # UNDO/REDO OF THE EDITS MADE THROUGH THE TOOL
+        self.scrub_rows = None  # ROWS EDITED BY THE MOUSE WHEEL SCRUB IN PROGRESS, NONE WHEN NOT SCRUBBING
+        self.scrub_attribute = None
+        self.scrub_value = None  # LATEST SCRUBBED VALUE, NOT WRITTEN TO UNREAL YET
+        self.scrub_table = None
+        self.scrub_timer = QTimer(self)  # THROTTLES THE SCRUB WRITES
+        self.scrub_timer.setInterval(SCRUB_INTERVAL_MS)
+        self.scrub_timer.timeout.connect(self.flush_scrub)
+        self.sync_table = None  # TABLE KEPT IN STEP WITH THE LEVEL, NONE WHILE THE SYNC IS STOPPED
+        self.sync_full = False  # A PENDING EVENT REQUIRES RE-READING EVERY LIGHT
+        self.sync_fingerprint = None  # FINGERPRINT OF THE LIGHT SET AT THE LAST SYNC
+        self.sync_cursor = 0  # NEXT ROW RE-READ BY THE POLL
+        self.sync_timer = QTimer(self)  # MERGES A BURST OF EDITOR EVENTS INTO ONE SYNC
+        self.sync_timer.setSingleShot(True)
+        self.sync_timer.setInterval(SYNC_DELAY_MS)
+        self.sync_timer.timeout.connect(self.sync_scene)
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(SYNC_POLL_MS)
+        self.poll_timer.timeout.connect(self.poll_scene)
+        self.populate_table = None  # TABLE BEING POPULATED, NONE WHEN NO POPULATION IS IN PROGRESS
+        self.populate_actors = None  # ITERATOR OVER THE LIGHT ACTORS LEFT TO READ
+        self.populate_snapshot = None  # LIGHTS READ SO FAR
+        self.populate_new = []  # ROWS OF populate_snapshot WHOSE LIGHT IS NOT IN THE TABLE YET
+        self.populate_total = 0
+        self.populate_read = 0  # LIGHT ACTORS READ SO FAR
+        self.populate_cold = False  # THE TABLE WAS EMPTY: IT FILLS UP WHILE THE LIGHTS ARE READ
+        self.populate_fingerprint = None
+        self.populate_touched = 0
+        self.populate_announce = False
+        self.populate_level = None  # THE POPULATION ONLY READS THE LIGHTS OF THIS LEVEL
+        self.populate_timer = QTimer(self)  # ONE SLICE OF READS PER EVENT LOOP TURN
+        self.populate_timer.setInterval(0)
+        self.populate_timer.timeout.connect(self.populate_step)
+        self.level_filter = None  # ONLY THE LIGHTS OF THIS LEVEL ARE LISTED, NONE LISTS EVERY LEVEL
+        self.level_rows = {}  # LEVEL NAME -> SET OF ROWS, BUILT FOR THE MODEL REVISION BELOW
+        self.level_rows_revision = -1
+        self.spatial_target = None  # "camera" OR "selection" WHILE THE SPATIAL FILTER IS ON
+        self.spatial_mode = "within"  # "within" A DISTANCE OF THE TARGET, OR "reach": THE RADIUS REACHES IT
+        self.spatial_distance = 0.0
+        self.spatial_points = []  # TARGET LOCATIONS THE TABLE IS FILTERED AROUND
+        self.spatial_revision = -1  # MODEL REVISION THE SPATIAL HASH WAS SYNCED AT
+        self.spatial_moved = False  # LIGHTS MOVED OR RESIZED SINCE THE LAST SPATIAL FILTER
+        self.spatial_table = None
+        self.spatial_timer = QTimer(self)  # FOLLOWS THE CAMERA AND THE SELECTION
+        self.spatial_timer.setInterval(SPATIAL_POLL_MS)
+        self.spatial_timer.timeout.connect(self.poll_spatial_target)
+        self.profiler = LightProfiler()  # TIMES THE OPERATIONS BELOW ONCE ENABLED FROM THE STATS PANEL
+        self.profiler.widget_counter = ui.widget_counter.count
+        self.profiler.on_record = self.show_profile
+
+    def get_actor_by_label(self, actor_name) -> object:
+        """Finds a listed light by its display label, using the index built on refresh."""
+        return self.light_index.get(actor_name)
+
+    @profiled
     def rename_light(self, old_name: str, new_name: str, light_table: object):
         """
         Renames a light actor in the Unreal scene and updates the UI table accordingly.
         """
-        num = 0
-        naming_convention = f"{new_name}_{num:03d}"
-
         if not new_name.strip():
             self.info_timer("Error: New name cannot be empty.")
             return
 
-        actor = self.get_actor_by_label(old_name)
-        if actor:  # Check if actor still exists
-            while self.get_actor_by_label(naming_convention) in self.editor_subsystem.get_all_level_actors():
-                num += 1
-                naming_convention = f"{new_name}_{num:03d}"
-            actor.set_actor_label(naming_convention)
-            self.refresh(light_table)
+        row = self.light_index.row_of(self.get_actor_by_label(old_name))
+        label = self.core.rename_light(old_name, new_name)
+        if label:  # Check if actor still exists
+            self.record_edit(light_table, "label", {row: old_name}, {row: label}, "Rename")
+            self.update_lights(light_table, [self.get_actor_by_label(label)])
             self.info_timer(f"Light: '{old_name}' renamed to '{new_name}'")
         else:
             self.info_timer(f"Error: Could not find actor '{old_name}' to rename.")
 
+    @profiled
+    def bulk_rename(self, mode: str, options: dict, light_table: object):
+        """
+        Renames the selected lights, or every listed light when none is selected, with a pattern.
+        Conflicts are resolved against the labels of every actor of the level, light or not,
+        the renames are a single editor transaction and only the names of the renamed rows are updated.
+        Args:
+            mode (str): One of LightRename.RENAME_MODES.
+            options (dict): The pattern options, see LightRename.rename_labels.
+            light_table (QTableView): The table to update.
+        """
+        model = light_table.model()
+        rows = self.selected_rows(light_table) or [model.source_row(row) for row in range(model.rowCount())]
+        old_labels = [model.rows.labels[row] for row in rows]
+        try:
+            new_labels = resolve_labels(old_labels, rename_labels(old_labels, mode, options),
+                                        self.light_index.labels() | self.core.unindexed_labels())
+        except RenameError as error:
+            self.info_timer(f"Error: {error}")
+            return
+
+        renames = [(row, label) for row, old_label, label in zip(rows, old_labels, new_labels) if label != old_label]
+        if not renames:
+            self.info_timer("Bulk rename: no light name changed.")
+            return
+        selected_paths = [model.rows.paths[row] for row in self.selected_rows(light_table)]
+        renamed = self.core.rename_lights(dict(renames))
+        self.record_edit(light_table, "label", dict(zip(rows, old_labels)), renamed, "Bulk rename")
+        # ONLY THE NAMES CHANGED: THE RENAMED ROWS ARE PATCHED AND RE-SORTED INSTEAD OF RE-READ FROM UNREAL
+        model.rename_rows(renamed)
+        self.apply_snapshot(light_table, LightSnapshot(), partial=True)
+        self.select_rows(light_table, [self.light_index.row_of_path(path) for path in selected_paths])
+        self.info_timer(f"{len(renamed)} light(s) renamed.")
+
+    @profiled
     def refresh(self, light_table: object):
         """
-        Clears and repopulates the entire UI table with lights from the Unreal scene.
-        """
-        light_table.setRowCount(0)  # CLEAR EXISTING ROWS
-
-        # REPOPULATE THE TABLE
-        all_actors = self.editor_subsystem.get_all_level_actors()
-        light_actor_class_types = tuple([item[0] for item in self.lightTypes.values()])
-        all_lights = [actor for actor in all_actors if isinstance(actor, light_actor_class_types)]
-
-        for light_actor in sorted(all_lights, key=lambda actor: actor.get_actor_label()):
-            light_type = light_actor.get_class().get_name()
-            light_component_class = self.lightTypes.get(light_type)[1]
-            light_component = light_actor.get_component_by_class(light_component_class)
-
-            if light_component:
-                self.light_name_to_list(light_actor, light_type, light_table)
-                self.mute_solo_to_list(light_actor, light_component, light_table, light_type)
-                self.color_button_to_list(light_component, light_table)
-                self.entry_attr_num_to_list(light_component, "Intensity", 5, light_table)
-                use_temp = self.checkbox_attr_to_list(light_component, "use_temperature", 6, light_table, channel=None)
-                if use_temp == True:
-                    self.entry_attr_num_to_list(light_component, "temperature", 7, light_table)
-                    self.info_timer("Temperature enabled for this light")
-                else:
-                    widget = QLabel("N/A")
-                    widget.setAlignment(Qt.AlignCenter)
-                    light_table.setCellWidget(self.row_position, 7, widget)
-                self.entry_attr_num_to_list(light_component, "attenuation_radius", 8, light_table)
-                self.checkbox_attr_to_list(light_component, "lighting_channels", 9, light_table, channel="channel0")
-                self.checkbox_attr_to_list(light_component, "lighting_channels", 10, light_table, channel="channel1")
-                self.checkbox_attr_to_list(light_component, "lighting_channels", 11, light_table, channel="channel2")
-                #  add more attributes here based on your UI
-
-        self.info_timer("Light Manager refreshed successfully.")
+        Reconciles the UI table with the lights of the Unreal scene.
+        Only the rows whose light was added, removed or changed are touched.
+        The lights are read in the background, see `start_population`. While the table lists a single level,
+        only the lights of that level are read again.
+        """
+        self.start_population(light_table, announce=True, level=self.level_filter)
 
-    def delete(self, light_table: object):
+    # TABLE POPULATION --------------------------------------------
+    def start_population(self, light_table: object, announce: bool = False, level: str = None):
         """
-        Deletes the currently selected light from the Unreal scene.
+        Reads every light of the level in slices of POPULATE_BUDGET_MS run by the Qt event loop, so the editor
+        stays interactive on large levels. A population already in progress is cancelled.
+        The lights of the rows on screen are read first. Each slice updates the rows of the lights it read;
+        the new lights are added at the end, or, when the table was empty, each time their number doubled.
+        Args:
+            light_table (QTableView): The table to populate.
+            announce (bool, optional): Reports the number of updated rows once done.
+            level (str, optional): Only reads the lights of this level, the rows of the other levels are left alone.
         """
-        selected_items = light_table.selectedItems()
-        if not selected_items:
+        self.cancel_population()
+        model = light_table.model()
+        light_actors = self.core.light_actors(level)
+        self.populate_fingerprint = self.core.fingerprint(light_actors)
+        self.populate_total = len(light_actors)
+        self.populate_cold = not len(model.rows)
+        if not self.populate_cold:
+            listed_actors = model.rows.columns["actor"]
+            level_actors = set(light_actors)
+            first_actors = [listed_actors[model.source_row(view_row)] for view_row in light_table.visible_view_rows()]
+            first_actors = [actor for actor in first_actors if actor in level_actors]
+            if first_actors:
+                first = set(first_actors)
+                light_actors = first_actors + [actor for actor in light_actors if actor not in first]
+        self.populate_table = light_table
+        self.populate_actors = iter(light_actors)
+        self.populate_snapshot = LightSnapshot()
+        self.populate_new = []
+        self.populate_read = 0
+        self.populate_touched = 0
+        self.populate_announce = announce
+        self.populate_level = level
+        model.track_edits(True)
+        self.populate_step()
+        if self.populate_table is not None:
+            self.populate_timer.start()
+
+    @profiled
+    def populate_step(self):
+        """ Reads the next slice of lights and merges it, see `start_population`. """
+        light_table = self.populate_table
+        model = light_table.model()
+        snapshot = self.populate_snapshot
+        first = len(snapshot)
+        deadline = time.perf_counter() + POPULATE_BUDGET_MS / 1000
+        self.populate_read += snapshot.read(self.populate_actors, self.core.light_types, deadline, self.core.lazy_columns)
+
+        # THE LIGHTS ALREADY LISTED ARE UPDATED IN PLACE, UNLESS THE TOOL EDITED THEM SINCE THE START
+        edited_paths = model.edited_paths
+        updates = {}
+        for index in range(first, len(snapshot)):
+            path = snapshot.paths[index]
+            if path in edited_paths:
+                continue
+            row = self.light_index.row_of_path(path)
+            if row is None:
+                self.populate_new.append(index)
+            else:
+                updates[row] = index
+        updated = model.update_rows(snapshot, updates)
+        if updated:
+            self.populate_touched += updated
+            self.apply_snapshot(light_table, LightSnapshot(), partial=True)  # RE-INDEXES AND RE-APPLIES THE SEARCH
+
+        if self.populate_read >= self.populate_total:
+            self.finish_population()
             return
+        # AN EMPTY TABLE SHOWS THE FIRST SLICE AT ONCE, THEN GROWS EACH TIME ITS NUMBER OF ROWS CAN DOUBLE
+        if self.populate_cold and self.populate_new and len(self.populate_new) >= len(model.rows):
+            self.merge_new_lights()
+        self.ui.set_progress(self.populate_read, self.populate_total)
+
+    def merge_new_lights(self, removed_rows: list = None):
+        """ Adds the new lights read so far to the table, with `removed_rows` removes the rows of the lights gone. """
+        merged = LightSnapshot()
+        merged.extend_rows(self.populate_snapshot, self.populate_new)
+        self.populate_new = []
+        self.apply_snapshot(self.populate_table, merged, partial=True, removed_rows=removed_rows, changes_only=True)
+        self.populate_touched += self.rows_touched
+
+    def finish_population(self):
+        """
+        Adds the remaining new lights and removes the rows of the lights no longer in the level.
+        Lights deleted while the population ran are left out, lights added meanwhile are left to the sync.
+        """
+        model = self.populate_table.model()
+        level = self.populate_level
+        level_actors = set(self.core.light_actors(level))
+        actors = self.populate_snapshot.columns["actor"]
+        self.populate_new = [index for index in self.populate_new if actors[index] in level_actors]
+        removed_rows = [row for row, (actor, row_level) in enumerate(zip(model.rows.columns["actor"], model.rows.columns["level"]))
+                        if actor not in level_actors and (level is None or row_level == level)]
+        self.engine_calls = self.populate_snapshot.engine_calls
+        if level is None:  # A SINGLE LEVEL SAYS NOTHING OF THE OTHERS, THE NEXT POLL COMPARES THE WHOLE LIGHT SET
+            self.sync_fingerprint = self.populate_fingerprint
+        model.track_edits(False)
+        self.merge_new_lights(removed_rows)
+        self.fetch_columns(self.populate_table)  # A COLUMN SHOWN WHILE THE POPULATION RAN
+        self.rows_touched = self.populate_touched
+        announce = self.populate_announce
+        self.stop_population()
+        if announce:
+            self.info_timer(f"Light Manager refreshed successfully. {self.rows_touched} row(s) updated.")
+
+    def stop_population(self):
+        """ Ends the population in progress, the rows merged so far stay in the table. """
+        if self.populate_table is None:
+            return
+        self.populate_timer.stop()
+        self.populate_table.model().track_edits(False)
+        self.populate_table = None
+        self.populate_actors = None
+        self.populate_snapshot = None
+        self.populate_new = []
+        self.populate_level = None
+        self.ui.set_progress(0, 0)
+
+    def cancel_population(self):
+        """
+        Cancels the population in progress, e.g. for a new refresh, a search or when the window closes.
+        The next sync poll reads the lights that were left out.
+        """
+        if self.populate_table is not None:
+            self.stop_population()
+            self.sync_fingerprint = None
 
-        light_name = selected_items[0].text()
-        actor_to_delete = self.get_actor_by_label(light_name)
-
-        if actor_to_delete:
-            self.editor_subsystem.destroy_actor(actor_to_delete)
-            self.refresh(light_table)
-            self.info_timer(f"Light '{light_name}' deleted successfully.")
-        else:
-            self.info_timer(f"Error: Could not find actor '{light_name}' to delete.")
+    def wait_population(self):
+        """ Runs the population in progress to its end, without going back to the event loop. """
+        while self.populate_table is not None:
+            self.populate_step()
 
-    def light_table_selection(self, lightTable: object):
+    # SCENE SYNC --------------------------------------------
+    def start_sync(self, light_table: object):
         """
-        Selects the corresponding light actor in the Unreal scene when a row is selected in the UI table.
-        """
-        selected_items = lightTable.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            light_name_item = lightTable.item(row, 0)
-            if light_name_item:
-                light_name = light_name_item.text()
-                self.editor_subsystem.set_selected_level_actors([])  # CLEAR CURRENT SELECTION
-                try:
-                    actor = self.get_actor_by_label(light_name)
-                    self.editor_subsystem.set_selected_level_actors([actor])  # SELECT THE ACTOR
-                except ValueError:
-                    self.info_timer(f"Error:  '{light_name}' None Existent")
-        else:
-            self.editor_subsystem.set_selected_level_actors([])
-
-    def create_light(self, light_name: str, light_type: str, light_table: object):
+        Keeps the table in step with the level: lights added, deleted or renamed in the editor show up
+        without the Refresh button. Editor events are merged over SYNC_DELAY_MS, a slow poll catches the rest.
         """
-        Creates a new light actor in the Unreal scene with a unique name based on the specified type and optional name.
+        self.sync_table = light_table
+        self.core.subscribe(self.on_editor_event)
+        self.poll_timer.start()
+
+    def stop_sync(self):
+        """ Stops following the level, e.g. when the window closes. """
+        self.cancel_population()
+        self.core.unsubscribe()
+        self.poll_timer.stop()
+        self.sync_timer.stop()
+        self.spatial_timer.stop()
+        self.sync_table = None
+
+    def on_editor_event(self, kind: str):
+        """
+        Takes note of an editor event, see LightCore.subscribe. The sync itself runs once the burst is over,
+        outside of the editor operation that raised the event.
+        """
+        if kind == "level":
+            self.sync_full = True
+            self.history.clear()  # THE HISTORY HOLDS THE LIGHTS OF THE PREVIOUS LEVEL
+            self.update_history_state()
+        if not self.sync_timer.isActive():  # THE WINDOW OPENS ON THE FIRST EVENT, LATER ONES JOIN IT
+            self.sync_timer.start()
+
+    def poll_scene(self):
+        """ Fallback for the changes no editor event reports, runs every SYNC_POLL_MS. """
+        # A SCRUB WRITES THE LIGHTS BEHIND THE TABLE, DO NOT READ THEM BACK. A POPULATION READS THEM ANYWAY.
+        if self.scrub_rows is None and self.populate_table is None:
+            self.sync_scene(verify=True)
+
+    @profiled
+    def sync_scene(self, verify: bool = False):
+        """
+        Applies the changes of the level to the table, touching only the rows that changed.
+        The light set is compared through its fingerprint: when it differs, the rows of the lights gone are
+        removed and only the new lights are read.
+        Args:
+            verify (bool, optional): Also re-reads the next SYNC_VERIFY_ROWS rows, to catch the renames and
+                attribute edits made in the editor. Over successive polls every row is re-read in turn.
         """
-        if light_type not in self.lightTypes:
-            self.info_timer(f"Error: Light type '{light_type}' is invalid.")
+        light_table = self.sync_table
+        if light_table is None:
+            return
+        if self.sync_full:
+            self.sync_full = False
+            self.start_population(light_table)
+            return
+        if self.populate_table is not None:  # ITS FINAL MERGE DROPS THE DELETED LIGHTS, THE NEXT POLL FINDS THE NEW ONES
             return
 
-        if not light_name.strip():
-            light_name = light_type
-
-        # INCREMENTAL NAMING CONVENTION
-        num = 0
-        naming_convention = f"LGT_{light_name}_{num:03d}"
-        all_actor_labels = {actor.get_actor_label() for actor in self.editor_subsystem.get_all_level_actors()}
-        while naming_convention in all_actor_labels:
-            num += 1
-            naming_convention = f"LGT_{light_name}_{num:03d}"
+        model = light_table.model()
+        listed_actors = model.rows.columns["actor"]
+        removed_rows, new_actors = [], []
+        light_actors = self.core.light_actors()
+        fingerprint = self.core.fingerprint(light_actors)
+        if fingerprint != self.sync_fingerprint:
+            level_actors = set(light_actors)
+            removed_rows = [row for row, actor in enumerate(listed_actors) if actor not in level_actors]
+            listed = set(listed_actors)
+            new_actors = [actor for actor in light_actors if actor not in listed]
+            if len(new_actors) > SYNC_MAX_READS:
+                self.start_population(light_table)
+                return
+            self.sync_fingerprint = fingerprint
+
+        verified_actors = []
+        if verify and listed_actors:
+            if self.sync_cursor >= len(listed_actors):
+                self.sync_cursor = 0
+            gone = set(removed_rows)
+            end = self.sync_cursor + SYNC_VERIFY_ROWS
+            verified_actors = [listed_actors[row] for row in range(self.sync_cursor, min(end, len(listed_actors)))
+                               if row not in gone]
+            self.sync_cursor = end
+
+        if removed_rows or new_actors or verified_actors:
+            self.apply_snapshot(light_table, self.read_lights(new_actors + verified_actors), partial=True,
+                                removed_rows=removed_rows, changes_only=True)
+
+    def update_lights(self, light_table: object, light_actors: list):
+        """
+        Re-reads only the given lights and merges them into the UI table, the other rows are left alone.
+        """
+        self.apply_snapshot(light_table, self.read_lights(light_actors), partial=True)
 
-        # SPAWN THE LIGHT ACTOR
-        light_location = unreal.Vector(x=0.0, y=0.0, z=100.0)
-        light_actor_class = self.lightTypes.get(light_type)
+    def read_lights(self, light_actors: list) -> LightSnapshot:
+        """
+        Reads every displayed attribute of the given light actors in one pass.
+        Lights without a light component are skipped.
+        """
+        snapshot = self.core.read_lights(light_actors)
+        self.engine_calls = snapshot.engine_calls
+        return snapshot
 
-        if not light_actor_class[0]:
-            self.info_timer(f"Error: Could not find class for light type '{light_type}'.")
+    def apply_snapshot(self, light_table: object, snapshot: LightSnapshot, partial: bool = False,
+                       removed_rows: list = None, changes_only: bool = False):
+        """
+        Merges a freshly read snapshot into the table model, then re-indexes the rows and re-applies the search.
+        Args:
+            light_table (QTableView): The table to update.
+            snapshot (LightSnapshot): The lights read from Unreal.
+            partial (bool, optional): The snapshot only covers some lights, see LightTableModel.reconcile.
+            removed_rows (list, optional): With `partial`, the rows of the lights known to be gone.
+            changes_only (bool, optional): Skips the re-indexing when no row changed.
+        """
+        model = light_table.model()
+        filtered = model.view_rows is not None
+        if filtered:  # A FILTERED TABLE IS RESET BY ADDED OR REMOVED ROWS, THE SELECTION IS RESTORED BY PATH
+            selected_paths = [model.rows.paths[row] for row in self.selected_rows(light_table)]
+        inserted, updated, removed = model.reconcile(snapshot, partial, removed_rows)
+        self.rows_touched = inserted + updated + removed
+        if changes_only and not self.rows_touched:
             return
 
-        # Create the light actor
-        light_actor = self.editor_subsystem.spawn_actor_from_class(light_actor_class[0], location=light_location)
-        # Set the Actor name
-        light_actor.set_actor_label(naming_convention)
-        # Access  Light Component from the actor
-        light_component = light_actor.get_component_by_class(light_actor_class[1])
-
-        # SET DEFAULT ATTRIBUTES BASED ON LIGHT TYPE
-        if light_component:
-            if light_type == "SkyLight":
-                light_component.set_mobility(unreal.ComponentMobility.MOVABLE)
-                light_component.set_intensity(1.0)
-            elif light_type == "DirectionalLight":
-                light_component.set_intensity(3.0)
-            else:
-                desired_units = unreal.LightUnits.LUMENS
-                light_component.set_intensity_units(desired_units)
-                light_component.set_intensity(10.0)
-                light_component.set_attenuation_radius(1000)
-                light_component.set_lighting_channels(channel0=True, channel1=False, channel2=False)
+        self.core.index_rows(model.rows)
+        if self.search_text or self.spatial_target or self.level_filter:
+            self.filter_rows(self.search_text, light_table)
+        if filtered and inserted + removed:
+            self.select_rows(light_table, [self.light_index.row_of_path(path) for path in selected_paths])
+        if inserted + removed:
+            self.update_levels(light_table)
+        self.update_all_lights_visibility(light_table)  # NEW LIGHTS FOLLOW AN ACTIVE SOLO
 
-            light_component.set_light_color(unreal.LinearColor(1.0, 1.0, 1.0))
-            light_component.set_cast_shadows(True)
+    @profiled
+    def delete(self, light_table: object):
+        """
+        Deletes the currently selected lights from the Unreal scene, in a single editor transaction.
+        """
+        selected_rows = self.selected_rows(light_table)
+        if not selected_rows:
+            return
 
-        # POPULATE THE TABLE LIST
-        self.refresh(light_table)  # REFRESH THE ENTIRE TABLE
+        model = light_table.model()
+        labels = [model.rows.labels[row] for row in selected_rows]
+        deleted = set(self.core.delete_lights(labels))
+        for label in labels:
+            if label not in deleted:
+                self.info_timer(f"Error: Could not find actor '{label}' to delete.")
+
+        if deleted:
+            model.remove_rows([row for row, label in zip(selected_rows, labels) if label in deleted])
+            self.apply_snapshot(light_table, LightSnapshot(), partial=True)
+            if len(deleted) == 1:
+                self.info_timer(f"Light '{next(iter(deleted))}' deleted successfully.")
+            else:
+                self.info_timer(f"{len(deleted)} lights deleted successfully.")
 
-        self.info_timer(f"'{light_type}': '{light_name}' has been created successfully.")
+    @profiled
+    def light_table_selection(self, lightTable: object):
+        """
+        Selects the corresponding light actors in the Unreal scene when rows are selected in the UI table.
+        """
+        actors = []
+        for row in self.selected_rows(lightTable):
+            actor = self.light_index.actor_at(row)
+            if actor:
+                actors.append(actor)
+            else:
+                self.info_timer(f"Error:  '{lightTable.model().rows[row]['label']}' None Existent")
+        self.core.select_actors(actors)  # AN EMPTY LIST CLEARS THE SELECTION
 
-    def light_name_to_list(self, light_actor: unreal.Actor, light_type: str, light_table: object):
+    @profiled
+    def create_light(self, light_name: str, light_type: str, light_table: object):
         """
-        Adds a new row to the light table for the given light actor. 
+        Creates a new light actor in the Unreal scene with a unique name based on the specified type and optional name.
         """
-        self.row_position = light_table.rowCount()
-        light_table.insertRow(self.row_position)
+        self.create_lights(light_name, light_type, [(DEFAULT_LOCATION, NO_ROTATION)], light_table)
 
-        # POPULATE THE "Name" COLUMN
-        name_item = QTableWidgetItem(light_actor.get_actor_label())
-        name_item.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-        light_table.setItem(self.row_position, 0, name_item)
+    def create_lights(self, light_name: str, light_type: str, placements: list, light_table: object) -> list:
+        """
+        Spawns one light per placement in a single editor transaction, see LightCore.spawn_lights.
+        The table is updated once, at the end, with the new lights only.
+        Args:
+            light_name (str): The base name of the lights, the light type when empty.
+            light_type (str): A key of `LightCore.light_types`.
+            placements (list): ((x, y, z), (roll, pitch, yaw)) pairs, see LightLayout.
+            light_table (QTableView): The table to update.
+        Returns:
+            list: The spawned light actors.
+        """
+        try:
+            created_actors = self.core.spawn_lights(light_name, light_type, placements)
+        except LightError as error:
+            self.info_timer(f"Error: {error}")
+            return []
 
-        # POPULATE THE "Light Type" COLUMN
-        icon_light_type = QLabel()
-        icon_path = os.path.join(SCRIPT_PATH, "img", "icons", f"{light_type}.png")
+        # POPULATE THE TABLE LIST
+        self.update_lights(light_table, created_actors)  # ONLY THE NEW ROWS ARE READ
 
-        img = QPixmap(icon_path)
-        icon_light_type.setPixmap(img)
-        icon_light_type.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-        light_table.setCellWidget(self.row_position, 3, icon_light_type)
+        if len(created_actors) == 1:
+            self.info_timer(f"'{light_type}': '{light_name.strip() or light_type}' has been created successfully.")
+        else:
+            self.info_timer(f"{len(created_actors)} '{light_type}' lights have been created successfully.")
+        return created_actors
 
-    def mute_solo_to_list(self, light_actor: unreal.Actor, light_component: unreal, light_table: object, light_type: str):
+    @profiled
+    def batch_create(self, light_name: str, light_type: str, layout: str, options: dict, light_table: object):
         """
-        Adds Mute and Solo checkboxes to the current row in the table.
+        Creates several lights laid out procedurally, see `create_lights`.
+        Args:
+            light_name (str): The base name of the lights.
+            light_type (str): A key of `LightCore.light_types`.
+            layout (str): "Grid", "Ring", "Along Selection" or "CSV".
+            options (dict): "count", "spacing" (the radius of a ring), "height" and "csv_path".
+            light_table (QTableView): The table to update.
         """
-        mute_widget = QWidget()
-        mute_checkbox = QCheckBox()
-        mute_checkbox.setStyleSheet("QCheckBox::indicator:unchecked { background-color: #f94144 }")
-        if light_component:
-            actual_visibility = light_component.is_visible()
-            if actual_visibility == True or actual_visibility == False:
-                mute_checkbox.setChecked(actual_visibility)
-            mute_checkbox.stateChanged.connect(partial(self.update_all_lights_visibility, light_table))
+        count, spacing, height = options.get("count", 1), options.get("spacing", 100.0), options.get("height", 0.0)
+        # GRIDS AND RINGS ARE CENTERED ON THE ACTORS SELECTED IN THE EDITOR, OR ON THE WORLD ORIGIN
+        points = [self.core.actor_location(actor) for actor in self.core.selected_actors()]
+        if points:
+            center = tuple(sum(axis) / len(points) for axis in zip(*points))
+            origin = (center[0], center[1], center[2] + height)
+        else:
+            origin = (0.0, 0.0, height)
+
+        if layout == "Grid":
+            placements = grid_placements(count, spacing, origin)
+        elif layout == "Ring":
+            placements = ring_placements(count, spacing, origin)
+        elif layout == "Along Selection":
+            if not points:
+                self.info_timer("Error: Select the actors to place the lights along in the level first.")
+                return
+            placements = path_placements(count, points, height)
+        elif layout == "CSV":
+            try:
+                placements = csv_placements(options.get("csv_path", ""))
+            except (OSError, LayoutError) as error:
+                self.info_timer(f"Error: Could not read the positions: {error}")
+                return
         else:
-            self.info_timer(
-                f"Warning: No light component found for actor '{light_actor.get_actor_label()}' of type '{light_type}'. Mute checkbox disabled.")
-            mute_checkbox.setEnabled(False)
-            mute_checkbox.setChecked(False)  # Default to not muted if component is missing
-
-        mute_checkbox.stateChanged.connect(lambda: self.update_all_lights_visibility(light_table))
-        mute_layout = QHBoxLayout(mute_widget)
-        mute_layout.addWidget(mute_checkbox)
-        mute_layout.setAlignment(Qt.AlignCenter)
-        mute_layout.setContentsMargins(0, 0, 0, 0)
-
-        solo_widget = QWidget()
-        solo_checkbox = QCheckBox()
-        solo_checkbox.setStyleSheet("QCheckBox::indicator:checked { background-color: #adb5bd }")
-        solo_checkbox.stateChanged.connect(partial(self.on_solo_toggled, self.row_position, light_table))
-        solo_layout = QHBoxLayout(solo_widget)
-        solo_layout.addWidget(solo_checkbox)
-        solo_layout.setAlignment(Qt.AlignCenter)
-        solo_layout.setContentsMargins(0, 0, 0, 0)
-
-        light_table.setCellWidget(self.row_position, 1, mute_widget)
-        light_table.setCellWidget(self.row_position, 2, solo_widget)
-
-    def color_button_to_list(self, light_component, light_table: object):
-        """
-        Adds a color button to the current row in the table that reflects the light's color.
-        Clicking the button opens a color picker to change the light's color.
-        """
-        colorBtn_widget = QWidget()
-        colorBtn = QPushButton()
-        colorBtn.setFixedSize(56, 26)
-        self.set_button_color(light_component, colorBtn)
-        colorBtn.clicked.connect(partial(self.set_color, light_component, colorBtn))
-
-        colorBtn_layout = QHBoxLayout(colorBtn_widget)
-        colorBtn_layout.addWidget(colorBtn)
-        colorBtn_layout.setAlignment(Qt.AlignCenter)
-        colorBtn_layout.setContentsMargins(0, 0, 0, 0)
-        light_table.setCellWidget(self.row_position, 4, colorBtn_widget)
-
-    def entry_attr_num_to_list(self, light_component: unreal, attribute_name: str, column: int, light_table: object):
-        """
-        Adds a numeric input field to a cell for a specific float or int attribute.
+            self.info_timer(f"Error: Unknown layout '{layout}'.")
+            return
+        self.create_lights(light_name, light_type, placements, light_table)
+
+    # LIGHT RIG PRESETS --------------------------------------------
+    @profiled
+    def save_preset(self, file_path: str, light_table: object):
+        """
+        Saves the selected lights, or every listed light when none is selected, to a preset file.
+        """
+        start = time.perf_counter()
+        try:
+            count, skipped = self.core.save_lights(file_path, light_table.model().rows,
+                                                   self.selected_rows(light_table) or None)
+        except OSError as error:
+            self.info_timer(f"Error: Could not save the preset: {error}")
+            return
+        elapsed = time.perf_counter() - start
+        message = f"Preset saved: {count} light(s) in {elapsed:.2f}s."
+        if skipped:
+            message += f" {len(skipped)} light(s) skipped, refresh the table."
+        self.info_timer(message)
+
+    # LIGHTING REPORT EXPORT --------------------------------------------
+    @profiled
+    def export_lights(self, file_path: str, export_format: str, light_table: object):
+        """
+        Exports the selected lights, or every listed light when none is selected, to a CSV or JSON Lines report.
+        The listed lights are the ones left by the search and the filters, in the order of the table.
+        Args:
+            file_path (str): The report file.
+            export_format (str): "csv" or "jsonl", see LightExport.write_export.
+            light_table (QTableView): The table listing the lights.
         """
+        model = light_table.model()
+        rows = self.selected_rows(light_table) or model.view_rows
+        start = time.perf_counter()
         try:
-            atttribute_value = light_component.get_editor_property(attribute_name)
-        except (Exception, ValueError):
-            self.info_timer(f"No Parameter {attribute_name} for this light")
-            widget = QLabel("N/A")
-            widget.setAlignment(Qt.AlignCenter)
-            light_table.setCellWidget(self.row_position, column, widget)
+            count, skipped = self.core.export_lights(file_path, export_format, model.rows, rows)
+        except OSError as error:
+            self.info_timer(f"Error: Could not export the lights: {error}")
             return
-        # SETTING THE CURRENT VALUE IN THE UI
-        bar_text = CustomLineEditNum()
-        bar_text.setFixedSize(65, 29)
-        bar_text.setAlignment(Qt.AlignCenter)
-
-        if isinstance(atttribute_value, (float)):
-            bar_text.setText(f"{atttribute_value:.3f}")
-        elif isinstance(atttribute_value, (int)):
-            bar_text.setText(f"{atttribute_value}")
-
-        def _update_unreal_from_ui():
-            # GET VALUE FROM UI
-            new_value = float(bar_text.text())
+        elapsed = time.perf_counter() - start
+        message = (f"Exported {count} light(s) to {os.path.basename(file_path)} in {elapsed:.2f}s "
+                   f"({count / max(elapsed, 1e-6):,.0f} rows/s).")
+        if skipped:
+            message += f" {len(skipped)} light(s) skipped, refresh the table."
+        self.info_timer(message)
+
+    @profiled
+    def load_preset(self, file_path: str, light_table: object):
+        """
+        Loads a preset in a single editor transaction, undone in one step, see LightCore.load_lights.
+        The table is updated once, at the end, with the lights that were touched.
+        """
+        start = time.perf_counter()
+        touched_actors, spawned, skipped, error = self.core.load_lights(file_path)
+        self.update_lights(light_table, touched_actors)
+        elapsed = time.perf_counter() - start
+        if error:
+            self.info_timer(f"Error: Could not load the preset: {error}")
+            return
+        message = (f"Preset loaded: {len(touched_actors)} light(s), {spawned} spawned, "
+                   f"{len(touched_actors) - spawned} updated in {elapsed:.2f}s.")
+        if skipped:
+            message += f" {skipped} light(s) of an unknown type skipped."
+        self.info_timer(message)
+
+    def selected_rows(self, light_table: object) -> list:
+        """ Returns the snapshot rows of the selected table rows, in ascending order. """
+        model = light_table.model()
+        return sorted(model.source_row(row) for row in light_table.selected_view_rows())
+
+    def select_rows(self, light_table: object, rows: list):
+        """ Replaces the table selection with the given snapshot rows, the filtered out ones are skipped. """
+        model = light_table.model()
+        view_rows = (model.view_row(row) for row in rows)
+        selection = QItemSelection()
+        for first, last in row_ranges([view_row for view_row in view_rows if view_row is not None]):
+            selection.select(model.index(first, 0), model.index(last, model.columnCount() - 1))
+        light_table.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
+
+    @profiled
+    def edit_light(self, row: int, attribute_name: str, value: object, light_table: object):
+        """
+        Applies a cell edit from the table to the Unreal lights, then updates the table records.
+        When the edited row is part of a multi-selection, every selected light that has the attribute
+        is edited in a single editor transaction (one undo entry) and the table is repainted once.
+        """
+        model = light_table.model()
+        if attribute_name == "solo":
+            self.on_solo_toggled(row, light_table, value)
+            return
+
+        selected_rows = self.selected_rows(light_table)
+        rows = selected_rows if row in selected_rows else [row]
+        scrubbing = self.scrub_rows is not None and attribute_name == self.scrub_attribute
+        if scrubbing:  # FINAL COMMIT OF A SCRUB, WRITTEN INSIDE ITS TRANSACTION
+            rows, self.scrub_value = self.scrub_rows, None
+
+        if attribute_name == "visible":
+            new_values = {i: bool(value) for i in rows}
+            self.record_edit(light_table, "visible", {i: model.rows.get(i, "visible") for i in rows}, new_values,
+                             "Unmute" if value else "Mute")
+            model.update_column("visible", new_values)
+            self.update_all_lights_visibility(light_table)
+            return
+        if attribute_name in NUMERIC_KEYS:
             try:
-                # SET VALUE IN UNREAL
-                light_component.set_editor_property(attribute_name, new_value)
-            except (ValueError, RuntimeError):
+                value = float(value)
+            except (TypeError, ValueError):
                 self.info_timer(f"Wrong input:  Please enter a number")
-                # ON ERROR, Reset the text to the current value in UNREAL
-                current_unreal_val = light_component.get_editor_property(attribute_name)
-                if isinstance(current_unreal_val, (float)):
-                    bar_text.setText(f"{current_unreal_val:.3f}")
-                elif isinstance(current_unreal_val, (int)):
-                    bar_text.setText(f"{current_unreal_val}")
-        bar_text.editingFinished.connect(_update_unreal_from_ui)
-
-        widget = QWidget()
-        bar_text_layout = QHBoxLayout(widget)
-        bar_text_layout.addWidget(bar_text)
-        bar_text_layout.setAlignment(Qt.AlignCenter.AlignCenter)
-        bar_text_layout.setContentsMargins(0, 0, 0, 0)
-        light_table.setCellWidget(self.row_position, column, widget)
-
-    def checkbox_attr_to_list(self, light_component: unreal, attribute_name: str, column: int, light_table: object, channel: str = None):
-        """
-        Adds a checkbox to a cell for a specific boolean attribute.
-        If the attribute is 'lighting_channels', a specific channel can be specified."""
-        if not light_component:
-            return
+                return
+        elif attribute_name != "color":
+            value = bool(value)
 
-        try:
-            current_value = light_component.get_editor_property(attribute_name)
+        self.write_rows(light_table, rows, attribute_name, value)
+        if scrubbing:
+            self.end_scrub(light_table)
 
-        except (Exception, ValueError):
-            self.info_timer(f"No Parameter {attribute_name} for this light")
-            widget = QLabel("N/A")
-            widget.setAlignment(Qt.AlignCenter)
-            light_table.setCellWidget(self.row_position, column, widget)
+    def write_rows(self, light_table: object, rows: list, attribute_name: str, value: object):
+        """
+        Writes one attribute value to several lights in a single editor transaction,
+        then repaints the column once. Lights without the attribute are skipped.
+        """
+        self.write_values(light_table, dict.fromkeys(rows, value), attribute_name)
+
+    def write_values(self, light_table: object, values: dict, attribute_name: str, action: str = "Edit",
+                     record: bool = True):
+        """
+        Writes one attribute of several lights, each its own value, see `write_rows`.
+        Args:
+            light_table (QTableView): The table to update.
+            values (dict): Snapshot row -> value.
+            attribute_name (str): The attribute written.
+            action (str, optional): Names the editor transaction, e.g. "Undo".
+            record (bool, optional): Records the edit in the undo history.
+        """
+        model = light_table.model()
+        old_values = {row: model.rows.get(row, attribute_name) for row in values} if record else None
+        new_values, rejected = self.core.write_values(model.rows, values, attribute_name, action)
+        if rejected:
+            self.info_timer(f"Wrong input for {attribute_name}")
+        if record:
+            self.record_edit(light_table, attribute_name, old_values, new_values, f"Edit {attribute_name}")
+        model.update_column(attribute_name, new_values)
+        if attribute_name == "attenuation_radius" and self.spatial_target:
+            self.core.sync_spatial_hash(model.rows, list(new_values))
+            self.spatial_moved = True
+
+    def scrub_light(self, row: int, attribute_name: str, value: float, light_table: object):
+        """
+        Live-writes a numeric value scrubbed with the mouse wheel, to the whole selection when the row is part of it.
+        Writes are capped to one per frame: the first tick is written at once, the ticks received
+        until the next frame are merged and only the latest value is written. The scrub is a single
+        editor transaction, closed by `end_scrub`, so it is undone in one step.
+        """
+        if self.scrub_rows is None:
+            selected_rows = self.selected_rows(light_table)
+            self.scrub_rows = selected_rows if row in selected_rows else [row]
+            self.scrub_attribute = attribute_name
+            self.scrub_table = light_table
+            self.core.begin_transaction(f"Scrub {attribute_name} ({len(self.scrub_rows)} light(s))")
+        self.scrub_value = value
+        if not self.scrub_timer.isActive():
+            self.flush_scrub()
+            self.scrub_timer.start()
+
+    @profiled
+    def flush_scrub(self):
+        """ Writes the pending scrubbed value, the throttle stops once a frame passes without new tick. """
+        if self.scrub_value is None:
+            self.scrub_timer.stop()
             return
+        value, self.scrub_value = self.scrub_value, None
+        self.write_rows(self.scrub_table, self.scrub_rows, self.scrub_attribute, value)
 
-        if attribute_name == "lighting_channels":
-            current_value = current_value.get_editor_property(channel)
-        if current_value is True or current_value is False:
-            widget = QWidget()
-            checkbox = QCheckBox()
-            checkbox.setChecked(bool(current_value))
-
-        def _update_unreal_from_ui(state):
-            if attribute_name == "lighting_channels":
-                light_channels = light_component.get_editor_property(attribute_name)
-                light_channels.set_editor_property(channel, bool(state))
-                light_component.set_editor_property("lighting_channels", light_channels)
-            elif light_component:
-                light_component.set_editor_property(attribute_name, state)
-
-        checkbox.stateChanged.connect(_update_unreal_from_ui)
-
-        layout = QHBoxLayout(widget)
-        layout.addWidget(checkbox)
-        layout.setAlignment(Qt.AlignCenter)
-        layout.setContentsMargins(0, 0, 0, 0)
-        light_table.setCellWidget(self.row_position, column, widget)
-        return current_value
+    @profiled
+    def end_scrub(self, light_table: object):
+        """ Writes the last scrubbed value if it is still pending and closes the scrub transaction. """
+        if self.scrub_rows is None:
+            return
+        self.flush_scrub()
+        self.scrub_timer.stop()
+        self.core.end_transaction()
+        self.scrub_rows = self.scrub_attribute = self.scrub_value = self.scrub_table = None
 
+    @profiled
     def on_solo_toggled(self, toggled_row: int, light_table: object, state: bool, *args: str):
         """
-        Ensures that only one 'Solo' checkbox can be active at a time.
+        Ensures that only one 'Solo' checkbox can be active at a time, unless multi solo is enabled.
         When a 'Solo' checkbox is checked, all other 'Solo' checkboxes are unchecked.
         """
-        if state == Qt.Checked:
-            # SKIP the ROW OF THE CHECKBOX THAT WAS JUST TOGGLED
-            for i in range(light_table.rowCount()):
-                if i != toggled_row:
-                    solo_widget = light_table.cellWidget(i, 2)
-                    if solo_widget:
-                        # RETRIEVE THE CUSTOM WIDGET IN THE  'Solo' COLUMN
-                        solo_checkbox = solo_widget.findChild(QCheckBox)
-                        if solo_checkbox and solo_checkbox.isChecked():     # PREVENT RECURSIVE CALLS OF THIS FUNCTION
-                            solo_checkbox.blockSignals(True)
-                            solo_checkbox.setChecked(False)
-                            solo_checkbox.blockSignals(False)
+        model = light_table.model()
+        solo_states = {toggled_row: bool(state)}
+        if state and not self.multi_solo:
+            for i, solo in enumerate(model.rows.columns["solo"]):
+                if i != toggled_row and solo == 1:
+                    solo_states[i] = False
+        self.record_edit(light_table, "solo", {row: model.rows.get(row, "solo") for row in solo_states}, solo_states,
+                         "Solo" if state else "Unsolo")
+        model.update_column("solo", solo_states)
         self.update_all_lights_visibility(light_table)
 
-    def update_all_lights_visibility(self, light_table: object, *args):
-        """
-        Updates the visibility of all lights based on the states of the 'Mute' and 'Solo' checkboxes.
-        """
-        soloed_row = -1
-        # CHECK IF ANY LIGHT IS SOLOED
-        for i in range(light_table.rowCount()):
-            solo_widget = light_table.cellWidget(i, 2)
-            if solo_widget:
-                solo_checkbox = solo_widget.findChild(QCheckBox)
-                if solo_checkbox and solo_checkbox.isChecked():
-                    # IF A SOLO CHECKBOX IS FOUND AND CHECKED, STORE ITS ROW INDEX
-                    soloed_row = i
-                    break
-
-        # ITERATE THROUGH ALL LIGHTS TO SET THEIR VISIBILITY
-        for i in range(light_table.rowCount()):
-            light_name_item = light_table.item(i, 0)
-            mute_widget = light_table.cellWidget(i, 1)
-            if not (light_name_item and mute_widget):
-                continue
-
-            light_name = light_name_item.text()
-            current_actor = self.get_actor_by_label(light_name)
-            if not current_actor:
-                continue
+    @profiled
+    def update_all_lights_visibility(self, light_table: object, *args) -> int:
+        """
+        Pushes the 'Mute' and 'Solo' states of the table to Unreal.
+        The effective visibility is computed on the table data and only the lights whose visibility
+        actually flips are written, in one batch.
+        Returns:
+            int: The number of lights whose visibility was changed.
+        """
+        changed, failed = self.core.push_visibility(light_table.model().rows)
+        for label in failed:
+            self.info_timer(f"Warning: Cannot set visibility of '{label}'.")
+        return changed
+
+    def set_multi_solo(self, enabled: bool):
+        """ Allows several lights or groups to be soloed together. """
+        self.multi_solo = enabled
+
+    # LIGHT GROUPS --------------------------------------------
+    def group_rows(self, group_name: str) -> list:
+        """ Returns the table rows of the lights of a group that are currently listed. """
+        rows = (self.light_index.row_of_path(path) for path in self.light_groups.members(group_name))
+        return sorted(row for row in rows if row is not None)
+
+    @profiled
+    def create_group(self, group_name: str, light_table: object):
+        """ Creates a group from the selected lights. """
+        paths = light_table.model().rows.paths
+        self.light_groups.create(group_name, [paths[row] for row in self.selected_rows(light_table)])
+        self.ui.set_groups(self.light_groups.names(), group_name)
+        self.info_timer(f"Group '{group_name}' created with {len(self.group_rows(group_name))} light(s).")
+
+    @profiled
+    def edit_group(self, group_name: str, action: str, light_table: object):
+        """ Adds ("add") or removes ("remove") the selected lights from a group. """
+        paths = light_table.model().rows.paths
+        selected_paths = [paths[row] for row in self.selected_rows(light_table)]
+        if action == "add":
+            self.light_groups.add(group_name, selected_paths)
+        else:
+            self.light_groups.remove(group_name, selected_paths)
+        self.group_changed(group_name, light_table)
+        self.info_timer(f"Group '{group_name}' now has {len(self.group_rows(group_name))} light(s).")
+
+    @profiled
+    def delete_group(self, group_name: str, light_table: object):
+        """ Deletes a group, its lights are kept. """
+        self.light_groups.delete(group_name)
+        self.ui.set_groups(self.light_groups.names())
+        self.info_timer(f"Group '{group_name}' deleted.")
+
+    def group_changed(self, group_name: str, light_table: object):
+        """ Reflects the mute/solo state of a group on the UI. """
+        rows = self.group_rows(group_name)
+        model_rows = light_table.model().rows
+        visible, solo = model_rows.columns["visible"], model_rows.columns["solo"]
+        muted = bool(rows) and not any(visible[row] for row in rows)
+        soloed = bool(rows) and all(solo[row] == 1 for row in rows)
+        self.ui.set_group_state(muted, soloed)
+
+    @profiled
+    def select_group(self, group_name: str, light_table: object):
+        """ Selects the lights of a group in the table, and so in the Unreal scene. """
+        self.select_rows(light_table, self.group_rows(group_name))
+
+    @profiled
+    def mute_group(self, group_name: str, muted: bool, light_table: object):
+        """ Mutes or unmutes every light of a group in one batched visibility pass. """
+        model = light_table.model()
+        visible_states = {row: not muted for row in self.group_rows(group_name)}
+        self.record_edit(light_table, "visible", {row: model.rows.get(row, "visible") for row in visible_states},
+                         visible_states, f"{'Mute' if muted else 'Unmute'} group '{group_name}'")
+        model.update_column("visible", visible_states)
+        changed = self.update_all_lights_visibility(light_table)
+        self.group_changed(group_name, light_table)
+        self.info_timer(f"Group '{group_name}' {'muted' if muted else 'unmuted'}, {changed} light(s) changed.")
+
+    @profiled
+    def solo_group(self, group_name: str, soloed: bool, light_table: object):
+        """
+        Solos or unsolos every light of a group in one batched visibility pass.
+        Without multi solo, the lights soloed outside of the group are unsoloed.
+        """
+        model = light_table.model()
+        rows = self.group_rows(group_name)
+        solo_states = {row: soloed for row in rows}
+        if soloed and not self.multi_solo:
+            group_rows = set(rows)
+            for row, solo in enumerate(model.rows.columns["solo"]):
+                if solo == 1 and row not in group_rows:
+                    solo_states[row] = False
+        self.record_edit(light_table, "solo", {row: model.rows.get(row, "solo") for row in solo_states}, solo_states,
+                         f"{'Solo' if soloed else 'Unsolo'} group '{group_name}'")
+        model.update_column("solo", solo_states)
+        changed = self.update_all_lights_visibility(light_table)
+        self.group_changed(group_name, light_table)
+        self.info_timer(f"Group '{group_name}' {'soloed' if soloed else 'unsoloed'}, {changed} light(s) changed.")
+
+    # UNDO / REDO --------------------------------------------
+    def record_edit(self, light_table: object, attribute_name: str, old_values: dict, new_values: dict,
+                    description: str):
+        """
+        Records an edit in the undo history, before its rows are re-ordered.
+        Args:
+            light_table (QTableView): The edited table.
+            attribute_name (str): The edited attribute, a snapshot column or "color".
+            old_values (dict): Snapshot row -> value before the edit.
+            new_values (dict): Snapshot row -> value after the edit, the rows left out were not edited.
+            description (str): Shown by the Undo and Redo buttons.
+        """
+        paths = light_table.model().rows.paths
+        self.history.record(attribute_name, {paths[row]: (old_values[row], value) for row, value in new_values.items()},
+                            description)
+        self.update_history_state()
+
+    @profiled
+    def undo(self, light_table: object):
+        """ Restores the values the last edit made through the tool replaced, only its lights are written. """
+        entry = self.history.undo()
+        if entry is not None:
+            changed, suffixed = self.apply_history(light_table, entry, redo=False)
+            self.info_timer(f"Undo {entry.description}: {changed} light(s).{self.suffixed_note(suffixed)}")
+        self.update_history_state()
+
+    @profiled
+    def redo(self, light_table: object):
+        """ Writes again the values of the last undone edit. """
+        entry = self.history.redo()
+        if entry is not None:
+            changed, suffixed = self.apply_history(light_table, entry, redo=True)
+            self.info_timer(f"Redo {entry.description}: {changed} light(s).{self.suffixed_note(suffixed)}")
+        self.update_history_state()
+
+    def apply_history(self, light_table: object, entry: object, redo: bool) -> int:
+        """
+        Writes the old (undo) or new (redo) values of a history entry back to its lights and rows,
+        the lights deleted since are skipped. A label taken since by another actor gets a "_NNN" suffix,
+        like a bulk rename, so two lights never share a label.
+        Returns:
+            tuple: (number of lights written, the labels that were taken and had to get a suffix).
+        """
+        model = light_table.model()
+        values = {}
+        for path, value in entry.values(redo).items():
+            row = self.light_index.row_of_path(path)
+            if row is not None:
+                values[row] = value
+        attribute_name = entry.attribute
+        suffixed = []
+        if attribute_name == "label":
+            rows = list(values)
+            wanted = [values[row] for row in rows]
+            labels = resolve_labels([model.rows.labels[row] for row in rows], wanted,
+                                    self.light_index.labels() | self.core.unindexed_labels())
+            suffixed = [label for label, resolved in zip(wanted, labels) if label != resolved]
+            values = dict(zip(rows, labels))
+            selected_paths = [model.rows.paths[row] for row in self.selected_rows(light_table)]
+            model.rename_rows(self.core.rename_lights(values))
+            self.apply_snapshot(light_table, LightSnapshot(), partial=True)
+            self.select_rows(light_table, [self.light_index.row_of_path(path) for path in selected_paths])
+        elif attribute_name in ("visible", "solo"):
+            model.update_column(attribute_name, values)
+            self.update_all_lights_visibility(light_table)
+        else:
+            self.write_values(light_table, values, attribute_name, "Redo" if redo else "Undo", record=False)
+        return len(values), suffixed
+
+    @staticmethod
+    def suffixed_note(suffixed: list) -> str:
+        """ Returns the end of the undo/redo message naming the labels that were taken, empty when none was. """
+        if not suffixed:
+            return ""
+        listed = ", ".join(suffixed[:3]) + (", ..." if len(suffixed) > 3 else "")
+        return f" {len(suffixed)} name(s) taken since by other actors got a suffix: {listed}."
+
+    def update_history_state(self):
+        """ Shows what the Undo and Redo buttons would do. """
+        undo_stack, redo_stack = self.history.undo_stack, self.history.redo_stack
+        self.ui.set_history_state(
+            f"Undo {undo_stack[-1].description} ({len(undo_stack[-1].changes)} light(s))" if undo_stack else None,
+            f"Redo {redo_stack[-1].description} ({len(redo_stack[-1].changes)} light(s))" if redo_stack else None)
+
+    @profiled
+    def search_light(self, *args: str | object):
+        """
+        Filters the rows of the table with a search query, see LightQuery for the syntax.
+        Only the table rows change, the engine is never queried. A population in progress is cancelled,
+        the lights it had not read yet are picked up by the next sync poll.
 
-            mute_checkbox = mute_widget.findChild(QCheckBox)
-            if mute_checkbox:
-                # If a row is soloed, only it is visible. Otherwise, visibility depends on the mute checkbox.
-                is_visible = (i == soloed_row) if soloed_row != -1 else mute_checkbox.isChecked()
-                # Get the light component to set its visibility
-                light_type = current_actor.get_class().get_name()
-                if light_type in self.lightTypes:
-                    light_component_class = self.lightTypes[light_type][1]
-                    light_component = current_actor.get_component_by_class(light_component_class)
-                    if light_component:
-                        light_component.set_visibility(is_visible)
-                        current_actor.set_is_temporarily_hidden_in_editor(not is_visible)
-                    else:
-                        self.info_timer(
-                            f"Warning: No light component found for actor '{light_name}' of type '{light_type}'. Cannot set visibility.")
-                else:
-                    self.info_timer(
-                        f"Warning: Light type '{light_type}' not recognized or component missing for '{light_name}'. Cannot set visibility.")
-
-    def set_color(self, light_component: unreal, color_button: QPushButton):
-        """
-        Opens a color picker dialog to set the light's color and updates the button's background color.
-        """
-        if not light_component:
+        Args:
+            args[0] (str): The search query, e.g. "key type:SpotLight intensity>500 channel1 muted".
+            args[1] (QTableView): The table whose rows will be filtered.
+        """
+        self.cancel_population()
+        self.filter_rows(args[0], args[1])
+
+    def filter_rows(self, search_text: str, light_table: object):
+        """ Applies a search query to the table, see `search_light`. """
+        model = light_table.model()
+        if search_text and self.name_index_revision != model.revision:  # ROWS CHANGED SINCE THE INDEX WAS BUILT
+            self.name_index = NameIndex(model.rows.labels)
+            self.name_index_revision = model.revision
+        try:
+            matching_rows = self.core.query(model.rows, search_text, self.name_index, self.group_rows)
+        except QueryError as error:
+            self.info_timer(f"Search: {error}")
             return
-
-        # GET THE ACTUAL LIGHT COLOR
-        linear_color = light_component.get_light_color()
-        color = (int(linear_color.r * 255), int(linear_color.g * 255), int(linear_color.b * 255))
-        # OPEN COLOR PICKER DIALOG
-        color_dialog = QColorDialog(currentColor=QColor(color[0], color[1], color[2]), parent=self.ui)
-        color_dialog.open()
-
-        if color_dialog.exec() == QColorDialog.Accepted:
-            new_color = color_dialog.selectedColor()
-            r, g, b = new_color.redF(), new_color.greenF(), new_color.blueF()
-            light_component.set_light_color(unreal.LinearColor(r, g, b))  # SET THE NEW COLOR TO THE LIGHT
-            self.set_button_color(light_component, color_button)
-
-    def set_button_color(self, light_component: unreal, color_button: QPushButton, color: tuple = None):
+        self.search_text = search_text
+        restrictions = []
+        if self.level_filter:
+            restrictions.append(self.rows_by_level(model).get(self.level_filter, set()))
+        if self.spatial_target:
+            if self.spatial_revision != model.revision:
+                self.core.sync_spatial_hash(model.rows)
+                self.spatial_revision = model.revision
+            restrictions.append(self.core.lights_near(self.spatial_points,
+                                                      self.spatial_distance if self.spatial_mode == "within" else None))
+        for rows in restrictions:
+            matching_rows = rows if matching_rows is None else matching_rows & rows
+        self.apply_row_filter(light_table, matching_rows)
+
+    # COLUMNS --------------------------------------------
+    @profiled
+    def set_column_shown(self, key: str, shown: bool, light_table: object):
         """
-        Sets the background color of a QPushButton to match the light's color.
+        Follows a column shown or hidden from the header menu. A lazy column is read with every light while
+        it is shown: its values are fetched for the lights it is not cached for, then each refresh reads it too.
+        Hiding it stops the reads, its values stay cached.
+        Args:
+            key (str): The column, see LightColumns.
+            shown (bool): Whether the column is now shown.
+            light_table (QTableView): The table showing the column.
         """
-        if not light_component:
+        column = COLUMNS[key]
+        if not column.lazy:
             return
+        if not shown:
+            if column in self.core.lazy_columns:
+                self.core.lazy_columns.remove(column)
+            return
+        if column not in self.core.lazy_columns:
+            self.core.lazy_columns.append(column)
+        self.fetch_columns(light_table, [column])
 
-        linear_color = light_component.get_light_color()
-        r = int(linear_color.r * 255)
-        g = int(linear_color.g * 255)
-        b = int(linear_color.b * 255)
-        color_button.setStyleSheet(f"background-color: rgba({r},{g},{b},1)")
-
-    def search_light(self, *args: str | object):
+    def fetch_columns(self, light_table: object, columns: list = None):
         """
-        Filters the visibility of rows in the table based on a search string.
-
+        Reads the shown lazy columns for the rows they are not cached for and repaints them.
+        The rows are re-sorted when they are ordered by one of them.
+        """
+        model = light_table.model()
+        for column in self.core.lazy_columns if columns is None else columns:
+            read = self.core.fetch_column(model.rows, column.key)
+            model.column_changed(column.key)
+            if read and column.key in dict(model.sort_keys) and model.sort_rows():
+                self.apply_snapshot(light_table, LightSnapshot(), partial=True)  # RE-INDEXES AND RE-APPLIES THE SEARCH
+
+    # LEVELS --------------------------------------------
+    def rows_by_level(self, model: object) -> dict:
+        """ Returns level name -> set of rows, rebuilt only when the rows changed since the last call. """
+        if self.level_rows_revision != model.revision:
+            self.level_rows = {}
+            for row, level in enumerate(model.rows.columns["level"]):
+                self.level_rows.setdefault(level, set()).add(row)
+            self.level_rows_revision = model.revision
+        return self.level_rows
+
+    @profiled
+    def set_level_filter(self, level: str, light_table: object):
+        """
+        Only lists the lights of one level, on top of the search and the spatial filter. Switching levels
+        only filters the rows already read. An unloaded streaming level is loaded first, then only its lights are read.
         Args:
-            args[0] (str): The text to search for in the light names.
-            args[1] (QTableWidget): The table whose rows will be filtered.
+            level (str): The level name, "" lists the lights of every level.
+            light_table (QTableView): The filtered table.
+        """
+        unloaded = level and not self.core.levels().get(level, True)
+        if unloaded:
+            try:
+                self.core.load_level(level)
+            except LightError as error:
+                self.info_timer(f"Error: {error}")
+                self.update_levels(light_table)
+                return
+        self.level_filter = level or None
+        self.filter_rows(self.search_text, light_table)
+        if unloaded:
+            self.start_population(light_table, announce=True, level=level)
+
+    def update_levels(self, light_table: object):
+        """ Lists the levels and their number of lights in the level filter. """
+        counts = Counter(light_table.model().rows.columns["level"])
+        loaded = self.core.levels()
+        self.ui.set_levels([(level, counts[level], loaded.get(level, True)) for level in sorted(set(counts) | set(loaded))],
+                           self.level_filter)
+
+    # SPATIAL FILTER --------------------------------------------
+    @profiled
+    def set_spatial_filter(self, target: str, mode: str, distance: float, light_table: object):
         """
-        search_text = args[0]
-        if not search_text:
-            self.refresh(args[1])
+        Only lists the lights near the viewport camera or the selected actors, on top of the search.
+        The filter follows the target every SPATIAL_POLL_MS, the lights are looked up in the spatial hash
+        of the core, which only re-buckets the lights that moved.
+        Args:
+            target (str): "camera", "selection", or "" to list the lights anywhere again.
+            mode (str): "within": the lights within `distance` of the target. "reach": the lights whose attenuation
+                radius reaches the target, plus the lights without a radius (sky, directional).
+            distance (float): In units, only used by the "within" mode.
+            light_table (QTableView): The filtered table.
+        """
+        self.spatial_target = target or None
+        self.spatial_mode = mode
+        self.spatial_distance = distance
+        self.spatial_table = light_table if target else None
+        if not target:
+            self.spatial_timer.stop()
+            self.spatial_points = []
+            self.filter_rows(self.search_text, light_table)
             return
-        if search_text:
-            for row in range(args[1].rowCount()):
-                researsh_light = args[1].item(row, 0).text()
-                if search_text in researsh_light.lower():
-                    args[1].showRow(row)
-                else:
-                    args[1].hideRow(row)
+        self.spatial_points = self.spatial_target_points(light_table)
+        self.spatial_moved = False
+        self.filter_rows(self.search_text, light_table)
+        self.spatial_timer.start()
 
+    def spatial_target_points(self, light_table: object) -> list:
+        """
+        Returns the locations the spatial filter is centered on: the viewport camera, or the selected actors.
+        The selected lights are followed on the way: a light moved in the editor gets its new location.
+        """
+        selected_actors = self.core.selected_actors()[:SPATIAL_MAX_TARGETS]
+        points, moved = [], {}
+        model = light_table.model()
+        for actor in selected_actors:
+            try:
+                location = self.core.actor_location(actor)
+            except Exception:  # ACTOR DELETED SINCE IT WAS SELECTED
+                continue
+            points.append(location)
+            row = self.light_index.row_of(actor)
+            if row is not None and location != model.rows.get(row, "location"):
+                moved[row] = location
+        if moved:
+            model.update_column("location", moved)
+            self.core.sync_spatial_hash(model.rows, list(moved))
+            self.spatial_moved = True
+        if self.spatial_target == "camera":
+            camera = self.core.viewport_camera()
+            points = [] if camera is None else [camera]
+        return points
+
+    def poll_spatial_target(self):
+        """ Re-applies the spatial filter when its target or the lights moved, runs every SPATIAL_POLL_MS. """
+        light_table = self.spatial_table
+        if light_table is None or self.scrub_rows is not None or light_table.state() == QAbstractItemView.EditingState:
+            return
+        points = self.spatial_target_points(light_table)
+        if points != self.spatial_points or self.spatial_moved:
+            self.spatial_points = points
+            self.spatial_moved = False
+            self.follow_spatial_target(light_table)
+
+    @profiled
+    def follow_spatial_target(self, light_table: object):
+        """ Re-filters the table around the new location of the camera, the selection or the lights. """
+        self.filter_rows(self.search_text, light_table)
+
+    def rows_sorted(self, light_table: object):
+        """ Re-indexes the rows after a click on a header re-ordered them. """
+        self.core.index_rows(light_table.model().rows)
+
+    def apply_row_filter(self, light_table: object, visible_rows: set = None):
+        """
+        Restricts the table to the given snapshot rows, the selected lights that remain listed stay selected.
+        Args:
+            light_table (QTableView): The filtered table.
+            visible_rows (set, optional): The snapshot rows to show, None shows every row.
+        """
+        model = light_table.model()
+        selected_rows = self.selected_rows(light_table)
+        if model.set_filter(visible_rows):
+            self.select_rows(light_table, selected_rows)
+
+    # OVERLAP ANALYSIS --------------------------------------------
+    @profiled
+    def analyse_overlaps(self, threshold: int, light_table: object):
+        """
+        Counts, for every light, the attenuation spheres intersecting its own into the Overlaps column,
+        then reports the densest regions and the shadow casting lights overlapping more than `threshold` others.
+        The table is sorted by overlaps, the worst lights first, and "shadows overlaps>N" lists the hotspots.
+        Args:
+            threshold (int): Shadow casting lights intersecting more spheres than this are reported.
+            light_table (QTableView): The table whose lights are analysed.
+        """
+        self.wait_population()  # EVERY LIGHT OF THE LEVEL IS ANALYSED
+        model = light_table.model()
+        analysis = self.core.analyse_overlaps(model.rows, threshold)
+        overlaps = dict.fromkeys(range(len(model.rows)))  # N/A FOR THE LIGHTS LEFT OUT
+        overlaps.update(zip(analysis["rows"], analysis["overlaps"]))
+        model.update_column("overlaps", overlaps)
+        model.update_column("cast_shadows", dict(zip(analysis["rows"], analysis["cast_shadows"])))
+        report = self.overlap_report(analysis, threshold, model.rows.labels)
+
+        moved = model.sort_by("overlaps", descending=True)  # ALSO RE-SORTS A TABLE ALREADY SORTED BY OVERLAPS
+        light_table.horizontalHeader().setSortIndicator(COLUMN_KEYS.index("overlaps"), Qt.DescendingOrder)
+        if moved:
+            self.core.index_rows(model.rows)
+        if self.search_text or self.spatial_target or self.level_filter:  # THE SEARCH MAY FILTER ON THE OVERLAPS
+            self.filter_rows(self.search_text, light_table)
+        self.info_timer(f"Overlap analysis: {len(analysis['rows'])} light(s) in {analysis['elapsed']:.3f}s, "
+                        f"{len(analysis['hotspots'])} shadow casting light(s) over {threshold}.")
+        self.ui.show_report("Overlap Analysis", report)
+
+    @staticmethod
+    def overlap_report(analysis: dict, threshold: int, labels: list) -> str:
+        """ Returns the text of an overlap analysis, see LightCore.analyse_overlaps. """
+        overlaps = analysis["overlaps"]
+        if not overlaps:
+            return "No light with an attenuation radius to analyse."
+        lines = [f"{len(overlaps)} light(s) read in {analysis['read_elapsed']:.2f}s, "
+                 f"analysed in {analysis['elapsed']:.3f}s ({analysis['backend']}).",
+                 f"Overlaps per light: {max(overlaps)} at most, {sum(overlaps) / len(overlaps):.1f} on average.", ""]
+        hotspots = analysis["hotspots"]
+        lines.append(f"{len(hotspots)} shadow casting light(s) overlap more than {threshold} others"
+                     + (f', search "shadows overlaps>{threshold}" to list them:' if hotspots else "."))
+        overlaps_of = dict(zip(analysis["rows"], overlaps))
+        lines.extend(f"    {labels[row]}: {overlaps_of[row]}" for row in hotspots[:REPORT_HOTSPOTS])
+        if len(hotspots) > REPORT_HOTSPOTS:
+            lines.append(f"    ... and {len(hotspots) - REPORT_HOTSPOTS} more")
+        lines += ["", f"Densest regions ({analysis['cell_size']:.0f} unit cells):"]
+        lines.extend(f"    ({x:.0f}, {y:.0f}, {z:.0f}): {light_count} light(s)"
+                     for (x, y, z), light_count in analysis["densest"])
+        return "\n".join(lines)
+
+    @profiled
     def render(self):
         """ Triggers the rendering of the current scene in Unreal Engine."""
-        unreal.EditorLevelLibrary.editor_play_simulate()
+        self.core.simulate()
+
+    def set_profiling(self, enabled: bool):
+        """ Starts or stops recording the operations. """
+        self.profiler.enabled = enabled
+        self.info_timer("Profiling enabled" if enabled else "Profiling disabled")
+
+    def reset_profile(self):
+        """ Forgets the recorded operations. """
+        self.profiler.reset()
+        self.show_profile()
+
+    def show_profile(self):
+        """ Shows the recorded operations in the stats panel. """
+        self.ui.set_profile_stats(self.profiler.report())
+
+    def save_profile(self, file_path: str, output_format: str):
+        """
+        Writes the recorded operations to a file.
+        Args:
+            file_path (str): The output file.
+            output_format (str): "json" for the aggregated operations, "cprofile" for the merged cProfile output.
+        """
+        try:
+            if output_format == "json":
+                self.profiler.dump_json(file_path)
+            elif not self.profiler.dump_cprofile(file_path):
+                self.info_timer("No operation recorded yet")
+                return
+        except OSError as error:
+            self.info_timer(f"Cannot save the profile: {error}")
+            return
+        self.info_timer(f"Profile saved to {os.path.basename(file_path)}")
 
     def info_timer(self, text: str, duration_ms: int = 3500):
         """
@@ -0,0 +1,74 @@
+"""
+Light rig preset benchmark, run outside of Unreal Engine with the fake unreal module.
+For each synthetic level it reports the throughput of:
+    - save: every listed light written to a preset file.
+    - load (update): the preset loaded back into the same level, every light is updated.
+    - load (spawn): the preset loaded into an empty level, every light is spawned.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_presets.py --lights 1000 10000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCHMARK_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_PATH))
+sys.path.insert(0, BENCHMARK_PATH)
+
+import fake_unreal
+
+sys.modules["unreal"] = fake_unreal
+
+from PySide6.QtWidgets import QApplication
+
+import LightManagerUI as lmui
+import UnrealLightLogic as ull
+
+
+def open_tool() -> tuple:
+    """ Builds the Light Manager on the current fake level, without showing it. """
+    ui = lmui.LightManagerUI()
+    logic = ull.UnrealLightLogic(ui)
+    logic.refresh(ui.light_table)
+    logic.wait_population()
+    return ui, logic
+
+
+def timed(function: callable, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lights", type=int, nargs="+", default=[1000, 10000], help="Light counts of the rigs.")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'lights':>8} {'file (KB)':>10} {'save (lights/s)':>16} {'load update (lights/s)':>23} "
+          f"{'load spawn (lights/s)':>22}")
+    with tempfile.TemporaryDirectory() as directory:
+        for light_count in args.lights:
+            file_path = os.path.join(directory, f"rig_{light_count}.jsonl")
+            fake_unreal.reset()
+            fake_unreal.populate(light_count)
+            ui, logic = open_tool()
+            save = timed(logic.save_preset, file_path, ui.light_table)
+            update = timed(logic.load_preset, file_path, ui.light_table)
+
+            fake_unreal.reset()
+            ui, logic = open_tool()
+            spawn = timed(logic.load_preset, file_path, ui.light_table)
+            assert ui.light_model.rowCount() == light_count, ui.info_text.text()
+
+            size = os.path.getsize(file_path) / 1024
+            print(f"{light_count:>8} {size:>10.0f} {light_count / save:>16.0f} {light_count / update:>23.0f} "
+                  f"{light_count / spawn:>22.0f}")
+            app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Startup benchmark of the Light Manager, run outside of Unreal Engine with the fake unreal module.
+For each synthetic level it reports:
+    - time-to-first-paint: from `main_window()` to the first paint of the (still empty) window.
+    - time-to-full-table: from `main_window()` to the first paint of the table with every light listed.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_startup.py --lights 1000 10000 --repeat 3
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCHMARK_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_PATH))
+sys.path.insert(0, BENCHMARK_PATH)
+
+import fake_unreal
+
+sys.modules["unreal"] = fake_unreal
+
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication
+
+import ulm_main
+
+
+class PaintWatcher(QObject):
+    """ Records the time of every paint event of a widget. """
+
+    def __init__(self):
+        super().__init__()
+        self.paint_times = []
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Paint:
+            self.paint_times.append(time.perf_counter())
+        return False
+
+
+def run_startup(app: QApplication, light_count: int, timeout: float = 120.0) -> tuple:
+    """
+    Opens the Light Manager on a level of `light_count` lights.
+    Returns:
+        tuple: (time-to-first-paint, time-to-full-table) in seconds.
+    """
+    fake_unreal.reset()
+    fake_unreal.populate(light_count)
+    watcher = PaintWatcher()
+
+    start = time.perf_counter()
+    ui = ulm_main.main_window()
+    ui.light_table.viewport().installEventFilter(watcher)
+    ui.show()
+
+    first_paint = full_table = None
+    while time.perf_counter() - start < timeout:
+        app.processEvents()
+        if first_paint is None and watcher.paint_times:
+            first_paint = watcher.paint_times[0] - start
+        if ui.light_model.rowCount() == light_count:
+            ui.light_table.viewport().repaint()  # PAINTS NOW, WITH EVERY ROW LISTED
+            full_table = time.perf_counter() - start
+            break
+
+    ui.close()
+    ui.deleteLater()
+    app.processEvents()
+    return first_paint, full_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lights", type=int, nargs="+", default=[1000, 10000], help="Light counts of the levels.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per level, the first one is cold.")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'lights':>8} {'run':>4} {'first paint (ms)':>17} {'full table (ms)':>16}")
+    for light_count in args.lights:
+        for run in range(args.repeat):
+            first_paint, full_table = run_startup(app, light_count)
+            print(f"{light_count:>8} {run:>4} {first_paint * 1000:>17.1f} {full_table * 1000:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
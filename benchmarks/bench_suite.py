@@ -0,0 +1,185 @@
+"""
+Benchmark suite of the Light Manager operations, run outside of Unreal Engine with the fake unreal module.
+For each synthetic level it records the wall time and the number of calls into the (fake) engine of:
+refresh, search, mute/solo, undo/redo, rename, create, delete, the overlap analysis, the lazy columns, a multi-key sort, the report export, the spatial and level filters and the scene sync poll. The calls are counted by the fake module itself,
+an optional latency per call models the cost of crossing into the engine.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_suite.py --lights 100 1000 10000 50000 --repeat 3 --output run.json
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_suite.py --baseline run.json --latency 2
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+BENCHMARK_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_PATH))
+sys.path.insert(0, BENCHMARK_PATH)
+
+import fake_unreal
+
+sys.modules["unreal"] = fake_unreal
+
+from PySide6.QtWidgets import QApplication
+
+import LightManagerUI as lmui
+import UnrealLightLogic as ull
+
+LIGHT_SPACING = 1000.0  # UNITS BETWEEN THE LIGHTS, EACH ONE OVERLAPS ABOUT A DOZEN OTHERS WITH THE DEFAULT RADIUS
+SPATIAL_DISTANCE = 5000.0  # UNITS, THE SPATIAL FILTER LISTS ABOUT 80 LIGHTS AROUND THE CAMERA
+SUBLEVEL_SHARE = 10  # AN UNLOADED STREAMING SUBLEVEL HOLDS 1 / SUBLEVEL_SHARE MORE LIGHTS
+
+
+def measure(function: callable, *args) -> dict:
+    """ Runs an operation once, returns its wall time (ms) and engine calls. """
+    fake_unreal.reset_calls()
+    start = time.perf_counter()
+    function(*args)
+    return {"ms": round((time.perf_counter() - start) * 1000, 2), "calls": fake_unreal.total_calls()}
+
+
+def refresh(logic: ull.UnrealLightLogic, table: object):
+    """ Refreshes the table and waits for every light to be read, the population normally runs in the background. """
+    logic.refresh(table)
+    logic.wait_population()
+
+
+def load_level(logic: ull.UnrealLightLogic, level: str, table: object):
+    """ Picks an unloaded level in the level filter and waits for its lights to be read. """
+    logic.set_level_filter(level, table)
+    logic.wait_population()
+
+
+def sort_rows(logic: ull.UnrealLightLogic, sort_keys: list, table: object):
+    """ Sorts the table by several columns, as a Shift+click on their headers does. """
+    if table.model().sort_by_keys(sort_keys):
+        logic.rows_sorted(table)
+
+
+def run_level(light_count: int) -> dict:
+    """
+    Runs every benchmarked operation, in order, on a fresh level of `light_count` lights.
+    Returns:
+        dict: Operation name -> {"ms": wall time, "calls": engine calls}.
+    """
+    fake_unreal.reset()
+    fake_unreal.populate(light_count, spacing=LIGHT_SPACING)
+    fake_unreal.populate_sublevel("Sublevel", light_count // SUBLEVEL_SHARE, spacing=LIGHT_SPACING)
+    ui = lmui.LightManagerUI()
+    ui.show_report = lambda title, text: None  # NO MODAL MESSAGE BOX
+    logic = ull.UnrealLightLogic(ui)
+    table = ui.light_table
+    model = ui.light_model
+    middle = light_count // 2
+
+    results = {}
+    results["refresh (cold)"] = measure(refresh, logic, table)
+    results["refresh (no change)"] = measure(refresh, logic, table)
+    results["search (name)"] = measure(logic.search_light, "LGT_001", table)
+    results["search (query)"] = measure(logic.search_light, "type:PointLight intensity>0 channel0", table)
+    results["search (clear)"] = measure(logic.search_light, "", table)
+    results["mute 1"] = measure(logic.edit_light, middle, "visible", False, table)
+    results["solo 1"] = measure(logic.edit_light, middle, "solo", True, table)
+    results["unsolo 1"] = measure(logic.edit_light, middle, "solo", False, table)
+    logic.select_rows(table, range(len(model.rows)))
+    results["edit intensity (all)"] = measure(logic.edit_light, middle, "intensity", 5.0, table)
+    results["undo edit (all)"] = measure(logic.undo, table)
+    results["redo edit (all)"] = measure(logic.redo, table)
+    logic.select_rows(table, [])
+    results["rename 1"] = measure(logic.rename_light, model.rows.labels[middle], "Bench", table)
+    results["bulk rename (all)"] = measure(logic.bulk_rename, "Prefix / Suffix", {"prefix": "B_"}, table)
+    results["create 1"] = measure(logic.create_light, "Bench", "PointLight", table)
+    results["create 100"] = measure(logic.batch_create, "Bench", "SpotLight", "Grid", {"count": 100}, table)
+    logic.select_rows(table, [middle])
+    results["delete 1"] = measure(logic.delete, table)
+    logic.select_rows(table, range(0, len(model.rows), 10))
+    results["delete 10%"] = measure(logic.delete, table)
+    results["overlap analysis"] = measure(logic.analyse_overlaps, 8, table)
+    results["show column (read)"] = measure(logic.set_column_shown, "source_radius", True, table)
+    logic.set_column_shown("source_radius", False, table)
+    results["show column (cached)"] = measure(logic.set_column_shown, "source_radius", True, table)
+    logic.set_column_shown("source_radius", False, table)
+    with tempfile.TemporaryDirectory() as export_folder:
+        for export_format in ("csv", "jsonl"):
+            export_path = os.path.join(export_folder, f"lights.{export_format}")
+            results[f"export {export_format} (all)"] = measure(logic.export_lights, export_path, export_format, table)
+    logic.select_rows(table, range(0, len(model.rows), 3))  # A SCATTERED SELECTION FOLLOWS ITS ROWS
+    sort_keys = model.sort_keys
+    results["multi-sort (selection)"] = measure(sort_rows, logic, [("type", False), ("intensity", True)], table)
+    sort_rows(logic, sort_keys, table)
+    logic.select_rows(table, [])
+    camera = fake_unreal.get_editor_subsystem(fake_unreal.UnrealEditorSubsystem)
+    camera.camera_location = fake_unreal.Vector(50 * LIGHT_SPACING, light_count / 200 * LIGHT_SPACING, 200.0)
+    results["spatial filter (on)"] = measure(logic.set_spatial_filter, "camera", "within", SPATIAL_DISTANCE, table)
+    camera.camera_location = fake_unreal.Vector(camera.camera_location.x + LIGHT_SPACING, camera.camera_location.y, 200.0)
+    results["spatial (camera moved)"] = measure(logic.poll_spatial_target)
+    logic.set_spatial_filter("", "within", SPATIAL_DISTANCE, table)
+    results["level filter (switch)"] = measure(logic.set_level_filter, "Level", table)
+    results["level load (sublevel)"] = measure(load_level, logic, "Sublevel", table)
+    logic.set_level_filter("", table)
+    logic.start_sync(table)
+    logic.sync_scene()
+    results["sync poll (no change)"] = measure(logic.poll_scene)
+    subsystem = fake_unreal.get_editor_subsystem(fake_unreal.EditorActorSubsystem)
+    for i in range(10):  # LIGHTS ADDED IN THE EDITOR, OUTSIDE OF THE TOOL
+        subsystem.spawn_actor_from_class(fake_unreal.PointLight).set_actor_label(f"Outliner_{i}")
+    results["sync poll (10 added)"] = measure(logic.poll_scene)
+    logic.stop_sync()
+
+    ui.deleteLater()
+    return results
+
+
+def print_results(runs: dict, baseline: dict = None):
+    """ Prints one line per operation and one "ms / calls" column per level, with the change from a baseline. """
+    levels = list(runs)
+    operations = list(runs[levels[0]])
+    print(f"{'operation':<22}" + "".join(f"{f'{level} lights (ms / calls)':>36}" for level in levels))
+    for operation in operations:
+        cells = []
+        for level in levels:
+            result = runs[level][operation]
+            cell = f"{result['ms']:.1f} / {result['calls']}"
+            reference = (baseline or {}).get(level, {}).get(operation)
+            if reference:
+                ms_change = (result["ms"] / reference["ms"] - 1) * 100 if reference["ms"] else 0.0
+                cell += f" ({ms_change:+.0f}%, {result['calls'] - reference['calls']:+d})"
+            cells.append(f"{cell:>36}")
+        print(f"{operation:<22}" + "".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lights", type=int, nargs="+", default=[100, 1000, 10000, 50000],
+                        help="Light counts of the levels.")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per level, the fastest time of each operation is kept.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Microseconds added to every engine call.")
+    parser.add_argument("--output", help="Writes the results to a JSON file, to be used as a baseline.")
+    parser.add_argument("--baseline", help="A JSON file of earlier results, the changes are shown next to each result.")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    fake_unreal.set_latency(args.latency / 1e6)
+    runs = {}
+    for light_count in args.lights:
+        for _ in range(args.repeat):
+            results = run_level(light_count)
+            best = runs.setdefault(str(light_count), results)  # JSON KEYS ARE STRINGS
+            for operation, result in results.items():
+                best[operation] = min(best[operation], result, key=lambda entry: entry["ms"])
+            app.processEvents()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["runs"]
+    print_results(runs, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump({"latency_us": args.latency, "runs": runs}, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
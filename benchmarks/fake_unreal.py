@@ -0,0 +1,444 @@
+"""
+A minimal stand-in for the `unreal` module, covering the part of the editor API used by the Light Manager.
+It lets the tool run outside of Unreal Engine, for the benchmarks and the tests:
+
+    import fake_unreal
+    sys.modules["unreal"] = fake_unreal
+    fake_unreal.populate(10000)
+
+Every call into the fake editor API is counted in `calls` ("Class.method" -> count), and each one
+can be slowed down with `set_latency` to model the cost of crossing into the engine.
+"""
+import collections
+import itertools
+import time
+
+_ids = itertools.count()
+calls = collections.Counter()  # "Class.method" -> NUMBER OF CALLS, SEE reset_calls
+_latency = 0.0  # SECONDS ADDED TO EVERY CALL
+
+
+# STRUCTS --------------------------------------------
+class _Struct:
+    def get_editor_property(self, name: str) -> object:
+        return getattr(self, name)
+
+    def set_editor_property(self, name: str, value: object):
+        setattr(self, name, value)
+
+
+class Vector(_Struct):
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self.x, self.y, self.z = x, y, z
+
+
+class Rotator(_Struct):
+    def __init__(self, roll: float = 0.0, pitch: float = 0.0, yaw: float = 0.0):
+        self.roll, self.pitch, self.yaw = roll, pitch, yaw
+
+
+class LinearColor(_Struct):
+    def __init__(self, r: float = 1.0, g: float = 1.0, b: float = 1.0, a: float = 1.0):
+        self.r, self.g, self.b, self.a = r, g, b, a
+
+
+class LightingChannels(_Struct):
+    def __init__(self, channel0: bool = True, channel1: bool = False, channel2: bool = False):
+        self.channel0, self.channel1, self.channel2 = channel0, channel1, channel2
+
+
+class LightUnits:
+    UNITLESS = "UNITLESS"
+    CANDELAS = "CANDELAS"
+    LUMENS = "LUMENS"
+    EV = "EV"
+
+
+class ComponentMobility:
+    STATIC = "STATIC"
+    STATIONARY = "STATIONARY"
+    MOVABLE = "MOVABLE"
+
+
+# OBJECTS --------------------------------------------
+class Object:
+    pass
+
+
+class ActorComponent(Object):
+    PROPERTIES = {}  # PROPERTY NAME -> DEFAULT VALUE, OR A CLASS BUILDING IT
+
+    def __init__(self):
+        self._values = {name: (value() if isinstance(value, type) else value) for name, value in self.PROPERTIES.items()}
+        self._visible = True
+
+    def get_editor_property(self, name: str) -> object:
+        if name not in self._values:
+            raise Exception(f"Failed to find property '{name}' on '{type(self).__name__}'")
+        return self._values[name]
+
+    def set_editor_property(self, name: str, value: object):
+        if name not in self._values:
+            raise Exception(f"Failed to find property '{name}' on '{type(self).__name__}'")
+        self._values[name] = value
+
+    def is_visible(self) -> bool:
+        return self._visible
+
+    def set_visibility(self, visible: bool):
+        self._visible = visible
+
+    def get_light_color(self) -> LinearColor:
+        return self._values["light_color"]
+
+    def set_light_color(self, color: LinearColor):
+        self._values["light_color"] = color
+
+    def set_intensity(self, intensity: float):
+        self._values["intensity"] = intensity
+
+    def set_intensity_units(self, units: str):
+        self._values["intensity_units"] = units
+
+    def set_attenuation_radius(self, radius: float):
+        self._values["attenuation_radius"] = radius
+
+    def set_cast_shadows(self, cast_shadows: bool):
+        self._values["cast_shadows"] = cast_shadows
+
+    def set_mobility(self, mobility: str):
+        self._values["mobility"] = mobility
+
+    def set_lighting_channels(self, channel0: bool, channel1: bool, channel2: bool):
+        self._values["lighting_channels"] = LightingChannels(channel0, channel1, channel2)
+
+
+_SKY_PROPERTIES = {"intensity": 1.0, "light_color": LinearColor, "cast_shadows": True, "mobility": "MOVABLE",
+                   "indirect_lighting_intensity": 1.0, "volumetric_scattering_intensity": 1.0, "specular_scale": 1.0}
+_LIGHT_PROPERTIES = dict(_SKY_PROPERTIES, use_temperature=False, temperature=6500.0, lighting_channels=LightingChannels)
+_LOCAL_PROPERTIES = dict(_LIGHT_PROPERTIES, attenuation_radius=1000.0, intensity_units="UNITLESS", ies_texture=None)
+_POINT_PROPERTIES = dict(_LOCAL_PROPERTIES, source_radius=0.0, source_length=0.0)
+
+
+class SkyLightComponent(ActorComponent):
+    PROPERTIES = _SKY_PROPERTIES
+
+
+class DirectionalLightComponent(ActorComponent):
+    PROPERTIES = _LIGHT_PROPERTIES
+
+
+class PointLightComponent(ActorComponent):
+    PROPERTIES = _POINT_PROPERTIES
+
+
+class SpotLightComponent(ActorComponent):
+    PROPERTIES = dict(_POINT_PROPERTIES, inner_cone_angle=0.0, outer_cone_angle=44.0)
+
+
+class RectLightComponent(ActorComponent):
+    PROPERTIES = dict(_LOCAL_PROPERTIES, source_width=64.0, source_height=64.0)
+
+
+class Actor(Object):
+    COMPONENT = None  # LIGHT COMPONENT CLASS
+
+    def __init__(self, label: str = None, location: Vector = None, level: str = "Level"):
+        actor_id = next(_ids)
+        self._path = f"/Game/{level}.{level}:PersistentLevel.{type(self).__name__}_{actor_id}"
+        self._label = label or f"{type(self).__name__}{actor_id}"
+        self._location = location or Vector()
+        self._rotation = Rotator()
+        self._scale = Vector(1.0, 1.0, 1.0)
+        self._hidden = False
+        self._component = self.COMPONENT() if self.COMPONENT else None
+
+    def get_actor_label(self) -> str:
+        return self._label
+
+    def set_actor_label(self, label: str):
+        self._label = label
+
+    def get_path_name(self) -> str:
+        return self._path
+
+    def get_name(self) -> str:
+        return self._path.rsplit(".", 1)[-1]
+
+    def get_component_by_class(self, component_class: type) -> ActorComponent:
+        return self._component if isinstance(self._component, component_class) else None
+
+    def get_actor_location(self) -> Vector:
+        return self._location
+
+    def set_actor_location(self, location: Vector, sweep: bool = False, teleport: bool = True):
+        self._location = location
+
+    def get_actor_rotation(self) -> Rotator:
+        return self._rotation
+
+    def set_actor_rotation(self, rotation: Rotator, teleport_physics: bool = True):
+        self._rotation = rotation
+
+    def get_actor_scale3d(self) -> Vector:
+        return self._scale
+
+    def set_is_temporarily_hidden_in_editor(self, hidden: bool):
+        self._hidden = hidden
+
+    def is_temporarily_hidden_in_editor(self) -> bool:
+        return self._hidden
+
+
+class StaticMeshActor(Actor):
+    pass
+
+
+class SkyLight(Actor):
+    COMPONENT = SkyLightComponent
+
+
+class DirectionalLight(Actor):
+    COMPONENT = DirectionalLightComponent
+
+
+class PointLight(Actor):
+    COMPONENT = PointLightComponent
+
+
+class SpotLight(Actor):
+    COMPONENT = SpotLightComponent
+
+
+class RectLight(Actor):
+    COMPONENT = RectLightComponent
+
+
+# EDITOR --------------------------------------------
+class MulticastDelegate:
+    def __init__(self):
+        self.callables = []
+
+    def add_callable(self, function: callable):
+        self.callables.append(function)
+
+    def remove_callable(self, function: callable):
+        self.callables.remove(function)
+
+    def broadcast(self, *args):
+        for function in list(self.callables):
+            function(*args)
+
+
+class EditorActorSubsystem:
+    def __init__(self):
+        self.actors = {}  # ACTOR -> None, AN ORDERED SET: DESTROYING AN ACTOR IS O(1) LIKE IN THE ENGINE
+        self.selected = []
+        self.on_new_actors_dropped = MulticastDelegate()
+        self.on_delete_actors_end = MulticastDelegate()
+
+    def get_all_level_actors(self) -> list:
+        return list(self.actors)
+
+    def get_selected_level_actors(self) -> list:
+        return list(self.selected)
+
+    def set_selected_level_actors(self, actors: list):
+        self.selected = list(actors)
+
+    def spawn_actor_from_class(self, actor_class: type, location: Vector = None, rotation: Rotator = None) -> Actor:
+        actor = actor_class(location=location)
+        if rotation is not None:
+            actor.set_actor_rotation(rotation)
+        self.actors[actor] = None
+        return actor
+
+    def destroy_actor(self, actor: Actor) -> bool:
+        del self.actors[actor]
+        return True
+
+
+class LevelEditorSubsystem:
+    def __init__(self):
+        self.on_map_changed = MulticastDelegate()
+
+
+class LevelStreaming(Object):
+    def __init__(self, name: str, actors: list, loaded: bool):
+        self._package = f"/Game/{name}"
+        self._actors = actors  # ADDED TO THE LEVEL ONCE LOADED
+        self._loaded = loaded
+        self._should_be_loaded = loaded
+
+    def get_world_asset_package_name(self) -> str:
+        return self._package
+
+    def is_level_loaded(self) -> bool:
+        return self._loaded
+
+    def set_should_be_loaded(self, should_be_loaded: bool):
+        self._should_be_loaded = should_be_loaded
+
+    def set_should_be_visible(self, should_be_visible: bool):
+        pass
+
+
+class World(Object):
+    def __init__(self):
+        self._streaming_levels = []
+
+    def get_path_name(self) -> str:
+        return "/Game/Level.Level"
+
+    def get_editor_property(self, name: str) -> object:
+        if name != "streaming_levels":
+            raise Exception(f"Failed to find property '{name}' on 'World'")
+        return list(self._streaming_levels)
+
+
+class GameplayStatics:
+    @staticmethod
+    def flush_level_streaming(world: World):
+        actors = get_editor_subsystem(EditorActorSubsystem).actors
+        for streaming_level in world._streaming_levels:
+            if streaming_level._should_be_loaded and not streaming_level._loaded:
+                streaming_level._loaded = True
+                actors.update((actor, None) for actor in streaming_level._actors)
+
+
+class UnrealEditorSubsystem:
+    def __init__(self):
+        self.camera_location = Vector()  # MOVED BY THE BENCHMARKS
+        self.camera_rotation = Rotator()
+        self.world = World()
+
+    def get_level_viewport_camera_info(self) -> tuple:
+        return self.camera_location, self.camera_rotation
+
+    def get_editor_world(self) -> World:
+        return self.world
+
+
+_subsystems = {}
+
+
+def get_editor_subsystem(subsystem_class: type) -> object:
+    if subsystem_class not in _subsystems:
+        _subsystems[subsystem_class] = subsystem_class()
+    return _subsystems[subsystem_class]
+
+
+class EditorLevelLibrary:
+    @staticmethod
+    def editor_invalidate_viewports():
+        pass
+
+    @staticmethod
+    def editor_play_simulate():
+        pass
+
+
+class ScopedEditorTransaction:
+    def __init__(self, description: str):
+        self.description = description
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class SystemLibrary:
+    @staticmethod
+    def begin_transaction(context: str, description: str, primary_object: Object) -> int:
+        return 0
+
+    @staticmethod
+    def end_transaction() -> int:
+        return 0
+
+
+# CALL COUNTING AND LATENCY --------------------------------------------
+def _engine_call(name: str, function: callable) -> callable:
+    """ Wraps a fake engine function so that each call is counted, and delayed by the injected latency. """
+    def call(*args, **kwargs):
+        calls[name] += 1
+        if _latency:
+            end = time.perf_counter() + _latency
+            while time.perf_counter() < end:  # BUSY WAIT, time.sleep IS TOO COARSE FOR MICROSECONDS
+                pass
+        return function(*args, **kwargs)
+    call.__name__ = function.__name__
+    # ITS OWN CODE OBJECT, NAMED AFTER THE ENGINE FUNCTION: PROFILERS SEE "Actor.get_actor_label", NOT "call"
+    call.__code__ = call.__code__.replace(co_name=function.__name__, co_qualname=name)
+    return call
+
+
+def _instrument(*classes: type):
+    """ Counts the calls to every public method of the given classes. """
+    for cls in classes:
+        for attribute_name, attribute in list(vars(cls).items()):
+            if attribute_name.startswith("_"):
+                continue
+            name = f"{cls.__name__}.{attribute_name}"
+            if isinstance(attribute, staticmethod):
+                setattr(cls, attribute_name, staticmethod(_engine_call(name, attribute.__func__)))
+            elif callable(attribute) and not isinstance(attribute, type):
+                setattr(cls, attribute_name, _engine_call(name, attribute))
+
+
+_instrument(_Struct, ActorComponent, Actor, EditorActorSubsystem, UnrealEditorSubsystem, EditorLevelLibrary, SystemLibrary,
+            LevelStreaming, World, GameplayStatics)
+get_editor_subsystem = _engine_call("get_editor_subsystem", get_editor_subsystem)
+
+
+def set_latency(seconds: float):
+    """ Adds `seconds` to every call into the fake engine, e.g. 2e-6 for 2 microseconds. """
+    global _latency
+    _latency = seconds
+
+
+def reset_calls():
+    """ Zeroes the call counters. """
+    calls.clear()
+
+
+def total_calls() -> int:
+    """ Returns the number of calls into the fake engine since the last `reset_calls`. """
+    return sum(calls.values())
+
+
+# SYNTHETIC LEVELS --------------------------------------------
+LIGHT_CLASSES = (PointLight, SpotLight, RectLight, DirectionalLight, SkyLight)
+
+
+def reset():
+    """ Empties the level. """
+    _subsystems.clear()
+
+
+def populate(light_count: int, props_per_light: int = 1, spacing: float = 100.0):
+    """
+    Fills the level with `light_count` lights of every type, named LGT_00000, LGT_00001...,
+    and `props_per_light` non-light actors per light, which the tool has to skip.
+    The lights are laid out on a grid of 100 columns, `spacing` units apart.
+    """
+    actors = get_editor_subsystem(EditorActorSubsystem).actors
+    for i in range(light_count):
+        light_class = LIGHT_CLASSES[i % len(LIGHT_CLASSES)]
+        actors[light_class(label=f"LGT_{i:05d}", location=Vector(i % 100 * spacing, i // 100 * spacing, 200.0))] = None
+        actors.update((StaticMeshActor(), None) for _ in range(props_per_light))
+
+
+def populate_sublevel(name: str, light_count: int, loaded: bool = False, spacing: float = 100.0):
+    """
+    Adds a streaming sublevel of `light_count` lights, named {name}_00000..., laid out like `populate`.
+    An unloaded sublevel only adds its lights to the level once `GameplayStatics.flush_level_streaming` loads it.
+    """
+    lights = [LIGHT_CLASSES[i % len(LIGHT_CLASSES)](label=f"{name}_{i:05d}", level=name,
+                                                   location=Vector(i % 100 * spacing, i // 100 * spacing, 400.0))
+              for i in range(light_count)]
+    get_editor_subsystem(UnrealEditorSubsystem).world._streaming_levels.append(LevelStreaming(name, lights, loaded))
+    if loaded:
+        get_editor_subsystem(EditorActorSubsystem).actors.update((light, None) for light in lights)
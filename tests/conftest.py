@@ -0,0 +1,66 @@
+"""
+Runs the tests outside of Unreal Engine: `benchmarks/fake_unreal.py` stands in for the `unreal` module.
+Each test starts from an empty fake level.
+"""
+import os
+import sys
+
+import pytest
+
+TESTS_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_PATH))
+sys.path.insert(0, os.path.join(os.path.dirname(TESTS_PATH), "benchmarks"))
+
+import fake_unreal
+
+sys.modules["unreal"] = fake_unreal
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # THE WINDOW IS NEVER SHOWN
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """ The QApplication the tests of the table and the window need, skipped when PySide6 is missing. """
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture(autouse=True)
+def fake_level():
+    """ Empties the fake level and its call counters, returns the fake `unreal` module. """
+    fake_unreal.reset()
+    fake_unreal.reset_calls()
+    return fake_unreal
+
+
+@pytest.fixture
+def actor_subsystem(fake_level):
+    """ The EditorActorSubsystem of the fake level. """
+    return fake_level.get_editor_subsystem(fake_level.EditorActorSubsystem)
+
+
+@pytest.fixture
+def light_manager(qapp):
+    """
+    Builds the Light Manager window and its logic over a fake level of `light_count` lights, the table filled.
+    Returns:
+        callable: light_count -> (UnrealLightLogic, light table), the call counters are reset.
+    """
+    import LightManagerUI as lmui
+    import UnrealLightLogic as ull
+
+    windows = []
+
+    def build(light_count: int) -> tuple:
+        fake_unreal.populate(light_count)
+        ui = lmui.LightManagerUI()
+        ui.show_report = lambda title, text: None  # NO MODAL MESSAGE BOX
+        logic = ull.UnrealLightLogic(ui)
+        logic.refresh(ui.light_table)
+        logic.wait_population()
+        fake_unreal.reset_calls()
+        windows.append(ui)
+        return logic, ui.light_table
+
+    yield build
+    for ui in windows:
+        ui.deleteLater()
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+import fake_unreal
+import ulm_audit
+from LightAudit import audit_files, audit_records, missing_channel_0, non_lumen_units, zero_radius_point_light
+from LightCore import LightCore
+from LightPreset import write_preset
+
+RULES = ["missing_channel_0", "non_lumen_units", "zero_radius_point_lights"]
+
+
+def test_missing_channel_0():
+    assert missing_channel_0({"type": "PointLight", "channels": [False, True, False]})
+    assert not missing_channel_0({"type": "PointLight", "channels": [True, False, False]})
+    assert not missing_channel_0({"type": "SkyLight"})  # NO LIGHTING CHANNELS
+
+
+def test_non_lumen_units():
+    assert non_lumen_units({"type": "SpotLight", "intensity_units": "CANDELAS"})
+    assert not non_lumen_units({"type": "RectLight", "intensity_units": "Lumens"})
+    assert not non_lumen_units({"type": "DirectionalLight", "intensity_units": "UNITLESS"})  # NOT A LOCAL LIGHT
+    assert not non_lumen_units({"type": "PointLight"})
+
+
+def test_zero_radius_point_light():
+    assert zero_radius_point_light({"type": "PointLight", "attenuation_radius": 0.0})
+    assert not zero_radius_point_light({"type": "PointLight", "attenuation_radius": 1000.0})
+    assert not zero_radius_point_light({"type": "SpotLight", "attenuation_radius": 0.0})
+    assert not zero_radius_point_light({"type": "PointLight"})
+
+
+def test_audit_records_lists_the_flagged_labels():
+    records = [
+        {"label": "Key", "type": "PointLight", "channels": [False, False, False], "attenuation_radius": 0.0,
+         "intensity_units": "LUMENS"},
+        {"label": "Fill", "type": "SpotLight", "channels": [True, False, False], "intensity_units": "CANDELAS"},
+        {"label": "Sky", "type": "SkyLight"},
+    ]
+    light_count, findings = audit_records(records, RULES)
+    assert light_count == 3
+    assert findings == {"missing_channel_0": ["Key"], "non_lumen_units": ["Fill"], "zero_radius_point_lights": ["Key"]}
+
+
+@pytest.fixture
+def dumps(tmp_path):
+    """ Four level dumps written by LightCore.dump_level, each with its own flagged lights. """
+    file_paths = []
+    for level in range(4):
+        fake_unreal.reset()
+        fake_unreal.populate(10 + level, props_per_light=0)
+        core = LightCore()
+        snapshot = core.refresh()
+        core.write_values(snapshot, dict.fromkeys(range(level), False), "channel0")
+        file_path = str(tmp_path / f"level_{level}.jsonl")
+        assert core.dump_level(file_path) == 10 + level
+        file_paths.append(file_path)
+    return file_paths
+
+
+def test_level_dumps_are_audited(dumps):
+    report = audit_files(dumps, RULES, jobs=1)
+    assert report["summary"]["levels"] == 4
+    assert report["summary"]["lights"] == 10 + 11 + 12 + 13
+    assert report["summary"]["unreadable"] == 0
+    # THE FAKE LOCAL LIGHTS ARE UNITLESS, THE FIRST `level` LIGHTS ARE OFF CHANNEL 0 (SKY LIGHTS HAVE NO CHANNELS)
+    assert [len(level["findings"]["missing_channel_0"]) for level in report["levels"]] == [0, 1, 2, 3]
+    assert report["summary"]["findings"]["non_lumen_units"] > 0
+
+
+def test_process_pool_agrees_with_the_serial_run(dumps, tmp_path):
+    unreadable = tmp_path / "broken.jsonl"
+    unreadable.write_text("not a dump\n", encoding="utf-8")
+    file_paths = dumps + [str(unreadable)]
+    serial = audit_files(file_paths, RULES, jobs=1)
+    pooled = audit_files(file_paths, RULES, jobs=2)
+    assert pooled["levels"] == serial["levels"]
+    pooled["summary"].pop("elapsed")
+    serial["summary"].pop("elapsed")
+    assert pooled["summary"] == serial["summary"]
+
+
+def test_exit_code(tmp_path, capsys):
+    clean = tmp_path / "clean.jsonl"
+    write_preset(str(clean), [{"label": "Key", "type": "PointLight", "channels": [True, False, False],
+                               "intensity_units": "LUMENS", "attenuation_radius": 1000.0}])
+    flagged = tmp_path / "flagged.jsonl"
+    write_preset(str(flagged), [{"label": "Key", "type": "PointLight", "attenuation_radius": 0.0}])
+    unreadable = tmp_path / "unreadable.jsonl"
+    unreadable.write_text("{}\n", encoding="utf-8")
+
+    assert ulm_audit.main([str(clean), "--jobs", "1"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["summary"]["lights"] == 1
+    assert ulm_audit.main([str(flagged), "--jobs", "1"]) == 1
+    assert ulm_audit.main([str(unreadable), "--jobs", "1"]) == 1
+    output = tmp_path / "report.json"
+    assert ulm_audit.main([str(tmp_path), "--jobs", "1", "--output", str(output)]) == 1  # THE FOLDER, ALL 3 DUMPS
+    assert json.loads(output.read_text(encoding="utf-8"))["summary"]["levels"] == 3
@@ -0,0 +1,131 @@
+import pytest
+
+import fake_unreal
+from LightCore import LightCore, LightError
+from LightPreset import PresetError
+
+ORIGIN = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))  # (LOCATION, ROTATION) PLACEMENT
+
+
+@pytest.fixture
+def core():
+    """ A core over a level of 10 lights of every type and 10 meshes, indexed. """
+    fake_unreal.populate(10)
+    light_core = LightCore()
+    light_core.refresh()
+    return light_core
+
+
+def test_lists_only_the_lights(core, actor_subsystem):
+    assert len(actor_subsystem.get_all_level_actors()) == 20
+    light_actors = core.light_actors()
+    assert len(light_actors) == 10
+    assert {type(actor).__name__ for actor in light_actors} == set(core.light_types)
+
+
+def test_reads_every_light(core):
+    snapshot = core.read_lights()
+    assert len(snapshot) == 10
+    point_light = snapshot.labels.index("LGT_00000")
+    assert snapshot.get(point_light, "type") == "PointLight"
+    assert snapshot.get(point_light, "intensity") == 1.0
+    assert snapshot.get(point_light, "attenuation_radius") == 1000.0
+    assert snapshot.get(point_light, "channel0") is True
+    assert snapshot.get(point_light, "location") == (0.0, 0.0, 200.0)
+    assert snapshot.get(point_light, "level") == "Level"
+    assert snapshot.get(snapshot.labels.index("LGT_00004"), "attenuation_radius") is None  # SKY LIGHT
+
+
+def test_creates_lights_with_unique_labels(core):
+    created = core.spawn_lights("Key", "SpotLight", [ORIGIN] * 3)
+    assert [actor.get_actor_label() for actor in created] == ["LGT_Key_000", "LGT_Key_001", "LGT_Key_002"]
+    component = created[0].get_component_by_class(fake_unreal.SpotLightComponent)
+    assert component.get_editor_property("intensity") == 10.0
+    assert component.get_editor_property("intensity_units") == fake_unreal.LightUnits.LUMENS
+    assert len(core.light_actors()) == 13
+    assert core.light_index.get("LGT_Key_001") is created[1]
+
+
+def test_create_rejects_bad_requests(core):
+    with pytest.raises(LightError):
+        core.spawn_lights("Key", "NoSuchLight", [ORIGIN])
+    with pytest.raises(LightError):
+        core.spawn_lights("Key", "PointLight", [])
+
+
+def test_renames_lights(core):
+    assert core.rename_light("LGT_00000", "Key") == "Key_000"
+    assert core.rename_light("LGT_00001", "Key") == "Key_001"
+    assert core.rename_light("Missing", "Key") is None
+    assert core.light_index.get("Key_000").get_actor_label() == "Key_000"
+    assert core.rename_lights({2: "Fill", 3: "Rim"}) == {2: "Fill", 3: "Rim"}
+    labels = {actor.get_actor_label() for actor in core.light_actors()}
+    assert {"Key_000", "Key_001", "Fill", "Rim"} <= labels
+
+
+def test_deletes_lights(core):
+    assert core.delete_lights(["LGT_00000", "Missing", "LGT_00001"]) == ["LGT_00000", "LGT_00001"]
+    labels = {actor.get_actor_label() for actor in core.light_actors()}
+    assert len(labels) == 8
+    assert "LGT_00000" not in labels
+
+
+def test_write_values_skips_the_lights_without_the_attribute(core):
+    snapshot = core.refresh()
+    rows = {snapshot.labels.index(label): value for label, value in (("LGT_00000", 5.0), ("LGT_00004", 6.0))}
+    new_values, rejected = core.write_values(snapshot, rows, "attenuation_radius")
+    point_light, sky_light = rows
+    assert new_values == {point_light: 5.0}  # A SKY LIGHT HAS NO RADIUS
+    assert rejected == []
+    assert core.read_lights().get(point_light, "attenuation_radius") == 5.0
+    assert snapshot.get(point_light, "attenuation_radius") == 1000.0  # THE SNAPSHOT IS LEFT UNTOUCHED
+
+
+def test_write_values_writes_colors_and_channels(core):
+    snapshot = core.refresh()
+    core.write_values(snapshot, {0: (0.5, 0.25, 1.0)}, "color")
+    core.write_values(snapshot, {0: True}, "channel2")
+    updated = core.read_lights()
+    assert updated.get(0, "color") == (0.5, 0.25, 1.0)
+    assert updated.get(0, "channel2") is True
+
+
+def test_preset_round_trip(core, tmp_path):
+    snapshot = core.refresh()
+    key = snapshot.labels.index("LGT_00000")
+    core.write_values(snapshot, {key: 42.0}, "intensity")
+    preset_path = str(tmp_path / "rig.jsonl")
+    count, skipped = core.save_lights(preset_path, snapshot, [key, snapshot.labels.index("LGT_00001")])
+    assert (count, skipped) == (2, [])
+
+    core.write_values(snapshot, {key: 1.0}, "intensity")
+    touched, spawned, skipped, error = core.load_lights(preset_path)
+    assert (len(touched), spawned, skipped, error) == (2, 0, 0, None)  # BOTH LIGHTS UPDATED IN PLACE
+    assert core.read_lights().get(key, "intensity") == 42.0
+
+    core.delete_lights(["LGT_00000"])
+    core.refresh()
+    touched, spawned, skipped, error = core.load_lights(preset_path)
+    assert (spawned, error) == (1, None)
+    assert touched[0].get_actor_label() == "LGT_00000"
+    assert len(core.light_actors()) == 10
+
+
+def test_loaded_light_does_not_take_the_label_of_another_actor(core, actor_subsystem, tmp_path):
+    snapshot = core.read_lights()
+    preset_path = str(tmp_path / "rig.jsonl")
+    core.save_lights(preset_path, snapshot, [snapshot.labels.index("LGT_00000")])
+    core.delete_lights(["LGT_00000"])
+    core.refresh()
+    actor_subsystem.actors[fake_unreal.StaticMeshActor(label="LGT_00000")] = None
+    touched, spawned, skipped, error = core.load_lights(preset_path)
+    assert (spawned, error) == (1, None)
+    assert touched[0].get_actor_label() == "LGT_00000_000"
+
+
+def test_load_rejects_a_file_that_is_not_a_preset(core, tmp_path):
+    not_a_preset = tmp_path / "notes.jsonl"
+    not_a_preset.write_text("hello\n", encoding="utf-8")
+    touched, spawned, skipped, error = core.load_lights(str(not_a_preset))
+    assert touched == [] and spawned == 0
+    assert isinstance(error, PresetError)
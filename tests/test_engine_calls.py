@@ -0,0 +1,85 @@
+"""
+Regression tests of the engine calls and model notifications of the table operations, at a fixed level size.
+A per-row call that creeps back into an operation shows up as a count growing with the level.
+"""
+import pytest
+
+pytest.importorskip("PySide6")
+
+import fake_unreal
+from LightTableModel import MAX_REMOVE_NOTIFICATIONS, LightTableModel
+
+LIGHT_COUNT = 1000
+
+
+@pytest.fixture
+def tool(light_manager):
+    """ The Light Manager logic and table, filled with LIGHT_COUNT lights. """
+    return light_manager(LIGHT_COUNT)
+
+
+def write_calls() -> int:
+    """ Returns the calls that changed something in the fake level since the last reset. """
+    return sum(count for name, count in fake_unreal.calls.items() if ".set_" in name or "spawn" in name
+               or "destroy" in name)
+
+
+def test_refresh_without_change_writes_nothing(tool):
+    logic, table = tool
+    logic.refresh(table)
+    logic.wait_population()
+    assert write_calls() == 0
+    assert fake_unreal.total_calls() < 15 * LIGHT_COUNT  # ONE READ PASS, ABOUT 13 CALLS PER LIGHT
+
+
+def test_solo_writes_each_light_once(tool):
+    logic, table = tool
+    middle = LIGHT_COUNT // 2
+    logic.edit_light(middle, "solo", True, table)
+    # EVERY OTHER LIGHT IS HIDDEN: ONE COMPONENT AND ONE ACTOR CALL EACH
+    assert 2 * (LIGHT_COUNT - 1) <= fake_unreal.total_calls() <= 2 * LIGHT_COUNT + 10
+    fake_unreal.reset_calls()
+    logic.edit_light(middle, "solo", False, table)
+    assert fake_unreal.total_calls() <= 2 * LIGHT_COUNT + 10
+
+
+def test_mute_writes_one_light(tool):
+    logic, table = tool
+    logic.edit_light(LIGHT_COUNT // 2, "visible", False, table)
+    assert fake_unreal.total_calls() <= 5
+
+
+def test_selected_rows_are_read_from_the_ranges(tool, monkeypatch):
+    logic, table = tool
+    flags_calls = []
+    flags = LightTableModel.flags
+    monkeypatch.setattr(LightTableModel, "flags", lambda self, index: flags_calls.append(1) or flags(self, index))
+    rows = list(range(0, LIGHT_COUNT, 3))
+    logic.select_rows(table, rows)
+    flags_calls.clear()
+    assert logic.selected_rows(table) == rows
+    assert flags_calls == []  # selectedRows WOULD CHECK EVERY CELL OF EVERY SELECTED ROW
+
+
+def removal_notifications(model: LightTableModel) -> dict:
+    """ Counts the row removals and resets the model notifies. """
+    notifications = {"removed": 0, "reset": 0}
+    model.rowsRemoved.connect(lambda *args: notifications.__setitem__("removed", notifications["removed"] + 1))
+    model.modelReset.connect(lambda: notifications.__setitem__("reset", notifications["reset"] + 1))
+    return notifications
+
+
+@pytest.mark.parametrize("block_count", [MAX_REMOVE_NOTIFICATIONS, 3 * MAX_REMOVE_NOTIFICATIONS])
+def test_remove_scattered_rows(tool, block_count):
+    _logic, table = tool
+    model = table.model()
+    removed = list(range(0, 2 * block_count, 2))  # EVERY OTHER ROW: ONE BLOCK EACH
+    kept_paths = [path for row, path in enumerate(model.rows.paths) if row not in set(removed)]
+    notifications = removal_notifications(model)
+    assert model.remove_rows(removed) == block_count
+    assert model.rows.paths == kept_paths
+    assert model.rowCount() == LIGHT_COUNT - block_count
+    if block_count > MAX_REMOVE_NOTIFICATIONS:
+        assert notifications == {"removed": 0, "reset": 1}  # ONE PASS, NOT ONE SHIFT OF THE ROWS PER BLOCK
+    else:
+        assert notifications == {"removed": block_count, "reset": 0}
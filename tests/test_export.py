@@ -0,0 +1,59 @@
+import csv
+import json
+
+import pytest
+
+import fake_unreal
+from LightCore import LightCore
+from LightExport import EXPORT_FIELDS
+
+
+@pytest.fixture
+def core():
+    """ A core over a level of 10 lights of every type and 10 meshes, indexed. """
+    fake_unreal.populate(10)
+    light_core = LightCore()
+    light_core.refresh()
+    return light_core
+
+
+def read_jsonl(file_path) -> dict:
+    with open(file_path, encoding="utf-8") as export_file:
+        return {record["label"]: record for record in map(json.loads, export_file)}
+
+
+def test_exports_every_light_as_csv(core, tmp_path):
+    file_path = tmp_path / "lights.csv"
+    exported, skipped = core.export_lights(str(file_path), "csv", core.read_lights())
+    assert (exported, skipped) == (10, [])
+    with open(file_path, encoding="utf-8", newline="") as export_file:
+        lines = list(csv.reader(export_file))
+    assert tuple(lines[0]) == EXPORT_FIELDS
+    assert len(lines) == 11
+
+
+def test_fetched_lazy_values_keep_minus_one(core, tmp_path):
+    snapshot = core.read_lights()
+    core.fetch_column(snapshot, "specular_scale")
+    core.fetch_column(snapshot, "cast_shadows")
+    point_light, sky_light = snapshot.labels.index("LGT_00000"), snapshot.labels.index("LGT_00004")
+    snapshot.set(point_light, "specular_scale", -1.0)
+    snapshot.set(point_light, "cast_shadows", None)
+    file_path = tmp_path / "lights.jsonl"
+    core.export_lights(str(file_path), "jsonl", snapshot, [point_light, sky_light])
+    records = read_jsonl(file_path)
+    assert records["LGT_00000"]["specular_scale"] == -1.0
+    assert records["LGT_00000"]["cast_shadows"] is None
+    assert records["LGT_00004"]["source_radius"] is None  # SKY LIGHT, READ AT EXPORT
+
+
+def test_skips_deleted_lights(core, tmp_path):
+    snapshot = core.read_lights()
+    snapshot.columns["actor"][0] = None  # LIGHT DELETED OUTSIDE OF THE TOOL
+    exported, skipped = core.export_lights(str(tmp_path / "lights.jsonl"), "jsonl", snapshot)
+    assert (exported, skipped) == (9, [snapshot.labels[0]])
+
+
+def test_rejects_an_unknown_format(core, tmp_path):
+    with pytest.raises(ValueError):
+        core.export_lights(str(tmp_path / "lights.xml"), "xml", core.read_lights())
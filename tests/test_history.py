@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+
+def labels(light_table) -> list:
+    return list(light_table.model().rows.labels)
+
+
+def test_undo_redo_an_edit(light_manager):
+    logic, table = light_manager(20)
+    model = table.model()
+    row = model.rows.labels.index("LGT_00000")
+    logic.edit_light(row, "intensity", 5.0, table)
+    assert model.rows.get(row, "intensity") == 5.0
+    logic.undo(table)
+    assert model.rows.get(row, "intensity") == 1.0
+    logic.redo(table)
+    assert model.rows.get(row, "intensity") == 5.0
+
+
+def test_undo_rename_does_not_duplicate_a_label_taken_since(light_manager):
+    logic, table = light_manager(20)
+    model = table.model()
+    logic.select_rows(table, [model.rows.labels.index("LGT_00000")])
+    logic.bulk_rename("Prefix / Suffix", {"prefix": "Key_"}, table)
+    assert "Key_LGT_00000" in labels(table)
+    # ANOTHER LIGHT TAKES THE OLD LABEL, OUTSIDE OF THE HISTORY OF THE FIRST RENAME
+    other = model.rows.labels.index("LGT_00001")
+    logic.core.rename_lights({other: "LGT_00000"})
+    logic.refresh(table)
+    logic.wait_population()
+
+    logic.undo(table)
+    current = labels(table)
+    assert len(current) == len(set(current))
+    assert "LGT_00000" in current and "LGT_00000_001" in current
+    assert "got a suffix: LGT_00000" in logic.ui.info_text.text()
+    actors = {actor.get_actor_label() for actor in logic.core.light_actors()}
+    assert len(actors) == 20
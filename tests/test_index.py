@@ -0,0 +1,118 @@
+import pytest
+
+import fake_unreal
+from LightCore import LightCore
+from LightIndex import LightIndex
+
+
+@pytest.fixture
+def lights(actor_subsystem):
+    """ Three point lights, LGT_00000 to LGT_00002. """
+    fake_unreal.populate(3, props_per_light=0)
+    return actor_subsystem.get_all_level_actors()
+
+
+def test_lookups(lights):
+    index = LightIndex()
+    for row, actor in enumerate(lights):
+        index.add(actor, row=row)
+    assert len(index) == 3
+    assert "LGT_00001" in index
+    assert index.get("LGT_00001") is lights[1]
+    assert index.get("Missing") is None
+    assert index.row_of(lights[2]) == 2
+    assert index.row_of_path(lights[0].get_path_name()) == 0
+    assert index.actor_at(1) is lights[1]
+    assert index.labels() == {"LGT_00000", "LGT_00001", "LGT_00002"}
+
+
+def test_rename_moves_the_label(lights):
+    index = LightIndex()
+    index.add(lights[0], row=0)
+    lights[0].set_actor_label("Key")
+    index.rename(lights[0], "Key")
+    assert "LGT_00000" not in index
+    assert index.get("Key") is lights[0]
+    assert index.actor_at(0) is lights[0]
+
+
+def test_label_changed_outside_of_the_tool_is_rekeyed(lights):
+    index = LightIndex()
+    index.add(lights[0], row=0)
+    lights[0].set_actor_label("Renamed")
+    assert index.get("LGT_00000") is None  # STALE: MOVED TO THE CURRENT LABEL
+    assert "LGT_00000" not in index
+    assert index.get("Renamed") is lights[0]
+    assert index.row_of(lights[0]) == 0
+
+
+def test_destroyed_actor_is_dropped(lights, monkeypatch):
+    index = LightIndex()
+    index.add(lights[0], row=0)
+
+    def destroyed():
+        raise Exception("Accessed None trying to read an actor")
+
+    monkeypatch.setattr(lights[0], "get_actor_label", destroyed)
+    assert index.get("LGT_00000") is None
+    assert len(index) == 0
+    assert index.actor_at(0) is None
+
+
+def test_index_rows_maps_each_row(lights):
+    core = LightCore()
+    snapshot = core.read_lights()
+    core.index_rows(snapshot)
+    for row in range(len(snapshot)):
+        assert core.light_index.actor_at(row) is snapshot.get(row, "actor")
+        assert core.light_index.row_of(snapshot.get(row, "actor")) == row
+    snapshot.reorder([2, 0, 1])
+    core.index_rows(snapshot)
+    assert core.light_index.actor_at(0) is lights[2]
+    assert core.light_index.row_of(lights[0]) == 1
+
+
+def test_remove_drops_the_row_mapping(lights):
+    index = LightIndex()
+    for row, actor in enumerate(lights):
+        index.add(actor, row=row)
+    index.remove("LGT_00001")
+    assert "LGT_00001" not in index
+    assert index.actor_at(1) is None
+    assert index.row_of(lights[1]) is None
+    assert index.actor_at(2) is lights[2]
+    index.remove("Missing")  # NO ERROR
+    assert len(index) == 2
+
+
+def test_unique_label_skips_the_used_suffixes(lights):
+    index = LightIndex()
+    for actor, label in zip(lights, ("Key_000", "Key_001", "Key_003")):
+        actor.set_actor_label(label)
+        index.add(actor)
+    assert index.unique_label("Key") == "Key_002"
+    assert index.unique_label("Key") == "Key_004"
+    assert index.unique_label("Fill") == "Fill_000"
+
+
+def test_unique_label_does_not_reuse_freed_suffixes(lights):
+    index = LightIndex()
+    first = index.unique_label("Key")
+    lights[0].set_actor_label(first)
+    index.add(lights[0])
+    index.remove(first)
+    assert index.unique_label("Key") == "Key_001"
+
+
+def test_unique_label_checks_the_taken_labels():
+    index = LightIndex()
+    assert index.unique_label("Key", {"Key_000", "Key_001"}) == "Key_002"
+
+
+def test_new_light_does_not_take_the_label_of_another_actor(actor_subsystem):
+    actor_subsystem.actors[fake_unreal.StaticMeshActor(label="LGT_Point_000")] = None
+    core = LightCore()
+    core.index_rows(core.read_lights())
+    light, = core.spawn_lights("Point", "PointLight", [((0, 0, 0), (0, 0, 0))])
+    assert light.get_actor_label() == "LGT_Point_001"
+    assert core.rename_light("LGT_Point_001", "LGT_Point") == "LGT_Point_002"
@@ -0,0 +1,41 @@
+import pytest
+
+import fake_unreal
+from LightCore import LightCore
+from LightQuery import LightQuery, NameIndex, QueryError
+
+
+@pytest.fixture
+def snapshot():
+    """ 10 lights of every type, LGT_00000 to LGT_00009. """
+    fake_unreal.populate(10, props_per_light=0)
+    return LightCore().read_lights()
+
+
+def search(snapshot, text: str) -> list:
+    rows = LightQuery(text).filter(snapshot, NameIndex(snapshot.labels))
+    return sorted(snapshot.labels[row] for row in rows)
+
+
+def test_terms_must_all_match(snapshot):
+    assert search(snapshot, "type:spot") == ["LGT_00001", "LGT_00006"]
+    assert search(snapshot, "type:spot 06") == ["LGT_00006"]
+    assert search(snapshot, "lgt_0000?") == snapshot.labels[:10]
+    assert search(snapshot, "radius>0 !channel0") == []
+
+
+def test_invalid_regex_raises(snapshot):
+    with pytest.raises(QueryError):
+        LightQuery("re:[")
+
+
+def test_unfetched_lazy_flag_is_not_applicable(snapshot):
+    assert search(snapshot, "shadows") == search(snapshot, "!shadows") == []
+    snapshot.set(0, "cast_shadows", True)
+    snapshot.set(1, "cast_shadows", False)
+    assert search(snapshot, "shadows") == ["LGT_00000"]
+    assert search(snapshot, "!shadows") == ["LGT_00001"]
+
+    fresh = LightCore().read_lights()
+    snapshot.copy_row(0, fresh, 0)  # THE CACHED VALUE IS DROPPED, THE STORED ONE IS STALE
+    assert search(snapshot, "shadows") == []
@@ -0,0 +1,16 @@
+import fake_unreal
+from LightRename import resolve_labels
+
+def test_resolve_labels_suffixes_the_taken_labels():
+    assert resolve_labels(["A", "B"], ["Key", "Key"], {"A", "B", "Key"}) == ["Key_001", "Key_002"]
+    assert resolve_labels(["A", "B"], ["B", "A"], {"A", "B"}) == ["B", "A"]  # SWAP
+
+
+def test_bulk_rename_does_not_take_the_label_of_another_actor(light_manager, actor_subsystem):
+    logic, table = light_manager(10)
+    actor_subsystem.actors[fake_unreal.StaticMeshActor(label="Key_LGT_00000")] = None
+    model = table.model()
+    logic.select_rows(table, [model.rows.labels.index("LGT_00000")])
+    logic.bulk_rename("Prefix / Suffix", {"prefix": "Key_"}, table)
+    assert "Key_LGT_00000_001" in model.rows.labels
+    assert "Key_LGT_00000" not in model.rows.labels
@@ -0,0 +1,58 @@
+import math
+
+import fake_unreal
+from LightCore import LightCore
+from LightSnapshot import LAZY_BITS
+
+
+def read_snapshot(light_count: int = 5):
+    fake_unreal.populate(light_count, props_per_light=0)
+    return LightCore().read_lights()
+
+
+def test_get_and_set_round_trip():
+    snapshot = read_snapshot()
+    snapshot.set(0, "intensity", 5)
+    snapshot.set(0, "channel1", True)
+    snapshot.set(0, "color", (0.5, 0.25, 1.0))
+    assert snapshot.get(0, "intensity") == 5.0
+    assert snapshot.get(0, "channel1") is True
+    assert snapshot.get(0, "color") == (0.5, 0.25, 1.0)
+    snapshot.set(0, "temperature", None)
+    assert snapshot.get(0, "temperature") is None
+    assert math.isnan(snapshot.columns["temperature"][0])
+
+
+def test_missing_attributes_are_none():
+    snapshot = read_snapshot()
+    sky_light = snapshot.labels.index("LGT_00004")
+    assert snapshot.get(sky_light, "type") == "SkyLight"
+    assert snapshot.get(sky_light, "attenuation_radius") is None
+    assert snapshot.get(sky_light, "channel0") is None
+
+
+def test_lazy_column_is_none_until_fetched():
+    snapshot = read_snapshot()
+    assert snapshot.get(0, "source_radius") is None
+    snapshot.set(0, "source_radius", 12.0)
+    assert snapshot.get(0, "fetched") & LAZY_BITS["source_radius"]
+    assert snapshot.get(0, "source_radius") == 12.0
+
+
+def test_fetch_column_flags_every_row():
+    fake_unreal.populate(5, props_per_light=0)
+    core = LightCore()
+    snapshot = core.read_lights()
+    core.fetch_column(snapshot, "source_radius")
+    assert all(flags & LAZY_BITS["source_radius"] for flags in snapshot.columns["fetched"])
+    assert snapshot.get(snapshot.labels.index("LGT_00004"), "source_radius") is None  # SKY LIGHT, N/A
+
+
+def test_copy_row_drops_or_keeps_the_unfetched_lazy_values():
+    fake_unreal.populate(5, props_per_light=0)
+    snapshot, fresh = LightCore().read_lights(), LightCore().read_lights()
+    snapshot.set(0, "source_radius", 12.0)
+    snapshot.copy_row(0, fresh, 0, keep_fetched=True)
+    assert snapshot.get(0, "source_radius") == 12.0
+    snapshot.copy_row(0, fresh, 0)
+    assert snapshot.get(0, "source_radius") is None
@@ -0,0 +1,72 @@
+######################################################
+# - UNREAL LIGHT MANAGER - LIGHTING AUDIT -
+# AUDITS LEVEL DUMPS OUTSIDE OF UNREAL ENGINE, IN PARALLEL
+#
+# . A LEVEL DUMP IS A LIGHT RIG PRESET OF EVERY LIGHT OF A LEVEL, WRITTEN IN THE EDITOR BY
+#   "Save Rig..." WITH NO LIGHT SELECTED, OR BY LightCore().dump_level(file_path)
+# . WRITES A JSON REPORT, EXITS WITH 1 WHEN A LIGHT IS FLAGGED OR A DUMP CANNOT BE READ
+#
+#   python ulm_audit.py dumps/ --rules missing_channel_0 non_lumen_units --jobs 8 --output report.json
+######################################################
+
+import argparse
+import json
+import os
+import sys
+
+# CURRENT SCRIPT PATH
+script_path = os.path.dirname(os.path.abspath(__file__))
+
+if script_path not in sys.path:
+    sys.path.append(script_path)
+
+from LightAudit import AUDIT_RULES, audit_files
+
+DUMP_EXTENSION = ".jsonl"
+
+
+def dump_files(paths: list) -> list:
+    """ Expands the given files and folders into the list of level dumps, folders are searched recursively. """
+    file_paths = []
+    for path in paths:
+        if not os.path.isdir(path):
+            file_paths.append(path)
+            continue
+        for folder, _, file_names in os.walk(path):
+            file_paths.extend(os.path.join(folder, name) for name in sorted(file_names) if name.endswith(DUMP_EXTENSION))
+    return file_paths
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Audits the lights of level dumps and writes a JSON report.")
+    parser.add_argument("paths", nargs="*", help=f"Level dumps, or folders of {DUMP_EXTENSION} dumps.")
+    parser.add_argument("--rules", nargs="+", choices=sorted(AUDIT_RULES), default=list(AUDIT_RULES),
+                        help="Rules to run, all by default.")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes, one per CPU by default.")
+    parser.add_argument("--output", default="-", help="Report file, the standard output by default.")
+    parser.add_argument("--list-rules", action="store_true", help="Lists the rules and exits.")
+    args = parser.parse_args(argv)
+
+    if args.list_rules:
+        for name, (description, _) in AUDIT_RULES.items():
+            print(f"{name:<26} {description}")
+        return 0
+    file_paths = dump_files(args.paths)
+    if not file_paths:
+        parser.error("no level dump to audit.")
+
+    report = audit_files(file_paths, args.rules, args.jobs)
+    summary = report["summary"]
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+        print(f"{summary['levels']} level(s), {summary['lights']} light(s) audited in {summary['elapsed']}s: "
+              + ", ".join(f"{name} {count}" for name, count in summary["findings"].items()))
+    return 1 if summary["unreadable"] or any(summary["findings"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
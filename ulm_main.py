@@ -12,6 +12,7 @@
 # . ALLOW TO CREATE AND RENAME LIGHTS FROM THE UI
 # . ALLOW TO DELETE LIGHTS FROM THE UI
 # . ALLOW TO MODIFY THE MOST COMMON ATTRIBUTES FROM THE UI
+# . REPORTS WHERE THE ATTENUATION RADII OF THE LIGHTS STACK UP
 ######################################################
 
 import os
@@ -39,6 +40,8 @@ def main_window() -> lmui.LightManagerUI:
 
     global ui, logic, script_path
 
+    if logic is not None:  # RELAUNCHED: THE PREVIOUS WINDOW STOPS FOLLOWING THE LEVEL
+        logic.stop_sync()
     ui = lmui.LightManagerUI()
     logic = ull.UnrealLightLogic(ui)
 
@@ -55,7 +58,37 @@ def main_window() -> lmui.LightManagerUI:
     ui.button_render.clicked.connect(logic.render)
     ui.signal_light_deleted.connect(logic.delete)
     ui.signal_refresh.connect(logic.refresh)
-    logic.refresh(ui.light_table)  # INITIAL REFRESH TO LOAD LIGHTS
+    ui.signal_light_edited.connect(logic.edit_light)
+    ui.signal_light_scrubbed.connect(logic.scrub_light)
+    ui.signal_scrub_finished.connect(logic.end_scrub)
+    ui.signal_group_created.connect(logic.create_group)
+    ui.signal_group_edited.connect(logic.edit_group)
+    ui.signal_group_deleted.connect(logic.delete_group)
+    ui.signal_group_changed.connect(logic.group_changed)
+    ui.signal_group_selected.connect(logic.select_group)
+    ui.signal_group_muted.connect(logic.mute_group)
+    ui.signal_group_soloed.connect(logic.solo_group)
+    ui.signal_multi_solo.connect(logic.set_multi_solo)
+    ui.signal_lights_batch_created.connect(logic.batch_create)
+    ui.signal_lights_bulk_renamed.connect(logic.bulk_rename)
+    ui.signal_preset_saved.connect(logic.save_preset)
+    ui.signal_preset_loaded.connect(logic.load_preset)
+    ui.signal_lights_exported.connect(logic.export_lights)
+    ui.signal_overlap_analysis.connect(logic.analyse_overlaps)
+    ui.signal_rows_sorted.connect(logic.rows_sorted)
+    ui.signal_spatial_filter.connect(logic.set_spatial_filter)
+    ui.signal_level_filter.connect(logic.set_level_filter)
+    ui.signal_column_toggled.connect(logic.set_column_shown)
+    ui.signal_undo.connect(logic.undo)
+    ui.signal_redo.connect(logic.redo)
+    ui.signal_profiling_toggled.connect(logic.set_profiling)
+    ui.signal_profile_reset.connect(logic.reset_profile)
+    ui.signal_profile_saved.connect(logic.save_profile)
+    ui.signal_closed.connect(logic.stop_sync)
+    # INITIAL REFRESH ONCE THE WINDOW IS ON SCREEN: IT APPEARS AT ONCE, THEN THE LIGHTS FILL THE TABLE
+    ui.light_table.signal_first_painted.connect(ui.emit_refresh)
+    # THEN THE TABLE FOLLOWS THE CHANGES MADE IN THE EDITOR
+    logic.start_sync(ui.light_table)
 
     return ui
 